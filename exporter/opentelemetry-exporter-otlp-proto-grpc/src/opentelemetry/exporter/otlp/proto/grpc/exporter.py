@@ -14,14 +14,17 @@
 
 """OTLP Exporter"""
 
+import heapq
+import itertools
 import logging
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Mapping, Sequence
 from os import environ
-from time import sleep
-from typing import Any, Callable, Dict, Generic, List, Optional
+from time import monotonic
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional
 from typing import Sequence as TypingSequence
-from typing import Text, TypeVar
+from typing import Text, Tuple, TypeVar
 from urllib import parse
 from urllib.parse import urlparse
 
@@ -51,6 +54,7 @@ from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_OTLP_TIMEOUT,
 )
 from opentelemetry.sdk.resources import Resource as SDKResource
+from opentelemetry.sdk.util import _register_at_fork_reinit
 
 logger = logging.getLogger(__name__)
 SDKDataT = TypeVar("SDKDataT")
@@ -59,6 +63,21 @@ TypingResourceT = TypeVar("TypingResourceT")
 ExportServiceRequestT = TypeVar("ExportServiceRequestT")
 ExportResultT = TypeVar("ExportResultT")
 
+_MAX_RETRY_DELAY = 64
+# shutdown is called at exit, do not hold it up for long
+_SHUTDOWN_TIMEOUT_MILLIS = 1000
+_RETRYABLE_STATUS_CODES = frozenset(
+    [
+        StatusCode.CANCELLED,
+        StatusCode.DEADLINE_EXCEEDED,
+        StatusCode.RESOURCE_EXHAUSTED,
+        StatusCode.ABORTED,
+        StatusCode.OUT_OF_RANGE,
+        StatusCode.UNAVAILABLE,
+        StatusCode.DATA_LOSS,
+    ]
+)
+
 _ENVIRON_TO_COMPRESSION = {
     None: None,
     "gzip": Compression.Gzip,
@@ -186,6 +205,231 @@ def _get_credentials(creds, environ_key):
     return ssl_channel_credentials()
 
 
+class _SerializedRequestChannel:
+    """Wraps a gRPC channel so that the stubs created from it send requests
+    that are already serialized.
+
+    The request is serialized once per export and the same bytes are sent
+    by every retry attempt.
+    """
+
+    def __init__(self, channel):
+        self._channel = channel
+
+    # pylint: disable=unused-argument
+    def unary_unary(
+        self, method, request_serializer=None, response_deserializer=None
+    ):
+        return self._channel.unary_unary(
+            method, response_deserializer=response_deserializer
+        )
+
+
+def _next_delay(delays: Iterator[Optional[float]]) -> float:
+    for delay in delays:
+        # newer versions of backoff yield None first
+        if delay is not None:
+            return delay
+    return _MAX_RETRY_DELAY
+
+
+class _RetryScheduler:
+    """Retries failed export requests on a background thread.
+
+    Requests that failed with a retryable status are parked in a buffer of
+    at most ``max_requests`` entries and sent again once their backoff delay
+    passed, or the delay the collector asked for in ``RetryInfo``. Delays
+    grow exponentially and a request is dropped once the delay reaches
+    `_MAX_RETRY_DELAY` seconds. The thread calling export is free to export
+    the following batches meanwhile.
+
+    Parked requests that are dropped later, because their retries were
+    exhausted, the collector rejected them or they were not sent before
+    shutdown, are counted in ``dropped``.
+
+    Args:
+        send: sends a serialized request with the given timeout in seconds
+            and returns the result, None to retry, and the delay requested
+            by the collector
+        max_requests: maximum number of parked requests
+        timeout: timeout in seconds of every retry attempt
+        failure: the result returned by ``send`` when the request was
+            rejected
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bytes, float], Tuple[Any, Optional[float]]],
+        max_requests: int,
+        timeout: float,
+        failure: Any,
+    ):
+        self._send = send
+        self._max_requests = max_requests
+        self._timeout = timeout
+        self._failure = failure
+        self.dropped = 0
+        self._condition = threading.Condition(threading.Lock())
+        # entries are (deadline, sequence number, request, delays)
+        self._pending = []  # type: List[Tuple[float, int, bytes, Iterator]]
+        self._sequence = itertools.count()
+        self._thread = None  # type: Optional[threading.Thread]
+        self._shutdown_deadline = None  # type: Optional[float]
+        # whether the worker is sending a request it took from _pending
+        self._sending = False
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def schedule(
+        self,
+        request: bytes,
+        retry_delay: Optional[float],
+        delays: Optional[Iterator[Optional[float]]] = None,
+    ) -> bool:
+        """Parks a request that failed to be sent.
+
+        Returns:
+            False if the request was dropped, True otherwise.
+        """
+        if delays is None:
+            delays = iter(expo(max_value=_MAX_RETRY_DELAY))
+        delay = _next_delay(delays)
+        if delay >= _MAX_RETRY_DELAY:
+            logger.warning("Dropping export request, retries exhausted.")
+            return False
+        if retry_delay is not None:
+            delay = retry_delay
+        deadline = monotonic() + delay
+
+        with self._condition:
+            if self._shutdown_deadline is not None:
+                if deadline >= self._shutdown_deadline:
+                    logger.warning(
+                        "Dropping export request, retry would exceed the "
+                        "shutdown deadline."
+                    )
+                    return False
+            elif len(self._pending) >= self._max_requests:
+                logger.warning("Retry buffer is full, dropping request.")
+                return False
+            logger.debug("Waiting %ss before retrying export", delay)
+            heapq.heappush(
+                self._pending,
+                (deadline, next(self._sequence), request, delays),
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+        return True
+
+    def _worker(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if not self._pending:
+                        if self._shutdown_deadline is not None:
+                            self._thread = None
+                            return
+                        self._condition.wait()
+                        continue
+                    remaining = self._pending[0][0] - monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                _, _, request, delays = heapq.heappop(self._pending)
+                shutdown_deadline = self._shutdown_deadline
+                self._sending = True
+
+            try:
+                self._retry(request, delays, shutdown_deadline)
+            finally:
+                with self._condition:
+                    self._sending = False
+                    self._condition.notify_all()
+
+    def _retry(
+        self,
+        request: bytes,
+        delays: Iterator[Optional[float]],
+        shutdown_deadline: Optional[float],
+    ) -> None:
+        timeout = self._timeout
+        if shutdown_deadline is not None:
+            timeout = min(timeout, shutdown_deadline - monotonic())
+            if timeout <= 0:
+                with self._condition:
+                    self._abandon(1)
+                return
+        result, retry_delay = self._send(request, timeout)
+        if result is None:
+            if not self.schedule(request, retry_delay, delays):
+                with self._condition:
+                    self.dropped += 1
+        elif result is self._failure:
+            logger.warning(
+                "Dropping export request rejected by the collector."
+            )
+            with self._condition:
+                self.dropped += 1
+
+    def _abandon(self, num_requests: int) -> None:
+        """Drops requests that were not sent before shutdown, must be called
+        with the condition held."""
+        logger.warning(
+            "Dropping %s export request(s) not sent before shutdown.",
+            num_requests,
+        )
+        self.dropped += num_requests
+
+    def _retry_now(self) -> None:
+        """Makes every parked request due, must be called with the condition
+        held."""
+        self._pending = [
+            (0, sequence, request, delays)
+            for _, sequence, request, delays in self._pending
+        ]
+        heapq.heapify(self._pending)
+        self._condition.notify_all()
+
+    def flush(self, timeout: float) -> bool:
+        """Retries every parked request right away and waits at most
+        ``timeout`` seconds for them to be sent.
+
+        Returns:
+            False if a request was dropped meanwhile or is still parked after
+            the timeout, True otherwise.
+        """
+        deadline = monotonic() + timeout
+        with self._condition:
+            dropped = self.dropped
+            self._retry_now()
+            while self._pending or self._sending:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return self.dropped == dropped
+
+    def shutdown(self, timeout: float) -> None:
+        """Retries every parked request right away and waits at most
+        ``timeout`` seconds for them to be sent. Requests still parked after
+        the timeout are dropped."""
+        with self._condition:
+            self._shutdown_deadline = monotonic() + timeout
+            self._retry_now()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        with self._condition:
+            if self._pending:
+                self._abandon(len(self._pending))
+                self._pending = []
+
+
 # pylint: disable=no-member
 class OTLPExporterMixin(
     ABC, Generic[SDKDataT, ExportServiceRequestT, ExportResultT]
@@ -199,6 +443,19 @@ class OTLPExporterMixin(
         headers: Headers to send when exporting
         timeout: Backend request timeout in seconds
         compression: gRPC compression method to use
+        max_retry_requests: Maximum number of failed requests waiting to be
+            retried
+
+    Requests that fail with a retryable status are retried on a background
+    thread, export returns once a request is parked for retry and only
+    fails if the retry buffer is full. Parked requests that are dropped
+    later are counted in `dropped_requests`. `force_flush` retries the
+    parked requests right away and waits for them to be sent, as does
+    `shutdown` for a short time only, so that exiting the process is not
+    held up while the collector is unavailable.
+
+    gRPC channels cannot be used across `os.fork`, so a child process
+    creates a new channel the first time it exports.
     """
 
     def __init__(
@@ -209,6 +466,7 @@ class OTLPExporterMixin(
         headers: Optional[Sequence] = None,
         timeout: Optional[int] = None,
         compression: Optional[Compression] = None,
+        max_retry_requests: Optional[int] = None,
     ):
         super().__init__()
 
@@ -247,6 +505,9 @@ class OTLPExporterMixin(
             environ.get(OTEL_EXPORTER_OTLP_TIMEOUT, 10)
         )
         self._collector_span_kwargs = None
+        # translation keeps per span state on the exporter, serialize it so
+        # export can be called from several threads
+        self._translate_lock = threading.Lock()
 
         compression = (
             environ_to_compression(OTEL_EXPORTER_OTLP_COMPRESSION)
@@ -254,17 +515,53 @@ class OTLPExporterMixin(
             else compression
         ) or Compression.NoCompression
 
-        if insecure:
-            self._client = self._stub(
-                insecure_channel(endpoint, compression=compression)
-            )
-        else:
+        self._endpoint = endpoint
+        self._insecure = insecure
+        self._compression = compression
+        if not insecure:
             credentials = _get_credentials(
                 credentials, OTEL_EXPORTER_OTLP_CERTIFICATE
             )
-            self._client = self._stub(
-                secure_channel(endpoint, credentials, compression=compression)
+        self._credentials = credentials
+        self._client = self._create_client()
+        self._max_retry_requests = max_retry_requests or 16
+        self._retry_scheduler = self._create_retry_scheduler()
+        _register_at_fork_reinit(self._at_fork_reinit)
+
+    def _create_client(self):
+        if self._insecure:
+            channel = insecure_channel(
+                self._endpoint, compression=self._compression
+            )
+        else:
+            channel = secure_channel(
+                self._endpoint,
+                self._credentials,
+                compression=self._compression,
             )
+        return self._stub(_SerializedRequestChannel(channel))
+
+    def _create_retry_scheduler(self) -> _RetryScheduler:
+        return _RetryScheduler(
+            self._send_request,
+            self._max_retry_requests,
+            self._timeout,
+            self._result.FAILURE,
+        )
+
+    @property
+    def dropped_requests(self) -> int:
+        """The number of export requests parked for retry, for which export
+        returned success, that were dropped without being sent."""
+        return self._retry_scheduler.dropped
+
+    def _at_fork_reinit(self) -> None:
+        # the channel inherited from the parent is unusable, it is recreated
+        # lazily on the next export
+        self._client = None
+        self._translate_lock = threading.Lock()
+        # requests parked for retry are sent by the parent
+        self._retry_scheduler = self._create_retry_scheduler()
 
     @abstractmethod
     def _translate_data(
@@ -272,61 +569,80 @@ class OTLPExporterMixin(
     ) -> ExportServiceRequestT:
         pass
 
+    def _serialize_data(self, data: TypingSequence[SDKDataT]) -> bytes:
+        """Returns the serialized export request of the data."""
+        with self._translate_lock:
+            request = self._translate_data(data)
+        return request.SerializeToString()
+
     def _export(self, data: TypingSequence[SDKDataT]) -> ExportResultT:
 
-        max_value = 64
-        # expo returns a generator that yields delay values which grow
-        # exponentially. Once delay is greater than max_value, the yielded
-        # value will remain constant.
-        for delay in expo(max_value=max_value):
+        if self._client is None:
+            self._client = self._create_client()
 
-            if delay == max_value:
-                return self._result.FAILURE
+        # serialized once, retries send the same bytes
+        serialized_request = self._serialize_data(data)
 
-            try:
-                self._client.Export(
-                    request=self._translate_data(data),
-                    metadata=self._headers,
-                    timeout=self._timeout,
-                )
+        result, retry_delay = self._send_request(
+            serialized_request, self._timeout
+        )
+        if result is not None:
+            return result
+        if self._retry_scheduler.schedule(serialized_request, retry_delay):
+            return self._result.SUCCESS
+        return self._result.FAILURE
 
-                return self._result.SUCCESS
+    def _send_request(
+        self, request: bytes, timeout: float
+    ) -> Tuple[Optional[ExportResultT], Optional[float]]:
+        """Sends a serialized request once.
+
+        Returns the result or None if the request should be retried, in which
+        case the second item is the delay in seconds requested by the
+        collector, if any.
+        """
+        try:
+            self._client.Export(
+                request=request,
+                metadata=self._headers,
+                timeout=timeout,
+            )
+            return self._result.SUCCESS, None
 
-            except RpcError as error:
+        except RpcError as error:
 
-                if error.code() in [
-                    StatusCode.CANCELLED,
-                    StatusCode.DEADLINE_EXCEEDED,
-                    StatusCode.RESOURCE_EXHAUSTED,
-                    StatusCode.ABORTED,
-                    StatusCode.OUT_OF_RANGE,
-                    StatusCode.UNAVAILABLE,
-                    StatusCode.DATA_LOSS,
-                ]:
+            if error.code() in _RETRYABLE_STATUS_CODES:
 
-                    retry_info_bin = dict(error.trailing_metadata()).get(
-                        "google.rpc.retryinfo-bin"
-                    )
-                    if retry_info_bin is not None:
-                        retry_info = RetryInfo()
-                        retry_info.ParseFromString(retry_info_bin)
-                        delay = (
-                            retry_info.retry_delay.seconds
-                            + retry_info.retry_delay.nanos / 1.0e9
-                        )
-
-                    logger.debug(
-                        "Waiting %ss before retrying export of span", delay
+                retry_info_bin = dict(error.trailing_metadata()).get(
+                    "google.rpc.retryinfo-bin"
+                )
+                if retry_info_bin is not None:
+                    retry_info = RetryInfo()
+                    retry_info.ParseFromString(retry_info_bin)
+                    return (
+                        None,
+                        retry_info.retry_delay.seconds
+                        + retry_info.retry_delay.nanos / 1.0e9,
                     )
-                    sleep(delay)
-                    continue
+                return None, None
 
-                if error.code() == StatusCode.OK:
-                    return self._result.SUCCESS
+            if error.code() == StatusCode.OK:
+                return self._result.SUCCESS, None
 
-                return self._result.FAILURE
+            return self._result.FAILURE, None
 
-        return self._result.FAILURE
+    def force_flush(self, timeout_millis: float = 30000) -> bool:
+        """Retries the requests parked for retry, waiting at most
+        ``timeout_millis`` for them to be sent.
 
-    def shutdown(self) -> None:
-        pass
+        Returns:
+            False if a parked request could not be sent, True otherwise.
+        """
+        return self._retry_scheduler.flush(timeout_millis / 1e3)
+
+    def shutdown(
+        self, timeout_millis: float = _SHUTDOWN_TIMEOUT_MILLIS
+    ) -> None:
+        """Retries the requests parked for retry, waiting at most
+        ``timeout_millis`` for them to be sent."""
+        self._retry_scheduler.shutdown(timeout_millis / 1e3)
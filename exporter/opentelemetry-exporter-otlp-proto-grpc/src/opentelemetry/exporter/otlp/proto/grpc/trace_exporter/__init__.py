@@ -20,12 +20,16 @@ from typing import Optional, Sequence
 from grpc import ChannelCredentials, Compression
 
 from opentelemetry.exporter.otlp.proto.grpc.exporter import (
+    _SHUTDOWN_TIMEOUT_MILLIS,
     OTLPExporterMixin,
     _get_credentials,
     _translate_key_values,
     environ_to_compression,
     get_resource_data,
 )
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter._encoder import (
+    _ExportTraceServiceRequestEncoder,
+)
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest,
 )
@@ -70,6 +74,11 @@ class OTLPSpanExporter(
         headers: Headers to send when exporting
         timeout: Backend request timeout in seconds
         compression: gRPC compression method to use
+        max_retry_requests: Maximum number of failed requests waiting to be
+            retried
+
+    Spans are encoded directly to the protobuf wire format, the output is
+    the same as serializing the request built by `_translate_data`.
     """
 
     _result = SpanExportResult
@@ -83,6 +92,7 @@ class OTLPSpanExporter(
         headers: Optional[Sequence] = None,
         timeout: Optional[int] = None,
         compression: Optional[Compression] = None,
+        max_retry_requests: Optional[int] = None,
     ):
         if (
             not insecure
@@ -113,8 +123,10 @@ class OTLPSpanExporter(
                 or environ.get(OTEL_EXPORTER_OTLP_TRACES_HEADERS),
                 "timeout": timeout or environ_timeout,
                 "compression": compression,
+                "max_retry_requests": max_retry_requests,
             }
         )
+        self._encoder = _ExportTraceServiceRequestEncoder()
 
     def _translate_name(self, sdk_span: ReadableSpan) -> None:
         self._collector_span_kwargs["name"] = sdk_span.name
@@ -304,5 +316,18 @@ class OTLPSpanExporter(
             )
         )
 
+    def _serialize_data(self, data: Sequence[ReadableSpan]) -> bytes:
+        return self._encoder.encode(data)
+
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
         return self._export(spans)
+
+    def force_flush(self, timeout_millis: float = 30000) -> bool:
+        return OTLPExporterMixin.force_flush(
+            self, timeout_millis=timeout_millis
+        )
+
+    def shutdown(
+        self, timeout_millis: float = _SHUTDOWN_TIMEOUT_MILLIS
+    ) -> None:
+        OTLPExporterMixin.shutdown(self, timeout_millis=timeout_millis)
@@ -0,0 +1,357 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Encodes spans to the protobuf wire format of `ExportTraceServiceRequest`
+without building the intermediate protobuf messages.
+
+The output is byte for byte the serialization of the request built by
+`OTLPSpanExporter._translate_data`: fields are written in field number order
+and proto3 fields holding their default value are left out.
+"""
+
+import logging
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, List
+from typing import Sequence as TypingSequence
+from typing import Tuple
+
+from opentelemetry.proto.trace.v1.trace_pb2 import Span as CollectorSpan
+from opentelemetry.proto.trace.v1.trace_pb2 import Status
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import SpanKind, StatusCode
+
+logger = logging.getLogger(__name__)
+
+_pack_double = struct.Struct("<d").pack
+_pack_fixed64 = struct.Struct("<Q").pack
+
+_SMALL_VARINTS = [bytes([value]) for value in range(0x80)]
+
+_MIN_INT64 = -(1 << 63)
+_MAX_INT64 = (1 << 63) - 1
+_UINT64_MASK = (1 << 64) - 1
+
+# pylint: disable=no-member
+_SPAN_KINDS = {
+    kind: getattr(CollectorSpan.SpanKind, "SPAN_KIND_{}".format(kind.name))
+    for kind in SpanKind
+}
+_DEPRECATED_STATUS_CODE_UNKNOWN_ERROR = (
+    Status.DEPRECATED_STATUS_CODE_UNKNOWN_ERROR
+)
+
+# maximum number of attribute keys kept encoded
+_MAX_CACHED_KEYS = 1024
+# maximum number of resources and instrumentation libraries kept encoded
+_MAX_CACHED_BLOCKS = 64
+
+
+def _varint(value: int) -> bytes:
+    """Encodes a non-negative integer as a varint."""
+    if value < 0x80:
+        return _SMALL_VARINTS[value]
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _length_delimited(tag: bytes, payload: bytes) -> bytes:
+    return tag + _varint(len(payload)) + payload
+
+
+def _string(tag: bytes, value: str) -> bytes:
+    """Encodes a string field, empty strings are left out."""
+    if not value:
+        return b""
+    return _length_delimited(tag, value.encode("utf-8"))
+
+
+def _encode_any_value(value: Any) -> bytes:
+    # same type checks in the same order as _translate_value
+    if isinstance(value, bool):
+        return b"\x10\x01" if value else b"\x10\x00"
+
+    if isinstance(value, str):
+        return _length_delimited(b"\x0a", value.encode("utf-8"))
+
+    if isinstance(value, int):
+        if not _MIN_INT64 <= value <= _MAX_INT64:
+            raise ValueError("Value out of range: {}".format(value))
+        return b"\x18" + _varint(value & _UINT64_MASK)
+
+    if isinstance(value, float):
+        return b"\x21" + _pack_double(value)
+
+    if isinstance(value, Sequence):
+        return _length_delimited(
+            b"\x2a",
+            b"".join(
+                [
+                    _length_delimited(b"\x0a", _encode_any_value(element))
+                    for element in value
+                ]
+            ),
+        )
+
+    raise Exception("Invalid type {} of value {}".format(type(value), value))
+
+
+class _IdentityCache:
+    """Least recently used cache of values computed from immutable objects,
+    keyed by object identity.
+
+    Entries hold a reference to their object so that its id can't be reused
+    by another object while cached.
+    """
+
+    def __init__(self, compute: Callable[[Any], bytes], maxsize: int):
+        self._compute = compute
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # type: OrderedDict
+
+    def get(self, obj: Any) -> bytes:
+        key = id(obj)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is obj:
+                self._entries.move_to_end(key)
+                return entry[1]
+        value = self._compute(obj)
+        with self._lock:
+            self._entries[key] = (obj, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+
+class _ExportTraceServiceRequestEncoder:
+    """Encodes batches of spans to serialized `ExportTraceServiceRequest`
+    messages.
+
+    The encoded keys of the most recent attributes are cached, as are the
+    encoded blocks of the most recent resources and instrumentation
+    libraries, by identity since both are immutable. Instances can be used
+    from several threads.
+    """
+
+    def __init__(self):
+        self._keys = {}  # type: Dict[str, bytes]
+        self._resources = _IdentityCache(
+            self._encode_resource, _MAX_CACHED_BLOCKS
+        )
+        self._instrumentation_libraries = _IdentityCache(
+            self._encode_instrumentation_library, _MAX_CACHED_BLOCKS
+        )
+
+    def _encode_key(self, key: str) -> bytes:
+        encoded = self._keys.get(key)
+        if encoded is None:
+            encoded = _string(b"\x0a", key)
+            if len(self._keys) >= _MAX_CACHED_KEYS:
+                self._keys.clear()
+            self._keys[key] = encoded
+        return encoded
+
+    def _encode_attributes(self, tag: bytes, attributes) -> List[bytes]:
+        """Encodes the attributes as repeated KeyValue fields, skipping
+        attributes that can't be encoded like `_translate_key_values`."""
+        encoded = []
+        for key, value in attributes.items():
+            try:
+                encoded.append(
+                    _length_delimited(
+                        tag,
+                        self._encode_key(key)
+                        + _length_delimited(b"\x12", _encode_any_value(value)),
+                    )
+                )
+            except Exception as error:  # pylint: disable=broad-except
+                logger.exception(error)
+        return encoded
+
+    def _encode_resource(self, resource) -> bytes:
+        return _length_delimited(
+            b"\x0a",
+            b"".join(self._encode_attributes(b"\x0a", resource.attributes)),
+        )
+
+    @staticmethod
+    def _encode_instrumentation_library(instrumentation_info) -> bytes:
+        if instrumentation_info is None:
+            return b""
+        return _length_delimited(
+            b"\x0a",
+            _string(b"\x0a", instrumentation_info.name)
+            + _string(b"\x12", instrumentation_info.version),
+        )
+
+    def _encode_event(self, event) -> bytes:
+        parts = []
+        if event.timestamp:
+            parts.append(b"\x09" + _pack_fixed64(event.timestamp))
+        parts.append(_string(b"\x12", event.name))
+        attributes = event.attributes
+        if attributes:
+            parts.extend(self._encode_attributes(b"\x1a", attributes))
+        dropped = getattr(attributes, "dropped", 0)
+        if dropped:
+            parts.append(b"\x20" + _varint(dropped))
+        return _length_delimited(b"\x5a", b"".join(parts))
+
+    def _encode_link(self, link) -> bytes:
+        parts = [
+            b"\x0a\x10",
+            link.context.trace_id.to_bytes(16, "big"),
+            b"\x12\x08",
+            link.context.span_id.to_bytes(8, "big"),
+        ]
+        attributes = link.attributes
+        if attributes:
+            parts.extend(self._encode_attributes(b"\x22", attributes))
+        dropped = getattr(attributes, "dropped", 0)
+        if dropped:
+            parts.append(b"\x28" + _varint(dropped))
+        return _length_delimited(b"\x6a", b"".join(parts))
+
+    @staticmethod
+    def _encode_status(status) -> bytes:
+        parts = []
+        if status.status_code is StatusCode.ERROR:
+            parts.append(
+                b"\x08" + _varint(_DEPRECATED_STATUS_CODE_UNKNOWN_ERROR)
+            )
+        parts.append(_string(b"\x12", status.description))
+        if status.status_code.value:
+            parts.append(b"\x18" + _varint(status.status_code.value))
+        return _length_delimited(b"\x7a", b"".join(parts))
+
+    def _encode_span(self, span: ReadableSpan) -> bytes:
+        context = span.context
+        parts = [
+            b"\x0a\x10",
+            context.trace_id.to_bytes(16, "big"),
+            b"\x12\x08",
+            context.span_id.to_bytes(8, "big"),
+        ]
+        if context.trace_state is not None:
+            parts.append(
+                _string(
+                    b"\x1a",
+                    ",".join(
+                        [
+                            "{}={}".format(key, value)
+                            for key, value in context.trace_state.items()
+                        ]
+                    ),
+                )
+            )
+        if span.parent is not None:
+            parts.append(b"\x22\x08" + span.parent.span_id.to_bytes(8, "big"))
+        parts.append(_string(b"\x2a", span.name))
+        kind = _SPAN_KINDS[span.kind]
+        if kind:
+            parts.append(b"\x30" + _varint(kind))
+        if span.start_time:
+            parts.append(b"\x39" + _pack_fixed64(span.start_time))
+        if span.end_time:
+            parts.append(b"\x41" + _pack_fixed64(span.end_time))
+        if span.attributes:
+            parts.extend(self._encode_attributes(b"\x4a", span.attributes))
+        if span.dropped_attributes:
+            parts.append(b"\x50" + _varint(span.dropped_attributes))
+        if span.events:
+            parts.extend([self._encode_event(event) for event in span.events])
+        if span.dropped_events:
+            parts.append(b"\x60" + _varint(span.dropped_events))
+        if span.links:
+            parts.extend([self._encode_link(link) for link in span.links])
+        if span.dropped_links:
+            parts.append(b"\x70" + _varint(span.dropped_links))
+        if span.status is not None:
+            parts.append(self._encode_status(span.status))
+        return _length_delimited(b"\x12", b"".join(parts))
+
+    def encode(self, spans: TypingSequence[ReadableSpan]) -> bytes:
+        """Returns the serialized `ExportTraceServiceRequest` of the spans."""
+        # like _translate_data, spans are grouped by resource and the
+        # instrumentation library of the first span of every resource is
+        # used. Spans are grouped by the identity of their resource first to
+        # avoid hashing a resource for every span.
+        groups = {}  # type: Dict[int, Tuple[Any, Any, List[ReadableSpan]]]
+        for span in spans:
+            group = groups.get(id(span.resource))
+            if group is None:
+                group = groups[id(span.resource)] = (
+                    span.resource,
+                    span.instrumentation_info,
+                    [],
+                )
+            group[2].append(span)
+
+        if len(groups) > 1:
+            resources = {}  # type: Dict[Any, int]
+            for key, (resource, _, _) in groups.items():
+                resources.setdefault(resource, key)
+            if len(resources) < len(groups):
+                # distinct but equal resources, group them by equality
+                groups = self._group_by_equal_resource(spans, resources)
+
+        return b"".join(
+            [
+                _length_delimited(
+                    b"\x0a",
+                    self._resources.get(resource)
+                    + _length_delimited(
+                        b"\x12",
+                        self._instrumentation_libraries.get(
+                            instrumentation_info
+                        )
+                        + b"".join(
+                            [self._encode_span(span) for span in group]
+                        ),
+                    ),
+                )
+                for resource, instrumentation_info, group in groups.values()
+            ]
+        )
+
+    @staticmethod
+    def _group_by_equal_resource(
+        spans: TypingSequence[ReadableSpan], resources: Dict[Any, int]
+    ) -> Dict[int, Tuple[Any, Any, List[ReadableSpan]]]:
+        canonical_keys = {}  # type: Dict[int, int]
+        groups = {}  # type: Dict[int, Tuple[Any, Any, List[ReadableSpan]]]
+        for span in spans:
+            key = canonical_keys.get(id(span.resource))
+            if key is None:
+                key = canonical_keys[id(span.resource)] = resources[
+                    span.resource
+                ]
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = (
+                    span.resource,
+                    span.instrumentation_info,
+                    [],
+                )
+            group[2].append(span)
+        return groups
@@ -17,6 +17,9 @@ from unittest.mock import patch
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
     OTLPSpanExporter,
 )
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter._encoder import (
+    _ExportTraceServiceRequestEncoder,
+)
 from opentelemetry.sdk.trace import TracerProvider, sampling
 from opentelemetry.sdk.trace.export import (
     BatchSpanProcessor,
@@ -85,3 +88,49 @@ def test_batch_span_processor(benchmark):
         span.end()
 
     benchmark(create_spans_to_be_exported)
+
+
+def get_spans_to_be_exported(num_spans=512):
+    tracer = TracerProvider(sampler=sampling.DEFAULT_ON).get_tracer(
+        "pipeline_benchmark_tracer"
+    )
+    spans = []
+    for _ in range(num_spans):
+        span = tracer.start_span(
+            "benchmarkedSpan",
+        )
+        for i in range(10):
+            span.set_attribute(
+                "benchmarkAttribute_{}".format(i),
+                "benchmarkAttrValue_{}".format(i),
+            )
+        span.add_event("benchmarkEvent", {"benchmarkEventAttribute": 1})
+        span.end()
+        spans.append(span)
+    return spans
+
+
+@patch(
+    "opentelemetry.exporter.otlp.proto.grpc.trace_exporter.OTLPSpanExporter._stub",
+    new=MockTraceServiceStub,
+)
+def test_translate_and_serialize(benchmark):
+    """Serializes a batch through the protobuf messages built by
+    _translate_data."""
+    exporter = OTLPSpanExporter()
+    spans = get_spans_to_be_exported()
+
+    def translate_and_serialize():
+        # pylint: disable=protected-access
+        return exporter._translate_data(spans).SerializeToString()
+
+    benchmark(translate_and_serialize)
+
+
+def test_encode(benchmark):
+    """Encodes the same batch as test_translate_and_serialize directly to
+    the wire format."""
+    encoder = _ExportTraceServiceRequestEncoder()
+    spans = get_spans_to_be_exported()
+
+    benchmark(encoder.encode, spans)
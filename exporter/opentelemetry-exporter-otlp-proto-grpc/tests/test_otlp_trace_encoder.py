@@ -0,0 +1,194 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import TestCase
+from unittest.mock import PropertyMock, patch
+
+from opentelemetry import trace as trace_api
+from opentelemetry.attributes import BoundedAttributes
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+    OTLPSpanExporter,
+    _encoder,
+)
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter._encoder import (
+    _ExportTraceServiceRequestEncoder,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, SpanLimits, TracerProvider
+from opentelemetry.sdk.util import BoundedList
+from opentelemetry.sdk.util.instrumentation import InstrumentationInfo
+from opentelemetry.test.spantestutil import (
+    get_span_with_dropped_attributes_events_links,
+)
+
+
+class TestExportTraceServiceRequestEncoder(TestCase):
+    def setUp(self):
+        self.exporter = OTLPSpanExporter(insecure=True)
+        self.encoder = _ExportTraceServiceRequestEncoder()
+
+    def assert_encoded_as_translated(self, spans):
+        # pylint: disable=protected-access
+        self.assertEqual(
+            self.encoder.encode(spans),
+            self.exporter._translate_data(spans).SerializeToString(),
+        )
+
+    def test_empty(self):
+        self.assert_encoded_as_translated([])
+
+    def test_spans(self):
+        spans = []
+        for resource in (
+            Resource.create({"service.name": "a", "list": ("b", "c")}),
+            Resource.create({"service.name": "d"}),
+        ):
+            tracer_provider = TracerProvider(resource=resource)
+            for tracer in (
+                tracer_provider.get_tracer("first", "1.0"),
+                tracer_provider.get_tracer("second"),
+            ):
+                with tracer.start_as_current_span(
+                    "parent", kind=trace_api.SpanKind.SERVER
+                ) as parent:
+                    parent.set_status(
+                        trace_api.Status(trace_api.StatusCode.ERROR, "error")
+                    )
+                    with tracer.start_as_current_span(
+                        "child",
+                        kind=trace_api.SpanKind.CONSUMER,
+                        links=[
+                            trace_api.Link(
+                                parent.get_span_context(), {"int": -1}
+                            ),
+                            trace_api.Link(parent.get_span_context()),
+                        ],
+                        attributes={
+                            "": "empty key",
+                            "bool": False,
+                            "int": 0,
+                            "negative": -(2 ** 63),
+                            "float": 0.0,
+                            "nan": float("nan"),
+                            "string": "ünïcödé",
+                            "empty": "",
+                            "strings": ["a", "b"],
+                            "ints": [1, -2, 3 ** 20],
+                            "empty list": [],
+                        },
+                    ) as child:
+                        child.add_event("no attributes")
+                        child.add_event("", {"float": 1.5}, timestamp=0)
+                        child.set_status(trace_api.Status())
+                spans.extend([child, parent])
+        self.assert_encoded_as_translated(spans)
+
+    def test_dropped_attributes_events_links(self):
+        self.assert_encoded_as_translated(
+            [get_span_with_dropped_attributes_events_links()]
+        )
+
+    def test_trace_state_and_remote_parent(self):
+        parent = trace_api.SpanContext(
+            trace_id=2 ** 128 - 1,
+            span_id=0,
+            is_remote=True,
+            trace_state=trace_api.TraceState([("a", "b"), ("c", "d")]),
+        )
+        span = ReadableSpan(
+            name="remote",
+            context=trace_api.SpanContext(
+                2 ** 128 - 1, 1, False, trace_state=parent.trace_state
+            ),
+            parent=parent,
+            resource=Resource({}),
+            attributes=BoundedAttributes(),
+            events=BoundedList(None),
+            links=BoundedList(None),
+            start_time=1,
+            end_time=2 ** 64 - 1,
+        )
+        self.assert_encoded_as_translated([span])
+
+    def test_invalid_attributes(self):
+        tracer = TracerProvider(
+            span_limits=SpanLimits(max_attributes=10)
+        ).get_tracer(__name__)
+        with tracer.start_as_current_span(
+            "invalid", attributes={"valid": True}
+        ) as span:
+            pass
+        # bypass the validation of the SDK
+        # pylint: disable=protected-access
+        span._attributes._dict.update(
+            {"too big": 2 ** 63, "mapping": {"a": 1}, "nested": [[1], {}]}
+        )
+        with patch(
+            "opentelemetry.exporter.otlp.proto.grpc.trace_exporter._encoder"
+            ".logger"
+        ) as mock_logger:
+            encoded = self.encoder.encode([span])
+        self.assertEqual(mock_logger.exception.call_count, 3)
+        with self.assertLogs(level="ERROR"):
+            # pylint: disable=protected-access
+            translated = self.exporter._translate_data([span])
+        self.assertEqual(encoded, translated.SerializeToString())
+
+    def test_equal_resources(self):
+        spans = []
+        for index in range(4):
+            # distinct but equal resources, alternating with another one
+            resource = Resource({"service.name": "a"})
+            if index % 2:
+                resource = Resource({"service.name": "b"})
+            tracer = TracerProvider(resource=resource).get_tracer(
+                str(index)
+            )
+            with tracer.start_as_current_span(str(index)) as span:
+                pass
+            spans.append(span)
+        self.assert_encoded_as_translated(spans)
+
+    def test_cached_blocks(self):
+        tracer = TracerProvider(
+            resource=Resource({"service.name": "a"})
+        ).get_tracer(__name__)
+        with tracer.start_as_current_span("span") as span:
+            pass
+
+        encoded = self.encoder.encode([span])
+        with patch.object(
+            Resource,
+            "attributes",
+            new_callable=PropertyMock,
+            side_effect=AssertionError,
+        ), patch.object(
+            InstrumentationInfo,
+            "name",
+            new_callable=PropertyMock,
+            side_effect=AssertionError,
+        ):
+            self.assertEqual(self.encoder.encode([span]), encoded)
+
+    def test_cache_eviction(self):
+        # pylint: disable=protected-access
+        cache = _encoder._IdentityCache(repr, 2)
+        first, second, third = object(), object(), object()
+        cache.get(first)
+        cache.get(second)
+        cache.get(first)
+        cache.get(third)
+        self.assertEqual(
+            [entry[0] for entry in cache._entries.values()], [first, third]
+        )
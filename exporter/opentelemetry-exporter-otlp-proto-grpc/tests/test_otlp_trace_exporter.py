@@ -15,6 +15,8 @@
 import os
 from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
+from logging import WARNING
+from time import monotonic, sleep
 from unittest import TestCase
 from unittest.mock import Mock, PropertyMock, patch
 
@@ -106,6 +108,52 @@ class TraceServiceServicerUNAVAILABLE(TraceServiceServicer):
         return ExportTraceServiceResponse()
 
 
+class TraceServiceServicerUNAVAILABLEOnce(TraceServiceServicer):
+    def __init__(self):
+        self.calls = 0
+
+    # pylint: disable=invalid-name,unused-argument
+    def Export(self, request, context):
+        self.calls += 1
+        if self.calls == 1:
+            context.set_code(StatusCode.UNAVAILABLE)
+        else:
+            context.set_code(StatusCode.OK)
+
+        return ExportTraceServiceResponse()
+
+
+class TraceServiceServicerUNAVAILABLEThenALREADY_EXISTS(TraceServiceServicer):
+    def __init__(self):
+        self.calls = 0
+
+    # pylint: disable=invalid-name,unused-argument
+    def Export(self, request, context):
+        self.calls += 1
+        if self.calls == 1:
+            context.set_code(StatusCode.UNAVAILABLE)
+        else:
+            context.set_code(StatusCode.ALREADY_EXISTS)
+
+        return ExportTraceServiceResponse()
+
+
+class TraceServiceServicerUNAVAILABLEThenSlow(TraceServiceServicer):
+    def __init__(self):
+        self.calls = 0
+
+    # pylint: disable=invalid-name,unused-argument
+    def Export(self, request, context):
+        self.calls += 1
+        if self.calls == 1:
+            context.set_code(StatusCode.UNAVAILABLE)
+        else:
+            sleep(5)
+            context.set_code(StatusCode.OK)
+
+        return ExportTraceServiceResponse()
+
+
 class TraceServiceServicerSUCCESS(TraceServiceServicer):
     # pylint: disable=invalid-name,unused-argument,no-self-use
     def Export(self, request, context):
@@ -359,32 +407,153 @@ class TestOTLPSpanExporter(TestCase):
         self.assertIsNone(exporter._headers, None)
 
     @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.expo")
-    @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.sleep")
-    def test_unavailable(self, mock_sleep, mock_expo):
+    def test_unavailable(self, mock_expo):
 
         mock_expo.configure_mock(**{"return_value": [1]})
 
         add_TraceServiceServicer_to_server(
             TraceServiceServicerUNAVAILABLE(), self.server
         )
+        # parked for retry
         self.assertEqual(
-            self.exporter.export([self.span]), SpanExportResult.FAILURE
+            self.exporter.export([self.span]), SpanExportResult.SUCCESS
         )
-        mock_sleep.assert_called_with(1)
+        # pylint: disable=protected-access
+        self.assertEqual(len(self.exporter._retry_scheduler), 1)
 
-    @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.expo")
-    @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.sleep")
-    def test_unavailable_delay(self, mock_sleep, mock_expo):
+        with self.assertLogs(level=WARNING) as warning:
+            self.exporter.shutdown()
+        self.assertIn("retries exhausted", warning.output[0])
+        self.assertEqual(len(self.exporter._retry_scheduler), 0)
+        self.assertEqual(self.exporter.dropped_requests, 1)
 
-        mock_expo.configure_mock(**{"return_value": [1]})
+    def test_unavailable_delay(self):
 
         add_TraceServiceServicer_to_server(
             TraceServiceServicerUNAVAILABLEDelay(), self.server
         )
         self.assertEqual(
-            self.exporter.export([self.span]), SpanExportResult.FAILURE
+            self.exporter.export([self.span]), SpanExportResult.SUCCESS
+        )
+        # pylint: disable=protected-access
+        deadline = self.exporter._retry_scheduler._pending[0][0]
+        self.assertGreater(deadline - monotonic(), 3)
+        self.assertLessEqual(deadline - monotonic(), 4)
+
+        with self.assertLogs(level=WARNING):
+            self.exporter.shutdown(timeout_millis=0)
+        self.assertEqual(len(self.exporter._retry_scheduler), 0)
+        self.assertEqual(self.exporter.dropped_requests, 1)
+
+    def test_unavailable_retried(self):
+        servicer = TraceServiceServicerUNAVAILABLEOnce()
+        add_TraceServiceServicer_to_server(servicer, self.server)
+
+        # pylint: disable=protected-access
+        with patch.object(
+            self.exporter,
+            "_serialize_data",
+            wraps=self.exporter._serialize_data,
+        ) as mock_serialize_data:
+            self.assertEqual(
+                self.exporter.export([self.span]), SpanExportResult.SUCCESS
+            )
+            self.exporter.shutdown()
+
+        self.assertEqual(servicer.calls, 2)
+        self.assertEqual(len(self.exporter._retry_scheduler), 0)
+        mock_serialize_data.assert_called_once_with([self.span])
+        self.assertEqual(self.exporter.dropped_requests, 0)
+
+    def test_unavailable_rejected(self):
+        servicer = TraceServiceServicerUNAVAILABLEThenALREADY_EXISTS()
+        add_TraceServiceServicer_to_server(servicer, self.server)
+
+        self.assertEqual(
+            self.exporter.export([self.span]), SpanExportResult.SUCCESS
+        )
+        with self.assertLogs(level=WARNING) as warning:
+            self.exporter.shutdown()
+        self.assertIn("rejected", warning.output[0])
+        self.assertEqual(servicer.calls, 2)
+        self.assertEqual(self.exporter.dropped_requests, 1)
+
+    def test_force_flush(self):
+        servicer = TraceServiceServicerUNAVAILABLEOnce()
+        add_TraceServiceServicer_to_server(servicer, self.server)
+
+        self.assertEqual(
+            self.exporter.export([self.span]), SpanExportResult.SUCCESS
         )
-        mock_sleep.assert_called_with(4)
+        self.assertEqual(servicer.calls, 1)
+        # the parked request is retried right away, not after its delay
+        start = monotonic()
+        self.assertTrue(self.exporter.force_flush())
+        self.assertLess(monotonic() - start, 0.9)
+        self.assertEqual(servicer.calls, 2)
+        # pylint: disable=protected-access
+        self.assertEqual(len(self.exporter._retry_scheduler), 0)
+
+    @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.expo")
+    def test_force_flush_dropped(self, mock_expo):
+        mock_expo.configure_mock(**{"return_value": [1]})
+        add_TraceServiceServicer_to_server(
+            TraceServiceServicerUNAVAILABLE(), self.server
+        )
+
+        self.assertEqual(
+            self.exporter.export([self.span]), SpanExportResult.SUCCESS
+        )
+        with self.assertLogs(level=WARNING):
+            self.assertFalse(self.exporter.force_flush())
+        self.assertEqual(self.exporter.dropped_requests, 1)
+
+    def test_shutdown_default_timeout(self):
+        add_TraceServiceServicer_to_server(
+            TraceServiceServicerUNAVAILABLEThenSlow(), self.server
+        )
+        self.assertEqual(
+            self.exporter.export([self.span]), SpanExportResult.SUCCESS
+        )
+
+        start = monotonic()
+        self.exporter.shutdown()
+        self.assertLess(monotonic() - start, 3)
+        # the retry in flight times out with the shutdown deadline
+        for _ in range(20):
+            if self.exporter.dropped_requests:
+                break
+            sleep(0.1)
+        self.assertEqual(self.exporter.dropped_requests, 1)
+
+    def test_retry_buffer_full(self):
+        exporter = OTLPSpanExporter(insecure=True, max_retry_requests=1)
+        add_TraceServiceServicer_to_server(
+            TraceServiceServicerUNAVAILABLE(), self.server
+        )
+        self.assertEqual(
+            exporter.export([self.span]), SpanExportResult.SUCCESS
+        )
+        with self.assertLogs(level=WARNING):
+            self.assertEqual(
+                exporter.export([self.span]), SpanExportResult.FAILURE
+            )
+        # the caller was told about the second request
+        self.assertEqual(exporter.dropped_requests, 0)
+        exporter.shutdown(timeout_millis=0)
+
+    @patch("opentelemetry.exporter.otlp.proto.grpc.exporter.insecure_channel")
+    def test_at_fork_reinit(self, mock_insecure_channel):
+        exporter = OTLPSpanExporter(insecure=True)
+        self.assertEqual(mock_insecure_channel.call_count, 1)
+
+        # pylint: disable=protected-access
+        exporter._at_fork_reinit()
+        self.assertIsNone(exporter._client)
+
+        exporter.export([self.span])
+        self.assertEqual(mock_insecure_channel.call_count, 2)
+        self.assertIsNotNone(exporter._client)
 
     def test_success(self):
         add_TraceServiceServicer_to_server(
@@ -15,7 +15,6 @@
 
 import logging
 import threading
-from collections import OrderedDict
 from collections.abc import MutableMapping
 from types import MappingProxyType
 from typing import MutableSequence, Optional, Sequence
@@ -81,6 +80,56 @@ def _is_valid_attribute_value(value: types.AttributeValue) -> bool:
     return True
 
 
+def _clean_sequence(value: Sequence) -> Optional[Sequence]:
+    if value:
+        # homogeneous sequences of a valid type are checked without
+        # calling isinstance on every element
+        element_type = type(value[0])
+        if element_type in _VALID_ATTR_VALUE_TYPES and all(
+            type(element) is element_type for element in value
+        ):
+            return value if type(value) is tuple else tuple(value)
+    return _clean_attribute_value_slow(value)
+
+
+def _clean_attribute_value_slow(
+    value: types.AttributeValue,
+) -> Optional[types.AttributeValue]:
+    if not _is_valid_attribute_value(value):
+        return None
+    if isinstance(value, MutableSequence):
+        return tuple(value)
+    if isinstance(value, bytes):
+        try:
+            return value.decode()
+        except ValueError:
+            _logger.warning("Byte attribute could not be decoded.")
+            return None
+    return value
+
+
+# cleaners of the most common value types, the values of other types are
+# validated with _is_valid_attribute_value
+_VALUE_CLEANERS = {
+    str: lambda value: value,
+    bool: lambda value: value,
+    int: lambda value: value,
+    float: lambda value: value,
+    tuple: _clean_sequence,
+    list: _clean_sequence,
+}
+
+
+def _clean_attribute_value(
+    value: types.AttributeValue,
+) -> Optional[types.AttributeValue]:
+    """Returns the value to store for a valid attribute value, freezing
+    mutable sequences and decoding bytes, and None for an invalid one."""
+    return _VALUE_CLEANERS.get(type(value), _clean_attribute_value_slow)(
+        value
+    )
+
+
 def _filter_attributes(attributes: types.Attributes) -> None:
     """Applies attribute validation rules and drops (key, value) pairs
     that doesn't adhere to attributes specification.
@@ -94,17 +143,11 @@ def _filter_attributes(attributes: types.Attributes) -> None:
                 attributes.pop(attr_key)
                 continue
 
-            if _is_valid_attribute_value(attr_value):
-                if isinstance(attr_value, MutableSequence):
-                    attributes[attr_key] = tuple(attr_value)
-                if isinstance(attr_value, bytes):
-                    try:
-                        attributes[attr_key] = attr_value.decode()
-                    except ValueError:
-                        attributes.pop(attr_key)
-                        _logger.warning("Byte attribute could not be decoded.")
-            else:
+            cleaned_value = _clean_attribute_value(attr_value)
+            if cleaned_value is None:
                 attributes.pop(attr_key)
+            elif cleaned_value is not attr_value:
+                attributes[attr_key] = cleaned_value
 
 
 _DEFAULT_LIMIT = 128
@@ -117,6 +160,8 @@ class BoundedAttributes(MutableMapping):
     added.
     """
 
+    __slots__ = ("maxlen", "dropped", "_dict", "_lock", "_immutable")
+
     def __init__(
         self,
         maxlen: Optional[int] = _DEFAULT_LIMIT,
@@ -130,7 +175,8 @@ class BoundedAttributes(MutableMapping):
                 )
         self.maxlen = maxlen
         self.dropped = 0
-        self._dict = OrderedDict()  # type: OrderedDict
+        # dicts keep the insertion order
+        self._dict = {}  # type: dict
         self._lock = threading.Lock()  # type: threading.Lock
         if attributes:
             _filter_attributes(attributes)
@@ -148,7 +194,7 @@ class BoundedAttributes(MutableMapping):
 
     def __setitem__(self, key, value):
         if getattr(self, "_immutable", False):
-            raise TypeError
+            raise TypeError("BoundedAttributes is immutable")
         with self._lock:
             if self.maxlen is not None and self.maxlen == 0:
                 self.dropped += 1
@@ -163,7 +209,7 @@ class BoundedAttributes(MutableMapping):
 
     def __delitem__(self, key):
         if getattr(self, "_immutable", False):
-            raise TypeError
+            raise TypeError("BoundedAttributes is immutable")
         with self._lock:
             del self._dict[key]
 
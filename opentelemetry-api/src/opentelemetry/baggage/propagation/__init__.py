@@ -14,21 +14,36 @@
 #
 import typing
 import urllib.parse
+from functools import lru_cache
 
 from opentelemetry import baggage
-from opentelemetry.context import get_current
+from opentelemetry.baggage import _BAGGAGE_KEY
+from opentelemetry.context import get_current, set_value
 from opentelemetry.context.context import Context
 from opentelemetry.propagators import textmap
 
 
 class W3CBaggagePropagator(textmap.TextMapPropagator):
-    """Extracts and injects Baggage which is used to annotate telemetry."""
+    """Extracts and injects Baggage which is used to annotate telemetry.
+
+    Args:
+        cache_size: The number of distinct headers whose extracted entries
+            are kept in a least recently used cache, to skip parsing headers
+            that are seen repeatedly. Disabled by default.
+    """
 
     _MAX_HEADER_LENGTH = 8192
     _MAX_PAIR_LENGTH = 4096
     _MAX_PAIRS = 180
     _BAGGAGE_HEADER_NAME = "baggage"
 
+    def __init__(self, cache_size: int = 0) -> None:
+        if cache_size > 0:
+            # the entries are returned as tuples, so they can be shared
+            self._get_entries = lru_cache(maxsize=cache_size)(
+                self._get_entries
+            )
+
     def extract(
         self,
         carrier: textmap.CarrierT,
@@ -51,25 +66,33 @@ class W3CBaggagePropagator(textmap.TextMapPropagator):
         if not header or len(header) > self._MAX_HEADER_LENGTH:
             return context
 
-        baggage_entries = header.split(",")
-        total_baggage_entries = self._MAX_PAIRS
-        for entry in baggage_entries:
-            if total_baggage_entries <= 0:
-                return context
-            total_baggage_entries -= 1
+        entries = self._get_entries(header)
+        if not entries:
+            return context
+        # set all the entries at once instead of calling set_baggage for
+        # each of them
+        baggage_entries = dict(baggage.get_all(context=context))
+        baggage_entries.update(entries)
+        return set_value(_BAGGAGE_KEY, baggage_entries, context=context)
+
+    def _get_entries(
+        self, header: str
+    ) -> typing.Tuple[typing.Tuple[str, str], ...]:
+        entries = []
+        for entry in header.split(",")[: self._MAX_PAIRS]:
             if len(entry) > self._MAX_PAIR_LENGTH:
                 continue
             try:
                 name, value = entry.split("=", 1)
             except Exception:  # pylint: disable=broad-except
                 continue
-            context = baggage.set_baggage(
-                urllib.parse.unquote(name).strip(),
-                urllib.parse.unquote(value).strip(),
-                context=context,
+            entries.append(
+                (
+                    urllib.parse.unquote(name).strip(),
+                    urllib.parse.unquote(value).strip(),
+                )
             )
-
-        return context
+        return tuple(entries)
 
     def inject(
         self,
@@ -16,7 +16,6 @@ import logging
 import threading
 import typing
 import uuid
-from functools import wraps
 from os import environ
 
 from pkg_resources import iter_entry_points
@@ -28,45 +27,34 @@ logger = logging.getLogger(__name__)
 _RUNTIME_CONTEXT = None  # type: typing.Optional[_RuntimeContext]
 _RUNTIME_CONTEXT_LOCK = threading.Lock()
 
-_F = typing.TypeVar("_F", bound=typing.Callable[..., typing.Any])
+_NOT_SET = object()
 
 
-def _load_runtime_context(func: _F) -> _F:
-    """A decorator used to initialize the global RuntimeContext
+def _load_runtime_context() -> None:
+    """Initializes the global RuntimeContext, once.
 
-    Returns:
-        A wrapper of the decorated method.
+    The public functions only call this while ``_RUNTIME_CONTEXT`` is not
+    set, so that once it is loaded they use it without taking the lock.
     """
-
-    @wraps(func)  # type: ignore[misc]
-    def wrapper(  # type: ignore[misc]
-        *args: typing.Tuple[typing.Any, typing.Any],
-        **kwargs: typing.Dict[typing.Any, typing.Any]
-    ) -> typing.Optional[typing.Any]:
-        global _RUNTIME_CONTEXT  # pylint: disable=global-statement
-
-        with _RUNTIME_CONTEXT_LOCK:
-            if _RUNTIME_CONTEXT is None:
-                # FIXME use a better implementation of a configuration manager to avoid having
-                # to get configuration values straight from environment variables
-                default_context = "contextvars_context"
-
-                configured_context = environ.get(
-                    OTEL_PYTHON_CONTEXT, default_context
-                )  # type: str
-                try:
-                    _RUNTIME_CONTEXT = next(
-                        iter_entry_points(
-                            "opentelemetry_context", configured_context
-                        )
-                    ).load()()
-                except Exception:  # pylint: disable=broad-except
-                    logger.error(
-                        "Failed to load context: %s", configured_context
+    global _RUNTIME_CONTEXT  # pylint: disable=global-statement
+
+    with _RUNTIME_CONTEXT_LOCK:
+        if _RUNTIME_CONTEXT is None:
+            # FIXME use a better implementation of a configuration manager to avoid having
+            # to get configuration values straight from environment variables
+            default_context = "contextvars_context"
+
+            configured_context = environ.get(
+                OTEL_PYTHON_CONTEXT, default_context
+            )  # type: str
+            try:
+                _RUNTIME_CONTEXT = next(
+                    iter_entry_points(
+                        "opentelemetry_context", configured_context
                     )
-        return func(*args, **kwargs)  # type: ignore[misc]
-
-    return typing.cast(_F, wrapper)  # type: ignore[misc]
+                ).load()()
+            except Exception:  # pylint: disable=broad-except
+                logger.error("Failed to load context: %s", configured_context)
 
 
 def create_key(keyname: str) -> str:
@@ -110,16 +98,19 @@ def set_value(
         context: The context to copy, if None, the current context is used.
 
     Returns:
-        A new `Context` containing the value set.
+        A new `Context` containing the value set, or the given context if
+        it already contains the value.
     """
     if context is None:
         context = get_current()
+    if context.get(key, _NOT_SET) is value:
+        # contexts are immutable, there is nothing to copy
+        return context
     new_values = context.copy()
     new_values[key] = value
     return Context(new_values)
 
 
-@_load_runtime_context  # type: ignore
 def get_current() -> Context:
     """To access the context associated with program execution,
     the Context API provides a function which takes no arguments
@@ -128,10 +119,11 @@ def get_current() -> Context:
     Returns:
         The current `Context` object.
     """
+    if _RUNTIME_CONTEXT is None:
+        _load_runtime_context()
     return _RUNTIME_CONTEXT.get_current()  # type:ignore
 
 
-@_load_runtime_context  # type: ignore
 def attach(context: Context) -> object:
     """Associates a Context with the caller's current execution unit. Returns
     a token that can be used to restore the previous Context.
@@ -142,10 +134,11 @@ def attach(context: Context) -> object:
     Returns:
         A token that can be used with `detach` to reset the context.
     """
+    if _RUNTIME_CONTEXT is None:
+        _load_runtime_context()
     return _RUNTIME_CONTEXT.attach(context)  # type:ignore
 
 
-@_load_runtime_context  # type: ignore
 def detach(token: object) -> None:
     """Resets the Context associated with the caller's current execution unit
     to the value it had before attaching a specified Context.
@@ -153,6 +146,8 @@ def detach(token: object) -> None:
     Args:
         token: The Token that was returned by a previous call to attach a Context.
     """
+    if _RUNTIME_CONTEXT is None:
+        _load_runtime_context()
     try:
         _RUNTIME_CONTEXT.detach(token)  # type: ignore
     except Exception:  # pylint: disable=broad-except
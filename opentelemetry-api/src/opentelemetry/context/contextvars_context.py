@@ -34,6 +34,10 @@ class ContextVarsRuntimeContext(_RuntimeContext):
         self._current_context = ContextVar(
             self._CONTEXT_KEY, default=Context()
         )
+        # bind the methods of the ContextVar to skip a Python call
+        self.attach = self._current_context.set  # type: ignore
+        self.get_current = self._current_context.get  # type: ignore
+        self.detach = self._current_context.reset  # type: ignore
 
     def attach(self, context: Context) -> object:
         """Sets the current `Context` object. Returns a
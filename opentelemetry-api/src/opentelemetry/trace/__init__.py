@@ -79,14 +79,22 @@ from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from enum import Enum
 from logging import getLogger
-from typing import Iterator, Optional, Sequence, cast
+from typing import (
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 from opentelemetry import context as context_api
 from opentelemetry.attributes import BoundedAttributes  # type: ignore
 from opentelemetry.context.context import Context
 from opentelemetry.environment_variables import OTEL_PYTHON_TRACER_PROVIDER
 from opentelemetry.trace.propagation import (
-    _SPAN_KEY,
+    activate_span,
     get_current_span,
     set_span_in_context,
 )
@@ -241,6 +249,72 @@ class ProxyTracerProvider(TracerProvider):
         )
 
 
+class AttributeSchema:
+    """Attribute keys declared once for a call site, see
+    `Tracer.compile_attributes`.
+
+    Values are passed in the order of the keys of the schema, ``None``
+    values are left out.
+    """
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        schema: Dict[str, Union[type, Tuple[type, ...]]],
+    ) -> None:
+        self._tracer = tracer
+        self._keys = tuple(schema)
+
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        return self._keys
+
+    def _attributes(
+        self, values: Sequence[types.AttributeValue]
+    ) -> types.Attributes:
+        if len(values) != len(self._keys):
+            raise ValueError(
+                "Expected {} attribute values, got {}".format(
+                    len(self._keys), len(values)
+                )
+            )
+        return {
+            key: value
+            for key, value in zip(self._keys, values)
+            if value is not None
+        }
+
+    def start_span(
+        self,
+        name: str,
+        values: Sequence[types.AttributeValue],
+        context: Optional[Context] = None,
+        kind: SpanKind = SpanKind.INTERNAL,
+        links: _Links = None,
+        start_time: Optional[int] = None,
+        record_exception: bool = True,
+        set_status_on_exception: bool = True,
+    ) -> "Span":
+        """Starts a span with the attributes of the schema, see
+        `Tracer.start_span`."""
+        return self._tracer.start_span(
+            name,
+            context=context,
+            kind=kind,
+            attributes=self._attributes(values),
+            links=links,
+            start_time=start_time,
+            record_exception=record_exception,
+            set_status_on_exception=set_status_on_exception,
+        )
+
+    def set_attributes(
+        self, span: "Span", values: Sequence[types.AttributeValue]
+    ) -> None:
+        """Sets the attributes of the schema on a span."""
+        span.set_attributes(self._attributes(values))
+
+
 class Tracer(ABC):
     """Handles span creation and in-process context propagation.
 
@@ -369,6 +443,29 @@ class Tracer(ABC):
             The newly-created span.
         """
 
+    def compile_attributes(
+        self, schema: Dict[str, Union[type, Tuple[type, ...]]]
+    ) -> AttributeSchema:
+        """Compiles the attributes set by a call site, so that implementations
+        can start its spans without validating the keys and the values again.
+
+        By default the attributes of the schema are passed to
+        :meth:`start_span` as a dict.
+
+        Args:
+            schema: The attribute keys, in the order their values are passed
+                in, mapped to the expected type of their values, or a tuple of
+                types. Only `bool`, `str`, `int` and `float` can be declared.
+
+        Example::
+
+            schema = tracer.compile_attributes(
+                {"http.method": str, "http.status_code": int}
+            )
+            span = schema.start_span("GET /", ("GET", 200))
+        """
+        return AttributeSchema(self, schema)
+
 
 class ProxyTracer(Tracer):
     # pylint: disable=W0222,signature-differs
@@ -392,6 +489,12 @@ class ProxyTracer(Tracer):
                 self._instrumenting_module_name,
                 self._instrumenting_library_version,
             )
+            # from now on spans are started by the real tracer directly
+            # pylint: disable=attribute-defined-outside-init
+            self.start_span = self._real_tracer.start_span  # type: ignore
+            self.start_as_current_span = (  # type: ignore
+                self._real_tracer.start_as_current_span
+            )
             return self._real_tracer
         return self._noop_tracer
 
@@ -401,6 +504,16 @@ class ProxyTracer(Tracer):
     def start_as_current_span(self, *args, **kwargs) -> Span:  # type: ignore
         return self._tracer.start_as_current_span(*args, **kwargs)  # type: ignore
 
+    def compile_attributes(
+        self, schema: Dict[str, Union[type, Tuple[type, ...]]]
+    ) -> AttributeSchema:
+        tracer = self._tracer
+        if tracer is self._noop_tracer:
+            # spans of the schema are started by the real tracer once it is
+            # set
+            return super().compile_attributes(schema)
+        return tracer.compile_attributes(schema)
+
 
 class _DefaultTracer(Tracer):
     """The default Tracer, used when no Tracer implementation is available.
@@ -498,6 +611,29 @@ def get_tracer_provider() -> TracerProvider:
     return _TRACER_PROVIDER
 
 
+def _handle_span_exception(
+    span: Span,
+    exc: BaseException,
+    record_exception: bool = True,
+    set_status_on_exception: bool = True,
+) -> None:
+    """Records an exception raised while the span was active, as `use_span`
+    does, on spans that are recording."""
+    if isinstance(span, Span) and span.is_recording():
+        # Record the exception as an event
+        if record_exception:
+            span.record_exception(exc)
+
+        # Set status in case exception was raised
+        if set_status_on_exception:
+            span.set_status(
+                Status(
+                    status_code=StatusCode.ERROR,
+                    description="{}: {}".format(type(exc).__name__, exc),
+                )
+            )
+
+
 @contextmanager  # type: ignore
 def use_span(
     span: Span,
@@ -520,26 +656,16 @@ def use_span(
             this mechanism if it was previously set manually.
     """
     try:
-        token = context_api.attach(context_api.set_value(_SPAN_KEY, span))
+        token = activate_span(span)
         try:
             yield span
         finally:
             context_api.detach(token)
 
     except Exception as exc:  # pylint: disable=broad-except
-        if isinstance(span, Span) and span.is_recording():
-            # Record the exception as an event
-            if record_exception:
-                span.record_exception(exc)
-
-            # Set status in case exception was raised
-            if set_status_on_exception:
-                span.set_status(
-                    Status(
-                        status_code=StatusCode.ERROR,
-                        description="{}: {}".format(type(exc).__name__, exc),
-                    )
-                )
+        _handle_span_exception(
+            span, exc, record_exception, set_status_on_exception
+        )
         raise
 
     finally:
@@ -548,6 +674,7 @@ def use_span(
 
 
 __all__ = [
+    "AttributeSchema",
     "DEFAULT_TRACE_OPTIONS",
     "DEFAULT_TRACE_STATE",
     "INVALID_SPAN",
@@ -563,6 +690,7 @@ __all__ = [
     "TraceState",
     "TracerProvider",
     "Tracer",
+    "activate_span",
     "format_span_id",
     "format_trace_id",
     "get_current_span",
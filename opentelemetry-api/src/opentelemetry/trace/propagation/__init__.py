@@ -13,7 +13,13 @@
 # limitations under the License.
 from typing import Optional
 
-from opentelemetry.context import create_key, get_value, set_value
+from opentelemetry.context import (
+    attach,
+    create_key,
+    get_current,
+    get_value,
+    set_value,
+)
 from opentelemetry.context.context import Context
 from opentelemetry.trace.span import INVALID_SPAN, Span
 
@@ -35,6 +41,30 @@ def set_span_in_context(
     return ctx
 
 
+def activate_span(span: Span, context: Optional[Context] = None) -> object:
+    """Makes the span the current span.
+
+    The same as ``attach(set_span_in_context(span, context))``, but the
+    context is copied once instead of twice, and not at all if the span is
+    already set in it.
+
+    Args:
+        span: The Span to activate.
+        context: a Context object. if one is not passed, the
+            default current context is used instead.
+
+    Returns:
+        A token that can be used with `opentelemetry.context.detach` to
+        restore the previous context.
+    """
+    if context is None:
+        context = get_current()
+    if context.get(_SPAN_KEY) is not span:
+        # Context forbids item assignment, so build it in one pass
+        context = Context(context, **{_SPAN_KEY: span})
+    return attach(context)
+
+
 def get_current_span(context: Optional[Context] = None) -> Span:
     """Retrieve the current span.
 
@@ -14,16 +14,23 @@
 #
 import re
 import typing
+from functools import lru_cache
 
 import opentelemetry.trace as trace
 from opentelemetry.context.context import Context
 from opentelemetry.propagators import textmap
-from opentelemetry.trace import format_span_id, format_trace_id
 from opentelemetry.trace.span import TraceState
 
 
 class TraceContextTextMapPropagator(textmap.TextMapPropagator):
-    """Extracts and injects using w3c TraceContext's headers."""
+    """Extracts and injects using w3c TraceContext's headers.
+
+    Args:
+        cache_size: The number of distinct headers whose extracted
+            `opentelemetry.trace.SpanContext` is kept in a least recently
+            used cache, to skip parsing headers that are seen repeatedly.
+            Disabled by default.
+    """
 
     _TRACEPARENT_HEADER_NAME = "traceparent"
     _TRACESTATE_HEADER_NAME = "tracestate"
@@ -33,6 +40,13 @@ class TraceContextTextMapPropagator(textmap.TextMapPropagator):
     )
     _TRACEPARENT_HEADER_FORMAT_RE = re.compile(_TRACEPARENT_HEADER_FORMAT)
 
+    def __init__(self, cache_size: int = 0) -> None:
+        if cache_size > 0:
+            # span contexts are immutable, so they can be shared
+            self._get_span_context = lru_cache(maxsize=cache_size)(
+                self._get_span_context
+            )
+
     def extract(
         self,
         carrier: textmap.CarrierT,
@@ -51,40 +65,50 @@ class TraceContextTextMapPropagator(textmap.TextMapPropagator):
         if not header:
             return context
 
-        match = re.search(self._TRACEPARENT_HEADER_FORMAT_RE, header[0])
-        if not match:
+        tracestate_headers = getter.get(carrier, self._TRACESTATE_HEADER_NAME)
+        if tracestate_headers is not None:
+            tracestate_headers = tuple(tracestate_headers)
+
+        span_context = self._get_span_context(header[0], tracestate_headers)
+        if span_context is None:
             return context
+        return trace.set_span_in_context(
+            trace.NonRecordingSpan(span_context), context
+        )
 
-        version = match.group(1)
-        trace_id = match.group(2)
-        span_id = match.group(3)
-        trace_flags = match.group(4)
+    def _get_span_context(
+        self,
+        traceparent: str,
+        tracestate_headers: typing.Optional[typing.Tuple[str, ...]],
+    ) -> typing.Optional[trace.SpanContext]:
+        match = self._TRACEPARENT_HEADER_FORMAT_RE.match(traceparent)
+        if not match:
+            return None
 
-        if trace_id == "0" * 32 or span_id == "0" * 16:
-            return context
+        version, trace_id, span_id, trace_flags, residue = match.groups()
+        if version == "ff" or (version == "00" and residue):
+            return None
 
-        if version == "00":
-            if match.group(5):
-                return context
-        if version == "ff":
-            return context
+        trace_id = int(trace_id, 16)
+        span_id = int(span_id, 16)
+        if (
+            trace_id == trace.INVALID_TRACE_ID
+            or span_id == trace.INVALID_SPAN_ID
+        ):
+            return None
 
-        tracestate_headers = getter.get(carrier, self._TRACESTATE_HEADER_NAME)
         if tracestate_headers is None:
             tracestate = None
         else:
             tracestate = TraceState.from_header(tracestate_headers)
 
-        span_context = trace.SpanContext(
-            trace_id=int(trace_id, 16),
-            span_id=int(span_id, 16),
+        return trace.SpanContext(
+            trace_id=trace_id,
+            span_id=span_id,
             is_remote=True,
-            trace_flags=trace.TraceFlags(trace_flags),
+            trace_flags=trace.TraceFlags(int(trace_flags, 16)),
             trace_state=tracestate,
         )
-        return trace.set_span_in_context(
-            trace.NonRecordingSpan(span_context), context
-        )
 
     def inject(
         self,
@@ -100,10 +124,10 @@ class TraceContextTextMapPropagator(textmap.TextMapPropagator):
         span_context = span.get_span_context()
         if span_context == trace.INVALID_SPAN_CONTEXT:
             return
-        traceparent_string = "00-{trace_id}-{span_id}-{:02x}".format(
+        traceparent_string = "00-%032x-%016x-%02x" % (
+            span_context.trace_id,
+            span_context.span_id,
             span_context.trace_flags,
-            trace_id=format_trace_id(span_context.trace_id),
-            span_id=format_span_id(span_context.span_id),
         )
         setter.set(carrier, self._TRACEPARENT_HEADER_NAME, traceparent_string)
         if span_context.trace_state:
@@ -39,7 +39,6 @@ _VALUE_PATTERN = re.compile(_VALUE_FORMAT)
 
 
 _TRACECONTEXT_MAXIMUM_TRACESTATE_KEYS = 32
-_delimiter_pattern = re.compile(r"[ \t]*,[ \t]*")
 _member_pattern = re.compile(
     "({})(=)({})[ \t]*".format(_KEY_FORMAT, _VALUE_FORMAT)
 )
@@ -59,6 +58,8 @@ def _is_valid_pair(key: str, value: str) -> bool:
 class Span(abc.ABC):
     """A span represents a single operation within a trace."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def end(self, end_time: typing.Optional[int] = None) -> None:
         """Sets the current time as the span's end time.
@@ -335,7 +336,7 @@ class TraceState(typing.Mapping[str, str]):
             A string that adheres to the w3c tracestate
             header format.
         """
-        return ",".join(key + "=" + value for key, value in self._dict.items())
+        return ",".join(map("=".join, self._dict.items()))
 
     @classmethod
     def from_header(cls, header_list: typing.List[str]) -> "TraceState":
@@ -354,9 +355,10 @@ class TraceState(typing.Mapping[str, str]):
             If the number of keys is beyond the maximum, all values
             will be discarded and an empty tracestate will be returned.
         """
-        pairs = OrderedDict()
+        pairs = OrderedDict()  # type: OrderedDict[str, str]
         for header in header_list:
-            for member in re.split(_delimiter_pattern, header):
+            for member in header.split(","):
+                member = member.strip(" \t")
                 # empty members are valid, but no need to process further.
                 if not member:
                     continue
@@ -372,7 +374,16 @@ class TraceState(typing.Mapping[str, str]):
                 if key in pairs:
                     return cls()
                 pairs[key] = value
-        return cls(list(pairs.items()))
+        if len(pairs) > _TRACECONTEXT_MAXIMUM_TRACESTATE_KEYS:
+            _logger.warning(
+                "There can't be more than %s key/value pairs.",
+                _TRACECONTEXT_MAXIMUM_TRACESTATE_KEYS,
+            )
+            return cls()
+        # the members are already validated, skip doing it again in __init__
+        trace_state = cls()
+        trace_state._dict = pairs  # pylint: disable=protected-access
+        return trace_state
 
     @classmethod
     def get_default(cls) -> "TraceState":
@@ -491,6 +502,8 @@ class NonRecordingSpan(Span):
     All operations are no-op except context propagation.
     """
 
+    __slots__ = ("_context",)
+
     def __init__(self, context: "SpanContext") -> None:
         self._context = context
 
@@ -15,10 +15,12 @@
 # type: ignore
 
 import collections
+import threading
 import unittest
 
 from opentelemetry.attributes import (
     BoundedAttributes,
+    _clean_attribute_value,
     _filter_attributes,
     _is_valid_attribute_value,
 )
@@ -47,6 +49,28 @@ class TestAttributes(unittest.TestCase):
         self.assertFalse(_is_valid_attribute_value(["A", None, 1]))
         self.assertFalse(_is_valid_attribute_value([None, "A", None, 1]))
 
+    def test_clean_attribute_value(self):
+        values = (True, "hi", 3.4, 15, (1, 2, 3), ("A", None), ())
+        for value in values:
+            self.assertIs(_clean_attribute_value(value), value)
+
+        self.assertEqual(_clean_attribute_value([1, 2, 3]), (1, 2, 3))
+        self.assertEqual(_clean_attribute_value(["A", None]), ("A", None))
+        self.assertEqual(_clean_attribute_value([]), ())
+        self.assertEqual(_clean_attribute_value([1, True]), (1, True))
+        self.assertEqual(_clean_attribute_value(b"hello"), "hello")
+
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(_clean_attribute_value(b"\xd8\xe1"))
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(_clean_attribute_value([True, 1]))
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(_clean_attribute_value([1, 2.0]))
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(_clean_attribute_value({}))
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(_clean_attribute_value(None))
+
     def test_filter_attributes(self):
         attrs_with_invalid_keys = {
             "": "empty-key",
@@ -168,6 +192,24 @@ class TestBoundedAttributes(unittest.TestCase):
         for num in range(100):
             self.assertEqual(bdict[num], num)
 
+    def test_concurrent_writes(self):
+        bdict = BoundedAttributes(maxlen=10, immutable=False)
+
+        def write(thread_index):
+            for index in range(100):
+                bdict["key{}.{}".format(thread_index, index)] = index
+
+        threads = [
+            threading.Thread(target=write, args=(index,)) for index in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(bdict), 10)
+        self.assertEqual(bdict.dropped, 790)
+
     def test_immutable(self):
         bdict = BoundedAttributes()
         with self.assertRaises(TypeError):
@@ -40,6 +40,30 @@ class TestBaggagePropagation(unittest.TestCase):
         self.propagator.inject(output, context=ctx)
         return output.get("baggage")
 
+    def test_extract_cached(self):
+        with patch.object(
+            W3CBaggagePropagator,
+            "_get_entries",
+            autospec=True,
+            side_effect=W3CBaggagePropagator._get_entries,
+        ) as mock_get_entries:
+            propagator = W3CBaggagePropagator(cache_size=2)
+            for _ in range(2):
+                ctx = propagator.extract({"baggage": ["key1=val1,key2=val2"]})
+                self.assertEqual(
+                    baggage.get_all(ctx), {"key1": "val1", "key2": "val2"}
+                )
+            self.assertEqual(mock_get_entries.call_count, 1)
+
+        # the extracted entries are merged with the ones of the context
+        ctx = propagator.extract(
+            {"baggage": ["key1=val1"]},
+            baggage.set_baggage("key3", "val3"),
+        )
+        self.assertEqual(
+            baggage.get_all(ctx), {"key1": "val1", "key3": "val3"}
+        )
+
     def test_no_context_header(self):
         baggage_entries = baggage.get_all(self.propagator.extract({}))
         self.assertEqual(baggage_entries, {})
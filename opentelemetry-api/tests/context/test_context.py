@@ -61,6 +61,17 @@ class TestContext(unittest.TestCase):
         self.assertEqual("---", context.get_value("a", context=third))
         self.assertEqual(None, context.get_value("a"))
 
+    def test_set_same_value(self):
+        value = object()
+        first = context.set_value("a", value)
+        self.assertIs(context.set_value("a", value, first), first)
+        self.assertIsNot(context.set_value("a", object(), first), first)
+        # None values are set like any other value
+        second = context.set_value("b", None, first)
+        self.assertIsNot(second, first)
+        self.assertIn("b", second)
+        self.assertIs(context.set_value("b", None, second), second)
+
     def test_context_is_immutable(self):
         with self.assertRaises(ValueError):
             # ensure a context
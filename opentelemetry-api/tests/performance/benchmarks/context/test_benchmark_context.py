@@ -0,0 +1,50 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from opentelemetry import context
+
+_KEY = context.create_key("benchmark")
+
+
+def test_get_current(benchmark):
+    benchmark(context.get_current)
+
+
+def test_get_value(benchmark):
+    token = context.attach(context.set_value(_KEY, "value"))
+    benchmark(context.get_value, _KEY)
+    context.detach(token)
+
+
+def test_set_value(benchmark):
+    benchmark(context.set_value, _KEY, "value")
+
+
+def test_attach_detach(benchmark):
+    new_context = context.set_value(_KEY, "value")
+
+    def attach_detach():
+        context.detach(context.attach(new_context))
+
+    benchmark(attach_detach)
+
+
+def test_activate(benchmark):
+    """Sets a value in the current context and makes it current, as done
+    for every span made current."""
+
+    def activate():
+        context.detach(context.attach(context.set_value(_KEY, object())))
+
+    benchmark(activate)
@@ -0,0 +1,65 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from opentelemetry import trace
+from opentelemetry.trace.propagation import tracecontext
+from opentelemetry.trace.span import TraceState
+
+FORMAT = tracecontext.TraceContextTextMapPropagator()
+
+_TRACEPARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+_TRACESTATE = "congo=t61rcWkgMzE,rojo=00f067aa0ba902b7"
+
+
+def test_extract_traceparent(benchmark):
+    benchmark(FORMAT.extract, {"traceparent": [_TRACEPARENT]})
+
+
+def test_extract_traceparent_and_tracestate(benchmark):
+    benchmark(
+        FORMAT.extract,
+        {"traceparent": [_TRACEPARENT], "tracestate": [_TRACESTATE]},
+    )
+
+
+def test_extract_cached(benchmark):
+    benchmark(
+        tracecontext.TraceContextTextMapPropagator(cache_size=128).extract,
+        {"traceparent": [_TRACEPARENT], "tracestate": [_TRACESTATE]},
+    )
+
+
+def test_inject(benchmark):
+    context = FORMAT.extract(
+        {"traceparent": [_TRACEPARENT], "tracestate": [_TRACESTATE]}
+    )
+    benchmark(FORMAT.inject, {}, context)
+
+
+def test_tracestate_from_header(benchmark):
+    benchmark(TraceState.from_header, [_TRACESTATE])
+
+
+def test_inject_no_tracestate(benchmark):
+    context = trace.set_span_in_context(
+        trace.NonRecordingSpan(
+            trace.SpanContext(
+                0x4BF92F3577B34DA6A3CE929D0E0E4736,
+                0x00F067AA0BA902B7,
+                is_remote=False,
+                trace_flags=trace.TraceFlags(trace.TraceFlags.SAMPLED),
+            )
+        )
+    )
+    benchmark(FORMAT.inject, {}, context)
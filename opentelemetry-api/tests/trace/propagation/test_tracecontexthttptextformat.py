@@ -175,6 +175,70 @@ class TestTraceContextFormat(unittest.TestCase):
         )
         self.assertEqual(span.get_span_context(), trace.INVALID_SPAN_CONTEXT)
 
+    def test_trace_flags(self):
+        """Trace flags are parsed and injected as hexadecimal."""
+        for trace_flags in ("01", "0a", "ff"):
+            with self.subTest(trace_flags=trace_flags):
+                traceparent = (
+                    "00-12345678901234567890123456789012-1234567890123456-"
+                    + trace_flags
+                )
+                span = trace.get_current_span(
+                    FORMAT.extract({"traceparent": [traceparent]})
+                )
+                self.assertEqual(
+                    span.get_span_context().trace_flags,
+                    int(trace_flags, 16),
+                )
+                output = {}  # type:typing.Dict[str, str]
+                FORMAT.inject(output, trace.set_span_in_context(span))
+                self.assertEqual(output["traceparent"], traceparent)
+
+    def test_future_version(self):
+        """Headers of future versions may have more fields."""
+        span = trace.get_current_span(
+            FORMAT.extract(
+                {
+                    "traceparent": [
+                        "01-12345678901234567890123456789012-"
+                        "1234567890123456-01-residue"
+                    ],
+                },
+            )
+        )
+        self.assertEqual(span.get_span_context().trace_id, self.TRACE_ID)
+        self.assertEqual(span.get_span_context().span_id, self.SPAN_ID)
+
+    def test_extract_cached(self):
+        propagator = tracecontext.TraceContextTextMapPropagator(cache_size=2)
+
+        def get_span_context(carrier):
+            return trace.get_current_span(
+                propagator.extract(carrier)
+            ).get_span_context()
+
+        traceparent = "00-12345678901234567890123456789012-1234567890123456-01"
+        span_context = get_span_context(
+            {"traceparent": [traceparent], "tracestate": ["foo=1"]}
+        )
+        self.assertEqual(span_context.trace_state, {"foo": "1"})
+        self.assertIs(
+            get_span_context(
+                {"traceparent": [traceparent], "tracestate": ["foo=1"]}
+            ),
+            span_context,
+        )
+        # the tracestate is part of the cached headers
+        self.assertEqual(
+            get_span_context({"traceparent": [traceparent]}).trace_state, {}
+        )
+        self.assertEqual(
+            get_span_context(
+                {"traceparent": [traceparent], "tracestate": ["bar=2"]}
+            ).trace_state,
+            {"bar": "2"},
+        )
+
     def test_propagate_invalid_context(self):
         """Do not propagate invalid trace context."""
         output = {}  # type:typing.Dict[str, str]
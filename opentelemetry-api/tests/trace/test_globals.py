@@ -63,6 +63,31 @@ class TestTracer(unittest.TestCase):
 
 
 class TestUseTracer(unittest.TestCase):
+    def test_activate_span(self):
+        span = trace.NonRecordingSpan(trace.INVALID_SPAN_CONTEXT)
+        token = trace.activate_span(span)
+        try:
+            self.assertIs(trace.get_current_span(), span)
+        finally:
+            context.detach(token)
+        self.assertEqual(trace.get_current_span(), trace.INVALID_SPAN)
+
+        ctx = context.set_value("key", "value")
+        token = trace.activate_span(span, ctx)
+        try:
+            self.assertIs(trace.get_current_span(), span)
+            self.assertEqual(context.get_value("key"), "value")
+        finally:
+            context.detach(token)
+
+        ctx = trace.set_span_in_context(span)
+        token = trace.activate_span(span, ctx)
+        try:
+            # the span is already set, the context is attached as is
+            self.assertIs(context.get_current(), ctx)
+        finally:
+            context.detach(token)
+
     def test_use_span(self):
         self.assertEqual(trace.get_current_span(), trace.INVALID_SPAN)
         span = trace.NonRecordingSpan(trace.INVALID_SPAN_CONTEXT)
@@ -54,6 +54,13 @@ class TestProxy(unittest.TestCase):
         with tracer.start_as_current_span("span2") as span:
             self.assertIsInstance(span, trace.NonRecordingSpan)
 
+        # schemas compiled before the real provider is set start their
+        # spans through the proxy
+        schema = tracer.compile_attributes({"key": str})
+        self.assertIsInstance(
+            schema.start_span("span3", ("value",)), trace.NonRecordingSpan
+        )
+
         # set a real provider
         trace.set_tracer_provider(TestProvider())
 
@@ -68,5 +75,15 @@ class TestProxy(unittest.TestCase):
         # creates real spans
         with tracer.start_span("") as span:
             self.assertIsInstance(span, TestSpan)
+        self.assertIsInstance(schema.start_span("", ("value",)), TestSpan)
+        self.assertIsInstance(
+            tracer.compile_attributes({"key": str})._tracer, TestTracer
+        )
+
+        # once resolved, spans are started by the real tracer directly
+        self.assertIsInstance(tracer.start_span.__self__, TestTracer)
+        self.assertIsInstance(
+            tracer.start_as_current_span.__self__, TestTracer
+        )
 
         trace._TRACER_PROVIDER = original_provider
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import unittest
+from unittest import mock
 
 from opentelemetry import trace
 
@@ -35,3 +36,34 @@ class TestTracer(unittest.TestCase):
             trace.get_current_span().set_attribute("test", "test")
             self.assertEqual(span, trace.INVALID_SPAN)
             self.assertFalse(hasattr("span", "attributes"))
+
+    def test_compile_attributes(self):
+        schema = self.tracer.compile_attributes({"key": str, "other": int})
+        self.assertIsInstance(schema, trace.AttributeSchema)
+        self.assertEqual(schema.keys, ("key", "other"))
+        self.assertEqual(
+            schema.start_span("", ("value", 1)), trace.INVALID_SPAN
+        )
+        with self.assertRaises(ValueError):
+            schema.start_span("", ("value",))
+
+    def test_compile_attributes_start_span(self):
+        tracer = mock.Mock(spec=trace.Tracer)
+        schema = trace.AttributeSchema(tracer, {"key": str, "other": int})
+
+        span = schema.start_span("name", ("value", None))
+
+        self.assertIs(span, tracer.start_span.return_value)
+        tracer.start_span.assert_called_once_with(
+            "name",
+            context=None,
+            kind=trace.SpanKind.INTERNAL,
+            attributes={"key": "value"},
+            links=None,
+            start_time=None,
+            record_exception=True,
+            set_status_on_exception=True,
+        )
+
+        schema.set_attributes(span, (None, 1))
+        span.set_attributes.assert_called_once_with({"other": 1})
@@ -82,6 +82,20 @@ class TestTraceContextFormat(unittest.TestCase):
         state = TraceState.from_header(header_list)
         self.assertEqual(state.to_header(), ",".join(entries))
 
+    def test_tracestate_from_header_whitespace(self):
+        state = TraceState.from_header([" foo=1 ,\tbar=2\t", "baz=3 "])
+        self.assertEqual(state.to_header(), "foo=1,bar=2,baz=3")
+
+    def test_tracestate_from_header_invalid(self):
+        for header_list in (
+            ["foo=1,bar"],
+            ["foo=1", "foo=2"],
+            ["Foo=1"],
+            [",".join("key{}=value".format(index) for index in range(33))],
+        ):
+            with self.subTest(header_list=header_list):
+                self.assertEqual(len(TraceState.from_header(header_list)), 0)
+
     def test_tracestate_order_changed(self):
         entries = [
             "1a-2f@foo=bar1",
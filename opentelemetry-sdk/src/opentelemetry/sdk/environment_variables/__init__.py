@@ -98,6 +98,55 @@ The :envvar:`OTEL_BSP_MAX_EXPORT_BATCH_SIZE` represents the maximum batch size f
 Default: 512
 """
 
+OTEL_PYTHON_BSP_QUEUE_TYPE = "OTEL_PYTHON_BSP_QUEUE_TYPE"
+"""
+.. envvar:: OTEL_PYTHON_BSP_QUEUE_TYPE
+
+The :envvar:`OTEL_PYTHON_BSP_QUEUE_TYPE` selects the queue used by the batch span processor to
+hold ended spans. ``shared`` uses a single queue for all threads, ``per_thread`` gives every
+thread ending spans its own buffer that the export thread drains in bulk.
+Default: "shared"
+"""
+
+OTEL_PYTHON_BSP_EXPORT_WORKERS = "OTEL_PYTHON_BSP_EXPORT_WORKERS"
+"""
+.. envvar:: OTEL_PYTHON_BSP_EXPORT_WORKERS
+
+The :envvar:`OTEL_PYTHON_BSP_EXPORT_WORKERS` represents the maximum number of batches the batch
+span processor exports in parallel. Values greater than 1 require an exporter that supports
+concurrent calls to ``export``.
+Default: 1
+"""
+
+OTEL_PYTHON_BSP_ADAPTIVE_BATCHING = "OTEL_PYTHON_BSP_ADAPTIVE_BATCHING"
+"""
+.. envvar:: OTEL_PYTHON_BSP_ADAPTIVE_BATCHING
+
+The :envvar:`OTEL_PYTHON_BSP_ADAPTIVE_BATCHING` enables the adaptive mode of the batch span processor
+when set to ``true``. In adaptive mode :envvar:`OTEL_BSP_MAX_EXPORT_BATCH_SIZE` and
+:envvar:`OTEL_BSP_SCHEDULE_DELAY` are upper bounds and the actual values are tuned from the observed
+exports.
+Default: "false"
+"""
+
+OTEL_PYTHON_BSP_SPILL_DIRECTORY = "OTEL_PYTHON_BSP_SPILL_DIRECTORY"
+"""
+.. envvar:: OTEL_PYTHON_BSP_SPILL_DIRECTORY
+
+The :envvar:`OTEL_PYTHON_BSP_SPILL_DIRECTORY` represents the directory the batch span processor
+writes spans to when its queue is full or an export fails. Spans are kept on disk until they are
+exported, also across restarts. Spilling is disabled when unset.
+"""
+
+OTEL_PYTHON_BSP_SPILL_MAX_BYTES = "OTEL_PYTHON_BSP_SPILL_MAX_BYTES"
+"""
+.. envvar:: OTEL_PYTHON_BSP_SPILL_MAX_BYTES
+
+The :envvar:`OTEL_PYTHON_BSP_SPILL_MAX_BYTES` represents the maximum number of bytes the batch span
+processor writes to :envvar:`OTEL_PYTHON_BSP_SPILL_DIRECTORY`.
+Default: 67108864
+"""
+
 OTEL_SPAN_ATTRIBUTE_COUNT_LIMIT = "OTEL_SPAN_ATTRIBUTE_COUNT_LIMIT"
 """
 .. envvar:: OTEL_SPAN_ATTRIBUTE_COUNT_LIMIT
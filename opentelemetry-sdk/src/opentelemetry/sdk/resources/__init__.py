@@ -59,8 +59,9 @@ import abc
 import concurrent.futures
 import logging
 import os
+import threading
 import typing
-from json import dumps
+import weakref
 
 import pkg_resources
 
@@ -139,7 +140,12 @@ _OPENTELEMETRY_SDK_VERSION = pkg_resources.get_distribution(
 
 
 class Resource:
-    """A Resource is an immutable representation of the entity producing telemetry as Attributes."""
+    """A Resource is an immutable representation of the entity producing telemetry as Attributes.
+
+    The hash of a resource is computed once when it is created. Resources
+    returned by `create` and `merge` are shared between callers creating
+    resources with the same attributes and schema URL.
+    """
 
     def __init__(
         self, attributes: Attributes, schema_url: typing.Optional[str] = None
@@ -148,6 +154,17 @@ class Resource:
         if schema_url is None:
             schema_url = ""
         self._schema_url = schema_url
+        # attribute keys are unique, sorting never compares the values
+        self._key = (
+            tuple(
+                sorted(
+                    (key, _typed_value(value))
+                    for key, value in self._attributes.items()
+                )
+            ),
+            schema_url,
+        )
+        self._hash = hash(self._key)
 
     @staticmethod
     def create(
@@ -178,7 +195,7 @@ class Resource:
             resource = resource.merge(
                 Resource({SERVICE_NAME: default_service_name}, schema_url)
             )
-        return resource
+        return _intern(resource)
 
     @staticmethod
     def get_empty() -> "Resource":
@@ -226,20 +243,44 @@ class Resource:
             )
             return self
 
-        return Resource(merged_attributes, schema_url)
+        return _intern(Resource(merged_attributes, schema_url))
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Resource):
             return False
-        return (
-            self._attributes == other._attributes
-            and self._schema_url == other._schema_url
-        )
+        return self._hash == other._hash and self._key == other._key
 
     def __hash__(self):
-        return hash(
-            f"{dumps(self._attributes.copy(), sort_keys=True)}|{self._schema_url}"
-        )
+        return self._hash
+
+
+def _typed_value(value: object) -> object:
+    """Returns a hashable form of an attribute value that also holds its
+    type, as 1, 1.0 and True are equal in Python but are exported as
+    different types."""
+    if isinstance(value, tuple):
+        return tuple, tuple((type(element), element) for element in value)
+    return type(value), value
+
+
+# resources returned by create and merge, by attributes and schema URL
+_INTERNED_RESOURCES = (
+    weakref.WeakValueDictionary()
+)  # type: weakref.WeakValueDictionary
+_INTERNED_RESOURCES_LOCK = threading.Lock()
+
+
+def _intern(resource: Resource) -> Resource:
+    """Returns the shared resource equal to ``resource``."""
+    # pylint: disable=protected-access
+    with _INTERNED_RESOURCES_LOCK:
+        interned = _INTERNED_RESOURCES.get(resource._key)
+        if interned is None:
+            _INTERNED_RESOURCES[resource._key] = resource
+            return resource
+        return interned
 
 
 _EMPTY_RESOURCE = Resource({})
@@ -29,7 +29,6 @@ from typing import (
     Callable,
     Dict,
     Iterator,
-    MutableSequence,
     Optional,
     Sequence,
     Tuple,
@@ -41,7 +40,8 @@ from opentelemetry import context as context_api
 from opentelemetry import trace as trace_api
 from opentelemetry.attributes import (
     BoundedAttributes,
-    _is_valid_attribute_value,
+    _clean_attribute_value,
+    _filter_attributes,
 )
 from opentelemetry.sdk import util
 from opentelemetry.sdk.environment_variables import (
@@ -72,6 +72,101 @@ _ENV_VALUE_UNSET = "unset"
 
 # pylint: disable=protected-access
 _TRACE_SAMPLER = sampling._get_from_env_or_default()
+_SAMPLED_TRACE_FLAGS = trace_api.TraceFlags(trace_api.TraceFlags.SAMPLED)
+
+class _SpanAttributes(BoundedAttributes):
+    """`BoundedAttributes` without a lock of their own.
+
+    A span writes to its attributes under its own lock only, and the
+    attributes of its events are never written to once created.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        maxlen: Optional[int],
+        attributes: types.Attributes = None,
+        immutable: bool = True,
+    ):
+        # pylint: disable=super-init-not-called
+        self.maxlen = maxlen
+        self.dropped = 0
+        self._dict = {}  # type: dict
+        self._immutable = False
+        if attributes:
+            _filter_attributes(attributes)
+            for key, value in attributes.items():
+                self[key] = value
+        self._immutable = immutable
+
+    def __setitem__(self, key, value):
+        if self._immutable:
+            raise TypeError("BoundedAttributes is immutable")
+        if self.maxlen is not None and self.maxlen == 0:
+            self.dropped += 1
+            return
+
+        if key in self._dict:
+            del self._dict[key]
+        elif self.maxlen is not None and len(self._dict) == self.maxlen:
+            del self._dict[next(iter(self._dict.keys()))]
+            self.dropped += 1
+        self._dict[key] = value
+
+    def __delitem__(self, key):
+        if self._immutable:
+            raise TypeError("BoundedAttributes is immutable")
+        del self._dict[key]
+
+    def __iter__(self):
+        # copying is atomic, readers can iterate while the span is written to
+        return iter(self._dict.copy())
+
+
+class _SpanList(BoundedList):
+    """`BoundedList` without a lock of its own, a span writes to its events
+    and links under its own lock only."""
+
+    __slots__ = ()
+
+    def __init__(self, maxlen: Optional[int]):
+        # pylint: disable=super-init-not-called
+        self.dropped = 0
+        self._maxlen = maxlen
+        self._list = []  # type: list
+        self._immutable = False
+
+    def __iter__(self):
+        # copying is atomic, readers can iterate while the span is written to
+        return iter(self._list.copy())
+
+    def append(self, item):
+        if self._immutable:
+            raise TypeError("BoundedList is immutable")
+        if self._maxlen is not None and len(self._list) >= self._maxlen:
+            self.dropped += 1
+            if not self._list:
+                return
+            del self._list[0]
+        self._list.append(item)
+
+    def extend(self, seq):
+        if self._immutable:
+            raise TypeError("BoundedList is immutable")
+        self._list.extend(seq)
+        if self._maxlen is not None:
+            to_drop = len(self._list) - self._maxlen
+            if to_drop > 0:
+                self.dropped += to_drop
+                del self._list[:to_drop]
+
+
+# shared by the spans and events without attributes, events or links, the
+# containers of a span are created on first write
+_EMPTY_ATTRIBUTES = _SpanAttributes(0)
+_EMPTY_LIST = _SpanList(0)
+_EMPTY_LIST._immutable = True
 
 
 class SpanProcessor:
@@ -196,6 +291,9 @@ class ConcurrentMultiSpanProcessor(SpanProcessor):
     submitting them to a thread pool executor and waiting until each span
     processor finished its work.
 
+    The thread pool executor is replaced in child processes created with
+    `os.fork` as its threads do not survive the fork.
+
     Args:
         num_threads: The number of threads managed by the thread pool executor
             and thus defining how many span processors can work in parallel.
@@ -206,9 +304,20 @@ class ConcurrentMultiSpanProcessor(SpanProcessor):
         # iterating through it on "on_start" and "on_end".
         self._span_processors = ()  # type: Tuple[SpanProcessor, ...]
         self._lock = threading.Lock()
+        self._num_threads = num_threads
         self._executor = concurrent.futures.ThreadPoolExecutor(
             max_workers=num_threads
         )
+        util._register_at_fork_reinit(  # pylint: disable=protected-access
+            self._at_fork_reinit
+        )
+
+    def _at_fork_reinit(self) -> None:
+        self._lock = threading.Lock()
+        # the executor starts its threads on demand
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._num_threads
+        )
 
     def add_span_processor(self, span_processor: SpanProcessor) -> None:
         """Adds a SpanProcessor to the list handled by this instance."""
@@ -275,6 +384,8 @@ class ConcurrentMultiSpanProcessor(SpanProcessor):
 
 
 class EventBase(abc.ABC):
+    __slots__ = ("_name", "_timestamp")
+
     def __init__(self, name: str, timestamp: Optional[int] = None) -> None:
         self._name = name
         if timestamp is None:
@@ -307,6 +418,8 @@ class Event(EventBase):
             automatically.
     """
 
+    __slots__ = ("_attributes",)
+
     def __init__(
         self,
         name: str,
@@ -340,6 +453,21 @@ def _check_span_ended(func):
 class ReadableSpan:
     """Provides read-only access to span attributes"""
 
+    __slots__ = (
+        "_name",
+        "_context",
+        "_kind",
+        "_instrumentation_info",
+        "_parent",
+        "_start_time",
+        "_end_time",
+        "_attributes",
+        "_events",
+        "_links",
+        "_resource",
+        "_status",
+    )
+
     def __init__(
         self,
         name: str = None,
@@ -643,7 +771,10 @@ class Span(trace_api.Span, ReadableSpan):
     """See `opentelemetry.trace.Span`.
 
     Users should create `Span` objects via the `Tracer` instead of this
-    constructor.
+    constructor. Ended spans are passed to the span processors as they are,
+    without being copied: `SpanProcessor.on_end` receives the `Span` itself,
+    whose attributes, events and links were frozen when it ended. Modifying
+    them raises `TypeError`.
 
     Args:
         name: The name of the operation this span represents
@@ -661,6 +792,16 @@ class Span(trace_api.Span, ReadableSpan):
         limits: `SpanLimits` instance that was passed to the `TracerProvider`
     """
 
+    __slots__ = (
+        "_sampler",
+        "_trace_config",
+        "_record_exception",
+        "_set_status_on_exception",
+        "_span_processor",
+        "_limits",
+        "_lock",
+    )
+
     def __new__(cls, *args, **kwargs):
         if cls is Span:
             raise TypeError("Span must be instantiated via a tracer.")
@@ -699,22 +840,27 @@ class Span(trace_api.Span, ReadableSpan):
         self._set_status_on_exception = set_status_on_exception
         self._span_processor = span_processor
         self._limits = limits
+        # guards the span and its containers, which have no lock of their own
         self._lock = threading.Lock()
-        self._attributes = BoundedAttributes(
-            self._limits.max_attributes, attributes, immutable=False
-        )
-        self._events = self._new_events()
+        if attributes:
+            self._attributes = _SpanAttributes(
+                self._limits.max_attributes, attributes, immutable=False
+            )
+        else:
+            self._attributes = _EMPTY_ATTRIBUTES
+        self._events = _EMPTY_LIST
         if events:
+            self._events = self._new_events()
             for event in events:
-                event._attributes = BoundedAttributes(
+                event._attributes = _SpanAttributes(
                     self._limits.max_event_attributes, event.attributes
                 )
                 self._events.append(event)
 
-        if links is None:
-            self._links = self._new_links()
+        if links:
+            self._links = _SpanList.from_seq(self._limits.max_links, links)
         else:
-            self._links = BoundedList.from_seq(self._limits.max_links, links)
+            self._links = _EMPTY_LIST
 
     def __repr__(self):
         return '{}(name="{}", context={})'.format(
@@ -722,10 +868,10 @@ class Span(trace_api.Span, ReadableSpan):
         )
 
     def _new_events(self):
-        return BoundedList(self._limits.max_events)
+        return _SpanList(self._limits.max_events)
 
     def _new_links(self):
-        return BoundedList(self._limits.max_links)
+        return _SpanList(self._limits.max_links)
 
     def get_span_context(self):
         return self._context
@@ -739,25 +885,18 @@ class Span(trace_api.Span, ReadableSpan):
                 return
 
             for key, value in attributes.items():
-                if not _is_valid_attribute_value(value):
+                value = _clean_attribute_value(value)
+                if value is None:
                     continue
 
                 if not key:
                     logger.warning("invalid key `%s` (empty or null)", key)
                     continue
 
-                # Freeze mutable sequences defensively
-                if isinstance(value, MutableSequence):
-                    value = tuple(value)
-                if isinstance(value, bytes):
-                    try:
-                        value = value.decode()
-                    except ValueError:
-                        logger.warning(
-                            "Byte attribute could not be decoded for key `%s`.",
-                            key,
-                        )
-                        return
+                if self._attributes is _EMPTY_ATTRIBUTES:
+                    self._attributes = _SpanAttributes(
+                        self._limits.max_attributes, immutable=False
+                    )
                 self._attributes[key] = value
 
     def set_attribute(self, key: str, value: types.AttributeValue) -> None:
@@ -765,6 +904,8 @@ class Span(trace_api.Span, ReadableSpan):
 
     @_check_span_ended
     def _add_event(self, event: EventBase) -> None:
+        if self._events is _EMPTY_LIST:
+            self._events = self._new_events()
         self._events.append(event)
 
     def add_event(
@@ -773,9 +914,12 @@ class Span(trace_api.Span, ReadableSpan):
         attributes: types.Attributes = None,
         timestamp: Optional[int] = None,
     ) -> None:
-        attributes = BoundedAttributes(
-            self._limits.max_event_attributes, attributes
-        )
+        if attributes:
+            attributes = _SpanAttributes(
+                self._limits.max_event_attributes, attributes
+            )
+        else:
+            attributes = _EMPTY_ATTRIBUTES
         self._add_event(
             Event(
                 name=name,
@@ -784,21 +928,29 @@ class Span(trace_api.Span, ReadableSpan):
             )
         )
 
-    def _readable_span(self) -> ReadableSpan:
-        return ReadableSpan(
-            name=self._name,
-            context=self._context,
-            parent=self._parent,
-            resource=self._resource,
-            attributes=self._attributes,
-            events=self._events,
-            links=self._links,
-            kind=self.kind,
-            status=self._status,
-            start_time=self._start_time,
-            end_time=self._end_time,
-            instrumentation_info=self._instrumentation_info,
-        )
+    @property
+    def attributes(self) -> types.Attributes:
+        if self._end_time is None:
+            return MappingProxyType(self._attributes)
+        return self._attributes
+
+    @property
+    def events(self) -> Sequence[Event]:
+        if self._end_time is None:
+            return MappingProxyType(self._events)
+        return self._events
+
+    @property
+    def links(self) -> Sequence[trace_api.Link]:
+        if self._end_time is None:
+            return MappingProxyType(self._links)
+        return self._links
+
+    def _freeze(self) -> None:
+        # pylint: disable=protected-access
+        self._attributes._immutable = True
+        self._events._immutable = True
+        self._links._immutable = True
 
     def start(
         self,
@@ -823,9 +975,12 @@ class Span(trace_api.Span, ReadableSpan):
                 logger.warning("Calling end() on an ended span.")
                 return
 
+            # the ended span is handed to the span processors as is, its
+            # containers are frozen instead of being wrapped on every access
+            self._freeze()
             self._end_time = end_time if end_time is not None else _time_ns()
 
-        self._span_processor.on_end(self._readable_span())
+        self._span_processor.on_end(self)
 
     @_check_span_ended
     def update_name(self, name: str) -> None:
@@ -907,6 +1062,128 @@ class _Span(Span):
     by other mechanisms than through the `Tracer`.
     """
 
+    __slots__ = ()
+
+
+def _validated_attributes(
+    maxlen: Optional[int], attributes: Dict[str, types.AttributeValue]
+) -> BoundedAttributes:
+    """Returns mutable `BoundedAttributes` holding attributes which are
+    already valid and within the limit, without checking them again."""
+    bounded_attributes = _SpanAttributes(maxlen, immutable=False)
+    bounded_attributes._dict = attributes  # pylint: disable=protected-access
+    return bounded_attributes
+
+
+class AttributeSchema(trace_api.AttributeSchema):
+    """Attribute keys and value types declared once for a call site, see
+    `Tracer.compile_attributes`.
+
+    Values are passed in the order of the keys of the schema. Values of
+    the declared types are stored without being validated again, values of
+    other types are validated like any attribute value and ``None`` values
+    are left out.
+    """
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        schema: Dict[str, Union[type, Tuple[type, ...]]],
+    ) -> None:
+        super().__init__(tracer, schema)
+        value_types = []
+        for key, declared_types in schema.items():
+            if not key or not isinstance(key, str):
+                raise ValueError("invalid key `{}`".format(key))
+            if not isinstance(declared_types, tuple):
+                declared_types = (declared_types,)
+            for declared_type in declared_types:
+                if declared_type not in (bool, str, int, float):
+                    raise TypeError(
+                        "Invalid type {} for attribute `{}`".format(
+                            declared_type, key
+                        )
+                    )
+            value_types.append(frozenset(declared_types))
+        self._layout = tuple(zip(self._keys, value_types))
+        max_attributes = tracer._span_limits.max_attributes
+        # schemas with more keys than the limit go through BoundedAttributes
+        self._within_limit = (
+            max_attributes is None or len(self._keys) <= max_attributes
+        )
+
+    def _attributes(
+        self, values: Sequence[types.AttributeValue]
+    ) -> Dict[str, types.AttributeValue]:
+        if len(values) != len(self._layout):
+            raise ValueError(
+                "Expected {} attribute values, got {}".format(
+                    len(self._layout), len(values)
+                )
+            )
+        attributes = {}
+        for (key, value_types), value in zip(self._layout, values):
+            if type(value) not in value_types:
+                if value is None:
+                    continue
+                value = _clean_attribute_value(value)
+                if value is None:
+                    continue
+            attributes[key] = value
+        return attributes
+
+    def start_span(
+        self,
+        name: str,
+        values: Sequence[types.AttributeValue],
+        context: Optional[context_api.Context] = None,
+        kind: trace_api.SpanKind = trace_api.SpanKind.INTERNAL,
+        links: Sequence[trace_api.Link] = (),
+        start_time: Optional[int] = None,
+        record_exception: bool = True,
+        set_status_on_exception: bool = True,
+    ) -> trace_api.Span:
+        """Starts a span with the attributes of the schema, see
+        `Tracer.start_span`."""
+        return self._tracer._start_span(  # pylint: disable=protected-access
+            name,
+            context,
+            kind,
+            self._attributes(values),
+            links,
+            start_time,
+            record_exception,
+            set_status_on_exception,
+            validated_attributes=self._within_limit,
+        )
+
+    def set_attributes(
+        self, span: trace_api.Span, values: Sequence[types.AttributeValue]
+    ) -> None:
+        """Sets the attributes of the schema on a span."""
+        attributes = self._attributes(values)
+        if not isinstance(span, Span):
+            span.set_attributes(attributes)
+            return
+        # pylint: disable=protected-access
+        with span._lock:
+            if span._end_time is not None:
+                logger.warning("Setting attribute on ended span.")
+                return
+            if span._attributes is _EMPTY_ATTRIBUTES:
+                max_attributes = span._limits.max_attributes
+                if max_attributes is None or len(attributes) <= max_attributes:
+                    span._attributes = _validated_attributes(
+                        max_attributes, attributes
+                    )
+                    return
+                span._attributes = _SpanAttributes(
+                    max_attributes, immutable=False
+                )
+            span_attributes = span._attributes
+            for key, value in attributes.items():
+                span_attributes[key] = value
+
 
 class Tracer(trace_api.Tracer):
     """See `opentelemetry.trace.Tracer`."""
@@ -929,6 +1206,26 @@ class Tracer(trace_api.Tracer):
         self.instrumentation_info = instrumentation_info
         self._span_limits = span_limits
 
+    def compile_attributes(
+        self, schema: Dict[str, Union[type, Tuple[type, ...]]]
+    ) -> AttributeSchema:
+        """Compiles the attributes set by a call site, so that its spans are
+        started without validating the keys and the values again.
+
+        Args:
+            schema: The attribute keys, in the order their values are passed
+                in, mapped to the expected type of their values, or a tuple of
+                types. Only `bool`, `str`, `int` and `float` can be declared.
+
+        Example::
+
+            schema = tracer.compile_attributes(
+                {"http.method": str, "http.status_code": int}
+            )
+            span = schema.start_span("GET /", ("GET", 200))
+        """
+        return AttributeSchema(self, schema)
+
     @contextmanager
     def start_as_current_span(
         self,
@@ -952,15 +1249,26 @@ class Tracer(trace_api.Tracer):
             record_exception=record_exception,
             set_status_on_exception=set_status_on_exception,
         )
-        with trace_api.use_span(
-            span,
-            end_on_exit=end_on_exit,
-            record_exception=record_exception,
-            set_status_on_exception=set_status_on_exception,
-        ) as span_context:
-            yield span_context
+        # the same as trace_api.use_span, without nesting context managers
+        try:
+            token = trace_api.activate_span(span)
+            try:
+                yield span
+            finally:
+                context_api.detach(token)
+
+        except Exception as exc:  # pylint: disable=broad-except
+            # pylint: disable=protected-access
+            trace_api._handle_span_exception(
+                span, exc, record_exception, set_status_on_exception
+            )
+            raise
 
-    def start_span(  # pylint: disable=too-many-locals
+        finally:
+            if end_on_exit:
+                span.end()
+
+    def start_span(
         self,
         name: str,
         context: Optional[context_api.Context] = None,
@@ -971,6 +1279,31 @@ class Tracer(trace_api.Tracer):
         record_exception: bool = True,
         set_status_on_exception: bool = True,
     ) -> trace_api.Span:
+        return self._start_span(
+            name,
+            context,
+            kind,
+            attributes,
+            links,
+            start_time,
+            record_exception,
+            set_status_on_exception,
+        )
+
+    def _start_span(  # pylint: disable=too-many-locals
+        self,
+        name: str,
+        context: Optional[context_api.Context],
+        kind: trace_api.SpanKind,
+        attributes: types.Attributes,
+        links: Sequence[trace_api.Link],
+        start_time: Optional[int],
+        record_exception: bool,
+        set_status_on_exception: bool,
+        validated_attributes: bool = False,
+    ) -> trace_api.Span:
+        """Starts a span, attributes are not validated again when
+        validated_attributes is true and the sampler keeps them as is."""
 
         parent_span_context = trace_api.get_current_span(
             context
@@ -1000,40 +1333,48 @@ class Tracer(trace_api.Tracer):
             context, trace_id, name, kind, attributes, links
         )
 
-        trace_flags = (
-            trace_api.TraceFlags(trace_api.TraceFlags.SAMPLED)
-            if sampling_result.decision.is_sampled()
-            else trace_api.TraceFlags(trace_api.TraceFlags.DEFAULT)
-        )
+        decision = sampling_result.decision
         span_context = trace_api.SpanContext(
             trace_id,
             self.id_generator.generate_span_id(),
-            is_remote=False,
-            trace_flags=trace_flags,
-            trace_state=sampling_result.trace_state,
+            False,
+            _SAMPLED_TRACE_FLAGS
+            if decision.is_sampled()
+            else trace_api.DEFAULT_TRACE_OPTIONS,
+            sampling_result.trace_state,
         )
 
-        # Only record if is_recording() is true
-        if sampling_result.decision.is_recording():
-            # pylint:disable=protected-access
-            span = _Span(
-                name=name,
-                context=span_context,
-                parent=parent_span_context,
-                sampler=self.sampler,
-                resource=self.resource,
-                attributes=sampling_result.attributes.copy(),
-                span_processor=self.span_processor,
-                kind=kind,
-                links=links,
-                instrumentation_info=self.instrumentation_info,
-                record_exception=record_exception,
-                set_status_on_exception=set_status_on_exception,
-                limits=self._span_limits,
+        # Only record if is_recording() is true, other spans only propagate
+        # their context
+        if not decision.is_recording():
+            return trace_api.NonRecordingSpan(span_context)
+
+        validated_attributes = (
+            validated_attributes and sampling_result.attributes == attributes
+        )
+        # pylint:disable=protected-access
+        span = _Span(
+            name=name,
+            context=span_context,
+            parent=parent_span_context,
+            sampler=self.sampler,
+            resource=self.resource,
+            attributes=None
+            if validated_attributes
+            else sampling_result.attributes.copy(),
+            span_processor=self.span_processor,
+            kind=kind,
+            links=links,
+            instrumentation_info=self.instrumentation_info,
+            record_exception=record_exception,
+            set_status_on_exception=set_status_on_exception,
+            limits=self._span_limits,
+        )
+        if validated_attributes and attributes:
+            span._attributes = _validated_attributes(
+                self._span_limits.max_attributes, attributes
             )
-            span.start(start_time=start_time, parent_context=context)
-        else:
-            span = trace_api.NonRecordingSpan(context=span_context)
+        span.start(start_time=start_time, parent_context=context)
         return span
 
 
@@ -1054,6 +1395,10 @@ class TracerProvider(trace_api.TracerProvider):
         self._active_span_processor = (
             active_span_processor or SynchronousMultiSpanProcessor()
         )
+        # tracers are created once for every instrumenting library, and
+        # again once the sampler or the id generator is replaced
+        self._tracers = {}  # type: Dict[Tuple[str, str], Tracer]
+        self._tracers_lock = threading.Lock()
         if id_generator is None:
             self.id_generator = RandomIdGenerator()
         else:
@@ -1069,6 +1414,26 @@ class TracerProvider(trace_api.TracerProvider):
     def resource(self) -> Resource:
         return self._resource
 
+    @property
+    def sampler(self) -> sampling.Sampler:
+        return self._sampler
+
+    @sampler.setter
+    def sampler(self, sampler: sampling.Sampler) -> None:
+        with self._tracers_lock:
+            self._sampler = sampler
+            self._tracers = {}
+
+    @property
+    def id_generator(self) -> IdGenerator:
+        return self._id_generator
+
+    @id_generator.setter
+    def id_generator(self, id_generator: IdGenerator) -> None:
+        with self._tracers_lock:
+            self._id_generator = id_generator
+            self._tracers = {}
+
     def get_tracer(
         self,
         instrumenting_module_name: str,
@@ -1077,16 +1442,24 @@ class TracerProvider(trace_api.TracerProvider):
         if not instrumenting_module_name:  # Reject empty strings too.
             instrumenting_module_name = ""
             logger.error("get_tracer called with missing module name.")
-        return Tracer(
-            self.sampler,
-            self.resource,
-            self._active_span_processor,
-            self.id_generator,
-            InstrumentationInfo(
-                instrumenting_module_name, instrumenting_library_version
-            ),
-            self._span_limits,
-        )
+        key = (instrumenting_module_name, instrumenting_library_version)
+        tracer = self._tracers.get(key)
+        if tracer is None:
+            with self._tracers_lock:
+                tracer = self._tracers.get(key)
+                if tracer is None:
+                    tracer = self._tracers[key] = Tracer(
+                        self.sampler,
+                        self.resource,
+                        self._active_span_processor,
+                        self.id_generator,
+                        InstrumentationInfo(
+                            instrumenting_module_name,
+                            instrumenting_library_version,
+                        ),
+                        self._span_limits,
+                    )
+        return tracer
 
     def add_span_processor(self, span_processor: SpanProcessor) -> None:
         """Registers a new :class:`SpanProcessor` for this `TracerProvider`.
@@ -13,10 +13,13 @@
 # limitations under the License.
 
 import collections
+import concurrent.futures
+import itertools
 import logging
 import sys
 import threading
 import typing
+import weakref
 from enum import Enum
 from os import environ, linesep
 from typing import Optional
@@ -28,12 +31,23 @@ from opentelemetry.sdk.environment_variables import (
     OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
     OTEL_BSP_MAX_QUEUE_SIZE,
     OTEL_BSP_SCHEDULE_DELAY,
+    OTEL_PYTHON_BSP_ADAPTIVE_BATCHING,
+    OTEL_PYTHON_BSP_EXPORT_WORKERS,
+    OTEL_PYTHON_BSP_QUEUE_TYPE,
+    OTEL_PYTHON_BSP_SPILL_DIRECTORY,
+    OTEL_PYTHON_BSP_SPILL_MAX_BYTES,
 )
 from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.export._spill import SpanSpill
+from opentelemetry.sdk.util import _register_at_fork_reinit
 from opentelemetry.util._time import _time_ns
 
 logger = logging.getLogger(__name__)
 
+# longest delay in seconds between attempts to export spilled batches while
+# the exporter fails
+_MAX_SPILL_REPLAY_DELAY = 60
+
 
 class SpanExportResult(Enum):
     SUCCESS = 0
@@ -68,6 +82,19 @@ class SpanExporter:
         Called when the SDK is shut down.
         """
 
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Sends the spans of previous exports that the exporter still holds,
+        for example to retry them later.
+
+        Called when the span processors are flushed.
+
+        Returns:
+            False if the spans could not be sent within the timeout, True
+            otherwise.
+        """
+        # pylint: disable=unused-argument
+        return True
+
 
 class SimpleSpanProcessor(SpanProcessor):
     """Simple SpanProcessor implementation.
@@ -99,8 +126,7 @@ class SimpleSpanProcessor(SpanProcessor):
         self.span_exporter.shutdown()
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
-        # pylint: disable=unused-argument
-        return True
+        return self.span_exporter.force_flush(timeout_millis)
 
 
 class _FlushRequest:
@@ -113,6 +139,336 @@ class _FlushRequest:
         self.num_spans = 0
 
 
+class _OverflowBuffer:
+    """Bounded buffer of spans that did not fit in the queue, waiting for the
+    worker thread to spill them to disk in batches.
+
+    When the buffer is full new spans are dropped.
+    """
+
+    def __init__(self, max_size: int):
+        self.spans = collections.deque()  # type: typing.Deque[ReadableSpan]
+        self._max_size = max_size
+        self._dropped_lock = threading.Lock()
+        self.dropped = 0
+
+    def put(self, span: ReadableSpan) -> None:
+        if len(self.spans) >= self._max_size:
+            with self._dropped_lock:
+                if not self.dropped:
+                    logger.warning(
+                        "Span spill overflow is full, spans will be dropped."
+                    )
+                self.dropped += 1
+            return
+        self.spans.append(span)
+
+    def pop_batch(self, limit: int) -> typing.List[ReadableSpan]:
+        """Removes and returns at most ``limit`` of the oldest spans.
+
+        Must only be called by a single consumer thread.
+        """
+        spans = []
+        while len(spans) < limit and self.spans:
+            spans.append(self.spans.popleft())
+        return spans
+
+
+class _SharedSpanQueue:
+    """Bounded queue of ended spans shared by all producer threads.
+
+    When the queue is full new spans are moved to the ``overflow`` buffer if
+    given, otherwise the oldest span is evicted to make room for the new one.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int,
+        max_export_batch_size: int,
+        overflow: typing.Optional[_OverflowBuffer] = None,
+    ):
+        self._queue = collections.deque(
+            [], max_queue_size
+        )  # type: typing.Deque[ReadableSpan]
+        self._max_queue_size = max_queue_size
+        self._overflow = overflow
+        # may be changed while the queue is in use
+        self.export_batch_size = max_export_batch_size
+        self._dropped_lock = threading.Lock()
+        self._dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def put(self, span: ReadableSpan) -> bool:
+        """Adds a span to the queue.
+
+        Returns:
+            True if the consumer should be notified that a full batch is
+            waiting, False otherwise.
+        """
+        if len(self._queue) == self._max_queue_size:
+            if self._overflow is not None:
+                self._overflow.put(span)
+                return False
+            with self._dropped_lock:
+                if not self._dropped:
+                    logger.warning(
+                        "Queue is full, likely spans will be dropped."
+                    )
+                self._dropped += 1
+
+        self._queue.appendleft(span)
+
+        return len(self._queue) >= self.export_batch_size
+
+    def pop_into(
+        self,
+        spans_list: typing.List[typing.Optional[ReadableSpan]],
+        limit: int,
+    ) -> int:
+        """Moves at most ``limit`` of the oldest spans into ``spans_list``
+        and returns the number of moved spans.
+
+        Must only be called by a single consumer thread.
+        """
+        idx = 0
+        # currently only a single thread acts as consumer, so queue.pop() will
+        # not raise an exception
+        while idx < limit and self._queue:
+            spans_list[idx] = self._queue.pop()
+            idx += 1
+        return idx
+
+
+class _ThreadSpanBuffer:
+    """Spans ended by a single thread, in the order they were ended.
+
+    Only the owning thread appends to ``spans`` and updates ``dropped`` and
+    ``overflowed``, only the consumer thread pops from ``spans``.
+    """
+
+    __slots__ = ["spans", "dropped", "overflowed", "thread"]
+
+    def __init__(self):
+        self.spans = collections.deque()  # type: typing.Deque[ReadableSpan]
+        self.dropped = 0
+        self.overflowed = 0
+        self.thread = weakref.ref(threading.current_thread())
+
+    def is_abandoned(self) -> bool:
+        thread = self.thread()
+        return not self.spans and (thread is None or not thread.is_alive())
+
+
+class _PerThreadSpanQueue:
+    """Bounded queue of ended spans with one buffer per producer thread.
+
+    Producers append to a buffer owned by their own thread and never take a
+    lock on the hot path. The occupancy of the queue is tracked with an
+    atomic ticket counter taken by producers and a consumed counter that is
+    only written by the consumer thread. When the queue is full new spans are
+    moved to the ``overflow`` buffer if given, otherwise they are dropped, and
+    are counted on the producer's buffer. Producers request a single
+    notification per batch once the occupancy reaches a full batch, also
+    when the batch size shrinks below the occupancy.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int,
+        max_export_batch_size: int,
+        overflow: typing.Optional[_OverflowBuffer] = None,
+    ):
+        self._max_queue_size = max_queue_size
+        self._overflow = overflow
+        # may be changed while the queue is in use
+        self.export_batch_size = max_export_batch_size
+        self._local = threading.local()
+        # use a tuple to avoid race conditions when a new thread registers
+        # its buffer while the consumer iterates over the buffers
+        self._buffers = ()  # type: typing.Tuple[_ThreadSpanBuffer, ...]
+        self._buffers_lock = threading.Lock()
+        # next() on an itertools.count is atomic in CPython
+        self._tickets = itertools.count()
+        # written by the consumer thread only
+        self._consumed = 0
+        # spans that took a ticket without being queued
+        self._rejected_seen = 0
+        self._retired_dropped = 0
+        self._next_buffer = 0
+        self._spans_dropped = False
+        # set by producers, reset by the consumer once it takes a batch
+        self._notified = False
+
+    def __len__(self) -> int:
+        return sum(len(buffer.spans) for buffer in self._buffers)
+
+    @property
+    def dropped(self) -> int:
+        return self._retired_dropped + sum(
+            buffer.dropped for buffer in self._buffers
+        )
+
+    def _get_buffer(self) -> _ThreadSpanBuffer:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = _ThreadSpanBuffer()
+            with self._buffers_lock:
+                self._buffers = self._buffers + (buffer,)
+            self._local.buffer = buffer
+        return buffer
+
+    def put(self, span: ReadableSpan) -> bool:
+        """Adds a span to the buffer of the calling thread.
+
+        Returns:
+            True if the consumer should be notified that a full batch is
+            waiting, False otherwise.
+        """
+        buffer = self._get_buffer()
+        occupancy = next(self._tickets) - self._consumed
+        if occupancy >= self._max_queue_size:
+            if self._overflow is not None:
+                buffer.overflowed += 1
+                self._overflow.put(span)
+                return False
+            if not self._spans_dropped:
+                logger.warning("Queue is full, spans will be dropped.")
+                self._spans_dropped = True
+            buffer.dropped += 1
+            return False
+
+        buffer.spans.append(span)
+        if occupancy + 1 < self.export_batch_size or self._notified:
+            return False
+        self._notified = True
+        return True
+
+    def pop_into(
+        self,
+        spans_list: typing.List[typing.Optional[ReadableSpan]],
+        limit: int,
+    ) -> int:
+        """Moves at most ``limit`` spans from the thread buffers into
+        ``spans_list`` and returns the number of moved spans.
+
+        Buffers are drained starting from a different buffer on every call so
+        that busy threads cannot starve the others. Must only be called by a
+        single consumer thread.
+        """
+        buffers = self._buffers
+        idx = 0
+        num_buffers = len(buffers)
+        for offset in range(num_buffers):
+            if idx == limit:
+                break
+            spans = buffers[(self._next_buffer + offset) % num_buffers].spans
+            while idx < limit and spans:
+                spans_list[idx] = spans.popleft()
+                idx += 1
+        if num_buffers:
+            self._next_buffer = (self._next_buffer + 1) % num_buffers
+        self._notified = False
+
+        # dropped and overflowed spans took a ticket as well, release them
+        # together with the exported ones
+        rejected = sum(
+            buffer.dropped + buffer.overflowed for buffer in buffers
+        )
+        self._consumed += idx + rejected - self._rejected_seen
+        self._rejected_seen = rejected
+
+        if any(buffer.is_abandoned() for buffer in buffers):
+            self._remove_abandoned_buffers()
+        return idx
+
+    def _remove_abandoned_buffers(self) -> None:
+        with self._buffers_lock:
+            abandoned = []
+            buffers = []
+            for buffer in self._buffers:
+                if buffer.is_abandoned():
+                    abandoned.append(buffer)
+                else:
+                    buffers.append(buffer)
+            self._buffers = tuple(buffers)
+        # the threads owning these buffers are gone so their drop counts are
+        # final, keep them around once the buffers are released
+        self._retired_dropped += sum(buffer.dropped for buffer in abandoned)
+        self._rejected_seen -= sum(
+            buffer.dropped + buffer.overflowed for buffer in abandoned
+        )
+
+
+class _AdaptiveBatchTuner:
+    """Tunes the export batch size and the schedule delay of a
+    `BatchSpanProcessor` from the outcome of its exports.
+
+    - If a backlog is left in the queue after an export the batch size is
+      doubled and the schedule delay halved, so the backlog is drained with
+      fewer and larger exports.
+    - If an export triggered by the schedule delay sent less than half a
+      batch, exports are more frequent than the traffic needs and the
+      schedule delay is increased by half.
+    - If an export took longer than the schedule delay without a backlog, the
+      batch size is reduced by a quarter to keep export latency in check.
+
+    Both values start at their upper bound and always stay within their
+    bounds.
+    """
+
+    def __init__(
+        self,
+        min_batch_size: int,
+        max_batch_size: int,
+        min_schedule_delay_millis: float,
+        max_schedule_delay_millis: float,
+        max_queue_size: int,
+    ):
+        self._min_batch_size = min_batch_size
+        self._max_batch_size = max_batch_size
+        self._min_schedule_delay_millis = min_schedule_delay_millis
+        self._max_schedule_delay_millis = max_schedule_delay_millis
+        self._max_queue_size = max_queue_size
+        self.batch_size = max_batch_size
+        self.schedule_delay_millis = max_schedule_delay_millis
+
+    def update(self, exported: int, duration: float, queued: int) -> None:
+        """Updates the batch size and schedule delay after an export.
+
+        Args:
+            exported: The number of exported spans.
+            duration: The duration of the export in seconds.
+            queued: The number of spans left in the queue.
+        """
+        if queued >= self.batch_size or queued * 2 > self._max_queue_size:
+            self.batch_size = min(self._max_batch_size, self.batch_size * 2)
+            self.schedule_delay_millis = max(
+                self._min_schedule_delay_millis,
+                self.schedule_delay_millis / 2,
+            )
+        elif exported * 2 < self.batch_size:
+            self.schedule_delay_millis = min(
+                self._max_schedule_delay_millis,
+                self.schedule_delay_millis * 1.5,
+            )
+        elif duration * 1e3 > self.schedule_delay_millis:
+            self.batch_size = max(
+                self._min_batch_size, self.batch_size - self.batch_size // 4
+            )
+
+
+_SPAN_QUEUE_TYPES = {
+    "shared": _SharedSpanQueue,
+    "per_thread": _PerThreadSpanQueue,
+}
+
+
 class BatchSpanProcessor(SpanProcessor):
     """Batch span processor implementation.
 
@@ -126,6 +482,56 @@ class BatchSpanProcessor(SpanProcessor):
     - :envvar:`OTEL_BSP_MAX_QUEUE_SIZE`
     - :envvar:`OTEL_BSP_MAX_EXPORT_BATCH_SIZE`
     - :envvar:`OTEL_BSP_EXPORT_TIMEOUT`
+    - :envvar:`OTEL_PYTHON_BSP_QUEUE_TYPE`
+    - :envvar:`OTEL_PYTHON_BSP_EXPORT_WORKERS`
+    - :envvar:`OTEL_PYTHON_BSP_ADAPTIVE_BATCHING`
+    - :envvar:`OTEL_PYTHON_BSP_SPILL_DIRECTORY`
+    - :envvar:`OTEL_PYTHON_BSP_SPILL_MAX_BYTES`
+
+    With the default ``"shared"`` queue type all threads ending spans append
+    to one queue and the oldest spans are evicted when it is full. With the
+    ``"per_thread"`` queue type every thread appends to its own buffer without
+    locking, the worker thread is notified once per batch and new spans are
+    dropped when the queue is full. In both cases `dropped_spans` reports the
+    number of spans that were lost because the queue was full.
+
+    By default batches are exported one at a time by the worker thread. With
+    ``max_export_workers`` greater than 1 the worker thread hands batches over
+    to a pool of export threads, so a slow export does not hold back the
+    following batches. At most ``max_export_workers`` batches are in flight
+    at any time and `force_flush` waits for all of them. Batches may complete
+    in any order and the `SpanExporter` must support concurrent calls to
+    `SpanExporter.export`.
+
+    With ``adaptive_batching`` enabled ``max_export_batch_size`` and
+    ``schedule_delay_millis`` become upper bounds, while
+    ``min_export_batch_size`` and ``min_schedule_delay_millis`` are the lower
+    bounds. The processor starts with the upper bounds and tunes both values
+    after every scheduled export, growing batches and shortening the delay
+    when spans back up in the queue and lengthening the delay when exports
+    are smaller than half a batch.
+
+    With a ``spill_directory`` spans are written to disk instead of being
+    dropped when the queue is full, and batches are written to disk when they
+    fail to export. Spans that do not fit in the queue are held in a buffer
+    of up to ``max_queue_size`` spans and written to disk in batches by the
+    worker thread. Spilled spans are exported by the worker thread after
+    every successful export and when it is idle, while less than a batch of
+    spans is queued. While exports fail the idle attempts back off
+    exponentially, up to a minute apart. A spilled batch is only dropped
+    once it failed to export 5 times right after other spans were exported
+    successfully, an outage of the exporter does not count. At most
+    ``max_spill_bytes`` are written to the directory, further spans are
+    dropped and counted in `dropped_spans`.
+    Spans still on disk at shutdown are exported by the next processor using
+    the same directory. The directory must not be used by more than one
+    processor at a time, so spilling is turned off in child processes
+    created with `os.fork`, see below.
+
+    The processor is fork safe: in a child process created with `os.fork` the
+    spans inherited from the parent are discarded, the locks are recreated and
+    the worker thread is restarted when the child first ends a span or
+    flushes. Spilling is disabled in the child.
     """
 
     def __init__(
@@ -135,6 +541,13 @@ class BatchSpanProcessor(SpanProcessor):
         schedule_delay_millis: float = None,
         max_export_batch_size: int = None,
         export_timeout_millis: float = None,
+        queue_type: str = None,
+        max_export_workers: int = None,
+        adaptive_batching: bool = None,
+        min_export_batch_size: int = None,
+        min_schedule_delay_millis: float = None,
+        spill_directory: str = None,
+        max_spill_bytes: int = None,
     ):
 
         if max_queue_size is None:
@@ -155,6 +568,36 @@ class BatchSpanProcessor(SpanProcessor):
                 environ.get(OTEL_BSP_EXPORT_TIMEOUT, 30000)
             )
 
+        if queue_type is None:
+            queue_type = environ.get(OTEL_PYTHON_BSP_QUEUE_TYPE, "shared")
+
+        if max_export_workers is None:
+            max_export_workers = int(
+                environ.get(OTEL_PYTHON_BSP_EXPORT_WORKERS, 1)
+            )
+
+        if adaptive_batching is None:
+            adaptive_batching = (
+                environ.get(OTEL_PYTHON_BSP_ADAPTIVE_BATCHING, "false")
+                .strip()
+                .lower()
+                == "true"
+            )
+
+        if min_export_batch_size is None:
+            min_export_batch_size = max(1, max_export_batch_size // 8)
+
+        if min_schedule_delay_millis is None:
+            min_schedule_delay_millis = schedule_delay_millis / 10
+
+        if spill_directory is None:
+            spill_directory = environ.get(OTEL_PYTHON_BSP_SPILL_DIRECTORY)
+
+        if max_spill_bytes is None:
+            max_spill_bytes = int(
+                environ.get(OTEL_PYTHON_BSP_SPILL_MAX_BYTES, 64 * 1024 * 1024)
+            )
+
         if max_queue_size <= 0:
             raise ValueError("max_queue_size must be a positive integer.")
 
@@ -171,25 +614,125 @@ class BatchSpanProcessor(SpanProcessor):
                 "max_export_batch_size must be less than or equal to max_queue_size."
             )
 
+        if queue_type not in _SPAN_QUEUE_TYPES:
+            raise ValueError(
+                "queue_type must be one of {}.".format(
+                    ", ".join(sorted(_SPAN_QUEUE_TYPES))
+                )
+            )
+
+        if max_export_workers <= 0:
+            raise ValueError("max_export_workers must be a positive integer.")
+
+        if not 0 < min_export_batch_size <= max_export_batch_size:
+            raise ValueError(
+                "min_export_batch_size must be a positive integer less than or equal to max_export_batch_size."
+            )
+
+        if not 0 < min_schedule_delay_millis <= schedule_delay_millis:
+            raise ValueError(
+                "min_schedule_delay_millis must be positive and less than or equal to schedule_delay_millis."
+            )
+
+        if max_spill_bytes <= 0:
+            raise ValueError("max_spill_bytes must be a positive integer.")
+
         self.span_exporter = span_exporter
-        self.queue = collections.deque(
-            [], max_queue_size
-        )  # type: typing.Deque[Span]
-        self.worker_thread = threading.Thread(target=self.worker, daemon=True)
+        self._spill = None  # type: typing.Optional[SpanSpill]
+        self._overflow = None  # type: typing.Optional[_OverflowBuffer]
+        if spill_directory:
+            self._spill = SpanSpill(spill_directory, max_spill_bytes)
+            self._overflow = _OverflowBuffer(max_queue_size)
+        # whether the latest export succeeded, set by the export threads
+        self._last_export_succeeded = False
+        # delay in seconds before the next attempt to export spilled batches
+        # after an attempt failed, and the time of that attempt
+        self._spill_replay_delay = schedule_delay_millis / 1e3
+        self._next_spill_replay_ns = 0
+        self.queue = _SPAN_QUEUE_TYPES[queue_type](
+            max_queue_size, max_export_batch_size, self._overflow
+        )
+        self.worker_thread = None  # type: typing.Optional[threading.Thread]
+        self._worker_thread_lock = threading.Lock()
         self.condition = threading.Condition(threading.Lock())
         self._flush_request = None  # type: typing.Optional[_FlushRequest]
         self.schedule_delay_millis = schedule_delay_millis
         self.max_export_batch_size = max_export_batch_size
         self.max_queue_size = max_queue_size
         self.export_timeout_millis = export_timeout_millis
+        self.max_export_workers = max_export_workers
+        self._batch_tuner = None  # type: typing.Optional[_AdaptiveBatchTuner]
+        if adaptive_batching:
+            self._batch_tuner = _AdaptiveBatchTuner(
+                min_export_batch_size,
+                max_export_batch_size,
+                min_schedule_delay_millis,
+                schedule_delay_millis,
+                max_queue_size,
+            )
+        # the batch size and schedule delay currently in use
+        self._export_batch_size = max_export_batch_size
+        self._schedule_delay_millis = schedule_delay_millis
+        self._export_executor = (
+            None
+        )  # type: typing.Optional[concurrent.futures.ThreadPoolExecutor]
+        self._create_export_executor()
         self.done = False
-        # flag that indicates that spans are being dropped
-        self._spans_dropped = False
         # precallocated list to send spans to exporter
         self.spans_list = [
             None
         ] * self.max_export_batch_size  # type: typing.List[typing.Optional[Span]]
-        self.worker_thread.start()
+        self._start_worker_thread()
+        _register_at_fork_reinit(self._at_fork_reinit)
+
+    def _start_worker_thread(self) -> None:
+        with self._worker_thread_lock:
+            if self.worker_thread is None:
+                self.worker_thread = threading.Thread(
+                    target=self.worker, daemon=True
+                )
+                self.worker_thread.start()
+
+    def _create_export_executor(self) -> None:
+        # only accessed from the worker thread once running
+        self._in_flight_batches = (
+            []
+        )  # type: typing.List[concurrent.futures.Future]
+        # number of spans and duration of the scheduled exports, appended
+        # once they complete and consumed by the worker thread
+        self._export_outcomes = (
+            collections.deque()
+        )  # type: typing.Deque[typing.Tuple[int, float]]
+        if self.max_export_workers > 1:
+            self._export_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_export_workers
+            )
+            self._in_flight_slots = threading.BoundedSemaphore(
+                self.max_export_workers
+            )
+
+    def _at_fork_reinit(self) -> None:
+        """Resets the state inherited from the parent process.
+
+        The worker thread does not survive the fork and any lock might have
+        been held by another thread of the parent while forking. Spans queued
+        in the parent are exported by the parent and are dropped here.
+        """
+        self._worker_thread_lock = threading.Lock()
+        self.condition = threading.Condition(threading.Lock())
+        # the spill files belong to the parent process
+        self._spill = None
+        self._overflow = None
+        self.queue = type(self.queue)(
+            self.max_queue_size, self.max_export_batch_size
+        )
+        self.queue.export_batch_size = self._export_batch_size
+        self._flush_request = None
+        self.spans_list = [None] * self.max_export_batch_size
+        self._create_export_executor()
+        # restarted lazily so that children which never end a span do not
+        # start a thread
+        self.worker_thread = None
 
     def on_start(
         self, span: Span, parent_context: typing.Optional[Context] = None
@@ -202,36 +745,49 @@ class BatchSpanProcessor(SpanProcessor):
             return
         if not span.context.trace_flags.sampled:
             return
-        if len(self.queue) == self.max_queue_size:
-            if not self._spans_dropped:
-                logger.warning("Queue is full, likely spans will be dropped.")
-                self._spans_dropped = True
-
-        self.queue.appendleft(span)
-
-        if len(self.queue) >= self.max_export_batch_size:
+        if self.worker_thread is None:
+            self._start_worker_thread()
+        if self.queue.put(span):
             with self.condition:
                 self.condition.notify()
 
+    @property
+    def dropped_spans(self) -> int:
+        """The number of spans dropped because the queue was full."""
+        if self._spill is not None:
+            return (
+                self.queue.dropped
+                + self._overflow.dropped
+                + self._spill.dropped
+            )
+        return self.queue.dropped
+
     def worker(self):
-        timeout = self.schedule_delay_millis / 1e3
+        timeout = self._schedule_delay_millis / 1e3
         flush_request = None  # type: typing.Optional[_FlushRequest]
         while not self.done:
+            if self._spill is not None:
+                self._spill_overflow()
+                self._export_spilled_batches()
             with self.condition:
                 if self.done:
                     # done flag may have changed, avoid waiting
                     break
                 flush_request = self._get_and_unset_flush_request()
                 if (
-                    len(self.queue) < self.max_export_batch_size
+                    len(self.queue) < self._export_batch_size
                     and flush_request is None
                 ):
 
                     self.condition.wait(timeout)
                     flush_request = self._get_and_unset_flush_request()
                     if not self.queue:
+                        # exports handed over to the export threads may
+                        # have completed in the meantime
+                        if self._batch_tuner is not None:
+                            self._tune_batching()
                         # spurious notification, let's wait again, reset timeout
-                        timeout = self.schedule_delay_millis / 1e3
+                        timeout = self._schedule_delay_millis / 1e3
                         self._notify_flush_request_finished(flush_request)
                         flush_request = None
                         continue
@@ -244,7 +800,9 @@ class BatchSpanProcessor(SpanProcessor):
             self._export(flush_request)
             end = _time_ns()
             duration = (end - start) / 1e9
-            timeout = self.schedule_delay_millis / 1e3 - duration
+            if self._batch_tuner is not None:
+                self._tune_batching()
+            timeout = self._schedule_delay_millis / 1e3 - duration
 
             self._notify_flush_request_finished(flush_request)
             flush_request = None
@@ -256,6 +814,8 @@ class BatchSpanProcessor(SpanProcessor):
 
         # be sure that all spans are sent
         self._drain_queue()
+        if self._spill is not None:
+            self._spill_overflow()
         self._notify_flush_request_finished(flush_request)
         self._notify_flush_request_finished(shutdown_flush_request)
 
@@ -296,50 +856,177 @@ class BatchSpanProcessor(SpanProcessor):
             self._flush_request = _FlushRequest()
         return self._flush_request
 
-    def _export(self, flush_request: typing.Optional[_FlushRequest]):
+    def _tune_batching(self) -> None:
+        """Tunes batching from the scheduled exports completed since the last
+        call.
+        """
+        while self._export_outcomes:
+            num_exported, duration = self._export_outcomes.popleft()
+            self._batch_tuner.update(num_exported, duration, len(self.queue))
+        self._export_batch_size = self._batch_tuner.batch_size
+        self._schedule_delay_millis = self._batch_tuner.schedule_delay_millis
+        self.queue.export_batch_size = self._export_batch_size
+
+    def _export(self, flush_request: typing.Optional[_FlushRequest]) -> int:
         """Exports spans considering the given flush_request.
 
         In case of a given flush_requests spans are exported in batches until
         the number of exported spans reached or exceeded the number of spans in
         the flush request.
-        In no flush_request was given at most max_export_batch_size spans are
-        exported.
+        In no flush_request was given at most one batch of spans is exported.
+
+        Returns the number of exported spans.
         """
         if not flush_request:
-            self._export_batch()
-            return
+            return self._export_batch(tune=self._batch_tuner is not None)
 
         num_spans = flush_request.num_spans
+        total_exported = 0
         while self.queue:
             num_exported = self._export_batch()
             num_spans -= num_exported
+            total_exported += num_exported
 
             if num_spans <= 0:
                 break
+        self._wait_in_flight_batches()
+        return total_exported
 
-    def _export_batch(self) -> int:
-        """Exports at most max_export_batch_size spans and returns the number of
+    def _export_batch(self, tune: bool = False) -> int:
+        """Exports at most one batch of spans and returns the number of
         exported spans.
+
+        With ``tune`` the outcome of the export is recorded for
+        `_tune_batching` once the export completes.
         """
-        idx = 0
-        # currently only a single thread acts as consumer, so queue.pop() will
-        # not raise an exception
-        while idx < self.max_export_batch_size and self.queue:
-            self.spans_list[idx] = self.queue.pop()
-            idx += 1
+        if self._export_executor is not None:
+            return self._submit_batch(tune)
+
+        idx = self.queue.pop_into(self.spans_list, self._export_batch_size)
+        # Ignore type b/c the Optional[None]+slicing is too "clever"
+        # for mypy
+        duration = self._export_or_spill(self.spans_list[:idx])  # type: ignore
+        if tune:
+            self._export_outcomes.append((idx, duration))
+
+        # clean up list
+        for index in range(idx):
+            self.spans_list[index] = None
+        return idx
+
+    def _submit_batch(self, tune: bool) -> int:
+        """Hands at most one batch of spans over to the export threads and
+        returns the number of submitted spans.
+
+        Blocks while max_export_workers batches are in flight.
+        """
+        spans = [None] * self._export_batch_size
+        idx = self.queue.pop_into(spans, self._export_batch_size)
+        if not idx:
+            return 0
+        del spans[idx:]
+
+        def on_done(done_future: concurrent.futures.Future) -> None:
+            self._in_flight_slots.release()
+            # the duration is measured by the export thread, the worker
+            # thread only waited for the batch to be handed over
+            if tune and done_future.exception() is None:
+                self._export_outcomes.append((idx, done_future.result()))
+
+        self._in_flight_slots.acquire()
+        future = self._export_executor.submit(self._export_or_spill, spans)
+        future.add_done_callback(on_done)
+        self._in_flight_batches = [
+            in_flight
+            for in_flight in self._in_flight_batches
+            if not in_flight.done()
+        ]
+        self._in_flight_batches.append(future)
+        return idx
+
+    def _wait_in_flight_batches(self) -> None:
+        """Waits until all batches handed over to the export threads are
+        exported.
+        """
+        if self._in_flight_batches:
+            concurrent.futures.wait(self._in_flight_batches)
+            self._in_flight_batches = []
+
+    def _export_spans(self, spans: typing.List[ReadableSpan]) -> bool:
+        """Exports the spans and returns whether the export succeeded."""
         token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+        succeeded = False
         try:
-            # Ignore type b/c the Optional[None]+slicing is too "clever"
-            # for mypy
-            self.span_exporter.export(self.spans_list[:idx])  # type: ignore
+            result = self.span_exporter.export(spans)
+            succeeded = result is not SpanExportResult.FAILURE
         except Exception:  # pylint: disable=broad-except
             logger.exception("Exception while exporting Span batch.")
         detach(token)
+        return succeeded
 
-        # clean up list
-        for index in range(idx):
-            self.spans_list[index] = None
-        return idx
+    def _export_or_spill(self, spans: typing.List[ReadableSpan]) -> float:
+        """Exports the spans, spilling them if the export fails, and returns
+        the duration of the export in seconds.
+        """
+        start = _time_ns()
+        exported = self._export_spans(spans)
+        duration = (_time_ns() - start) / 1e9
+        self._last_export_succeeded = exported
+        if not exported:
+            # spilled batches would most likely fail as well
+            self._next_spill_replay_ns = _time_ns() + int(
+                self._spill_replay_delay * 1e9
+            )
+        spill = self._spill
+        if not exported and spill is not None and spans:
+            spill.write(spans)
+        return duration
+
+    def _export_spilled_batches(self) -> None:
+        """Exports spilled batches until an export fails or a batch of spans
+        is waiting in the queue.
+
+        After a failed attempt the next one is delayed, unless other spans
+        are exported successfully in the meantime. Only failures right after
+        a successful export count towards dropping the batch.
+
+        Can only be called from the worker thread context.
+        """
+        if (
+            not self._last_export_succeeded
+            and _time_ns() < self._next_spill_replay_ns
+        ):
+            return
+        while not self.done and len(self.queue) < self._export_batch_size:
+            batch = self._spill.read()
+            if batch is None:
+                return
+            spans, position = batch
+            if spans and not self._export_spans(spans):
+                if self._last_export_succeeded:
+                    # the exporter works, the batch itself is likely rejected
+                    self._spill.fail(position, len(spans))
+                self._last_export_succeeded = False
+                self._next_spill_replay_ns = _time_ns() + int(
+                    self._spill_replay_delay * 1e9
+                )
+                self._spill_replay_delay = min(
+                    self._spill_replay_delay * 2, _MAX_SPILL_REPLAY_DELAY
+                )
+                return
+            self._spill.commit(position)
+            self._last_export_succeeded = True
+            self._spill_replay_delay = self._schedule_delay_millis / 1e3
+
+    def _spill_overflow(self) -> None:
+        """Writes the spans that did not fit in the queue to disk in batches.
+
+        Can only be called from the worker thread context.
+        """
+        while self._overflow.spans:
+            self._spill.write(
+                self._overflow.pop_batch(self.max_export_batch_size)
+            )
 
     def _drain_queue(self):
         """Export all elements until queue is empty.
@@ -349,6 +1036,7 @@ class BatchSpanProcessor(SpanProcessor):
         """
         while self.queue:
             self._export_batch()
+        self._wait_in_flight_batches()
 
     def force_flush(self, timeout_millis: int = None) -> bool:
 
@@ -359,23 +1047,35 @@ class BatchSpanProcessor(SpanProcessor):
             logger.warning("Already shutdown, ignoring call to force_flush().")
             return True
 
+        if self.worker_thread is None:
+            self._start_worker_thread()
+
         with self.condition:
             flush_request = self._get_or_create_flush_request()
             # signal the worker thread to flush and wait for it to finish
             self.condition.notify_all()
 
         # wait for token to be processed
+        start = _time_ns()
         ret = flush_request.event.wait(timeout_millis / 1e3)
         if not ret:
             logger.warning("Timeout was exceeded in force_flush().")
-        return ret
+            return ret
+        # the exporter may still hold spans, e.g. to retry them
+        remaining_millis = timeout_millis - (_time_ns() - start) / 1e6
+        return self.span_exporter.force_flush(max(remaining_millis, 0))
 
     def shutdown(self) -> None:
         # signal the worker thread to finish and then wait for it
         self.done = True
         with self.condition:
             self.condition.notify_all()
-        self.worker_thread.join()
+        if self.worker_thread is not None:
+            self.worker_thread.join()
+        if self._export_executor is not None:
+            self._export_executor.shutdown()
+        if self._spill is not None:
+            self._spill.close()
         self.span_exporter.shutdown()
 
 
@@ -0,0 +1,520 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Disk backed storage for spans that could not be exported yet."""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import typing
+import zlib
+
+from opentelemetry import trace as trace_api
+from opentelemetry.attributes import BoundedAttributes
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import Event, ReadableSpan
+from opentelemetry.sdk.util import BoundedList
+from opentelemetry.sdk.util.instrumentation import InstrumentationInfo
+from opentelemetry.trace.status import Status, StatusCode
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".spill"
+_CURSOR_FILE_NAME = "cursor"
+# payload length and CRC-32 of the payload
+_RECORD_HEADER = struct.Struct(">II")
+
+# (segment number, offset of the next record in the segment)
+Position = typing.Tuple[int, int]
+
+_DEFAULT_MAX_ATTEMPTS = 5
+
+
+def _encode_attributes(attributes) -> typing.Tuple[dict, int]:
+    if not attributes:
+        return {}, getattr(attributes, "dropped", 0)
+    return dict(attributes.items()), getattr(attributes, "dropped", 0)
+
+
+def _decode_attributes(encoded: dict, dropped: int) -> BoundedAttributes:
+    attributes = BoundedAttributes(
+        None,
+        {
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in encoded.items()
+        },
+    )
+    attributes.dropped = dropped
+    return attributes
+
+
+def _encode_span_context(
+    context: trace_api.SpanContext,
+) -> typing.Optional[list]:
+    if context is None:
+        return None
+    trace_state = (
+        list(context.trace_state.items()) if context.trace_state else []
+    )
+    return [
+        context.trace_id,
+        context.span_id,
+        context.is_remote,
+        context.trace_flags,
+        trace_state,
+    ]
+
+
+def _decode_span_context(
+    encoded: typing.Optional[list],
+) -> typing.Optional[trace_api.SpanContext]:
+    if encoded is None:
+        return None
+    trace_id, span_id, is_remote, trace_flags, trace_state = encoded
+    return trace_api.SpanContext(
+        trace_id,
+        span_id,
+        is_remote=is_remote,
+        trace_flags=trace_api.TraceFlags(trace_flags),
+        trace_state=trace_api.TraceState(
+            [tuple(item) for item in trace_state]
+        ),
+    )
+
+
+def _encode_span(span: ReadableSpan) -> dict:
+    parent = span.parent
+    if isinstance(parent, trace_api.Span):
+        parent = parent.get_span_context()
+    attributes, dropped_attributes = _encode_attributes(span.attributes)
+    events = []
+    for event in span.events:
+        event_attributes, event_dropped = _encode_attributes(event.attributes)
+        events.append(
+            [event.name, event.timestamp, event_attributes, event_dropped]
+        )
+    links = []
+    for link in span.links:
+        link_attributes, link_dropped = _encode_attributes(link.attributes)
+        links.append(
+            [
+                _encode_span_context(link.context),
+                link_attributes,
+                link_dropped,
+            ]
+        )
+    instrumentation_info = span.instrumentation_info
+    return {
+        "name": span.name,
+        "context": _encode_span_context(span.context),
+        "parent": _encode_span_context(parent),
+        "kind": span.kind.value,
+        "start_time": span.start_time,
+        "end_time": span.end_time,
+        "status": [span.status.status_code.value, span.status.description],
+        "attributes": [attributes, dropped_attributes],
+        "events": [events, span.dropped_events],
+        "links": [links, span.dropped_links],
+        "resource": [
+            dict(span.resource.attributes.items()),
+            span.resource.schema_url,
+        ],
+        "instrumentation_info": None
+        if instrumentation_info is None
+        else [instrumentation_info.name, instrumentation_info.version],
+    }
+
+
+class _SpanDecoder:
+    """Decodes spans, sharing `Resource` and `InstrumentationInfo` objects
+    between spans of the same batch."""
+
+    def __init__(self):
+        self._resources = {}  # type: typing.Dict[str, Resource]
+        self._instrumentation_infos = (
+            {}
+        )  # type: typing.Dict[typing.Tuple[str, str], InstrumentationInfo]
+
+    def _decode_resource(self, encoded: list) -> Resource:
+        key = json.dumps(encoded, sort_keys=True)
+        resource = self._resources.get(key)
+        if resource is None:
+            attributes, schema_url = encoded
+            resource = self._resources[key] = Resource(
+                {
+                    key: tuple(value) if isinstance(value, list) else value
+                    for key, value in attributes.items()
+                },
+                schema_url,
+            )
+        return resource
+
+    def _decode_instrumentation_info(
+        self, encoded: typing.Optional[list]
+    ) -> typing.Optional[InstrumentationInfo]:
+        if encoded is None:
+            return None
+        name, version = encoded
+        info = self._instrumentation_infos.get((name, version))
+        if info is None:
+            info = self._instrumentation_infos[
+                (name, version)
+            ] = InstrumentationInfo(name, version)
+        return info
+
+    def decode(self, encoded: dict) -> ReadableSpan:
+        encoded_events, dropped_events = encoded["events"]
+        events = BoundedList(None)
+        events.extend(
+            [
+                Event(
+                    name,
+                    attributes=_decode_attributes(attributes, dropped),
+                    timestamp=timestamp,
+                )
+                for name, timestamp, attributes, dropped in encoded_events
+            ]
+        )
+        events.dropped = dropped_events
+
+        encoded_links, dropped_links = encoded["links"]
+        links = BoundedList(None)
+        for context, attributes, dropped in encoded_links:
+            link = trace_api.Link(
+                _decode_span_context(context),
+                {
+                    key: tuple(value) if isinstance(value, list) else value
+                    for key, value in attributes.items()
+                },
+            )
+            link.attributes.dropped = dropped
+            links.append(link)
+        links.dropped = dropped_links
+
+        status_code, description = encoded["status"]
+        return ReadableSpan(
+            name=encoded["name"],
+            context=_decode_span_context(encoded["context"]),
+            parent=_decode_span_context(encoded["parent"]),
+            resource=self._decode_resource(encoded["resource"]),
+            attributes=_decode_attributes(*encoded["attributes"]),
+            events=events,
+            links=links,
+            kind=trace_api.SpanKind(encoded["kind"]),
+            instrumentation_info=self._decode_instrumentation_info(
+                encoded["instrumentation_info"]
+            ),
+            status=Status(StatusCode(status_code), description),
+            start_time=encoded["start_time"],
+            end_time=encoded["end_time"],
+        )
+
+
+def _read_record(
+    buffer: typing.Union[mmap.mmap, bytes], offset: int
+) -> typing.Optional[bytes]:
+    """Returns the payload of the record at ``offset`` or None if the record
+    is incomplete or corrupt."""
+    header_end = offset + _RECORD_HEADER.size
+    if header_end > len(buffer):
+        return None
+    length, checksum = _RECORD_HEADER.unpack(buffer[offset:header_end])
+    payload = buffer[header_end : header_end + length]
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        return None
+    return payload
+
+
+class SpanSpill:
+    """Append-only segment files holding batches of spans on disk.
+
+    Every batch is appended to the newest segment file as a length prefixed
+    and checksummed record of JSON encoded spans, a new segment is started
+    once the newest one exceeds ``max_segment_bytes``. Batches are replayed
+    in order from memory-mapped segments. The position up to which batches
+    were exported is kept in a cursor file that is replaced atomically, and
+    segments are deleted once fully exported.
+
+    On creation the cursor is loaded from ``directory`` and every record is
+    validated, so a record left half written by a crash is truncated and the
+    remaining batches are replayed after a restart.
+
+    Every batch is flushed to the operating system once written, so stored
+    batches survive a crash of the process. The segments are not synced to
+    disk, batches written shortly before a crash of the operating system or a
+    power loss may be lost.
+
+    Batches that would grow the segment files beyond ``max_bytes`` are
+    dropped, as are batches that failed to export ``max_attempts`` times in a
+    row so that they do not hold back the following ones. Failed attempts are
+    not remembered across restarts. The directory must not be shared between
+    processes.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int,
+        max_segment_bytes: typing.Optional[int] = None,
+        max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
+    ):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer.")
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be a positive integer.")
+        if max_segment_bytes is None:
+            max_segment_bytes = max(max_bytes // 8, 1)
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._max_segment_bytes = max_segment_bytes
+        self._max_attempts = max_attempts
+        # end position of the batch that failed to export and the number of
+        # failed attempts
+        self._failed_position = None  # type: typing.Optional[Position]
+        self._failed_attempts = 0
+        self._lock = threading.Lock()
+        self._write_file = None  # type: typing.Optional[typing.BinaryIO]
+        self.dropped = 0
+        self._segment_sizes = {}  # type: typing.Dict[int, int]
+        for file_name in os.listdir(directory):
+            if file_name.startswith(_SEGMENT_PREFIX) and file_name.endswith(
+                _SEGMENT_SUFFIX
+            ):
+                number = file_name[
+                    len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)
+                ]
+                # only names written by this class, not e.g. copies of them
+                if not number.isdigit() or self._segment_path(
+                    int(number)
+                ) != os.path.join(directory, file_name):
+                    logger.warning(
+                        "Ignoring unexpected file %s in span spill directory.",
+                        file_name,
+                    )
+                    continue
+                segment = int(number)
+                self._segment_sizes[segment] = self._recover_segment(segment)
+        self._read_position = self._load_cursor()
+        for segment in list(self._segment_sizes):
+            if segment < self._read_position[0]:
+                self._remove_segment(segment)
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(
+            self._directory,
+            "{}{:020d}{}".format(_SEGMENT_PREFIX, segment, _SEGMENT_SUFFIX),
+        )
+
+    def _recover_segment(self, segment: int) -> int:
+        """Truncates a segment after its last valid record and returns its
+        size."""
+        path = self._segment_path(segment)
+        with open(path, "rb") as segment_file:
+            content = segment_file.read()
+        offset = 0
+        while offset < len(content):
+            payload = _read_record(content, offset)
+            if payload is None:
+                logger.warning(
+                    "Truncating incomplete span spill segment %s at %s.",
+                    path,
+                    offset,
+                )
+                with open(path, "r+b") as segment_file:
+                    segment_file.truncate(offset)
+                break
+            offset += _RECORD_HEADER.size + len(payload)
+        return offset
+
+    def _load_cursor(self) -> Position:
+        first_segment = min(self._segment_sizes, default=0)
+        try:
+            with open(
+                os.path.join(self._directory, _CURSOR_FILE_NAME)
+            ) as cursor_file:
+                segment, offset = json.load(cursor_file)
+        except FileNotFoundError:
+            return first_segment, 0
+        except (ValueError, TypeError):
+            logger.warning("Ignoring invalid span spill cursor.")
+            return first_segment, 0
+        if segment not in self._segment_sizes:
+            return max(segment + 1, first_segment), 0
+        return segment, min(offset, self._segment_sizes[segment])
+
+    def _store_cursor(self) -> None:
+        path = os.path.join(self._directory, _CURSOR_FILE_NAME)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as cursor_file:
+            json.dump(list(self._read_position), cursor_file)
+        os.replace(temp_path, path)
+
+    def _remove_segment(self, segment: int) -> None:
+        os.remove(self._segment_path(segment))
+        del self._segment_sizes[segment]
+
+    @property
+    def size(self) -> int:
+        """The number of bytes held in segment files."""
+        return sum(self._segment_sizes.values())
+
+    def is_empty(self) -> bool:
+        """Returns True if every stored batch was exported."""
+        segment, offset = self._read_position
+        return all(
+            offset >= size if other == segment else other < segment
+            for other, size in self._segment_sizes.items()
+        )
+
+    def write(self, spans: typing.Sequence[ReadableSpan]) -> bool:
+        """Appends a batch of spans.
+
+        Returns:
+            False if the batch was dropped because the size limit was reached,
+            True otherwise.
+        """
+        payload = json.dumps(
+            [_encode_span(span) for span in spans], separators=(",", ":")
+        ).encode("utf-8")
+        record = (
+            _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        )
+        with self._lock:
+            if self.size + len(record) > self._max_bytes:
+                if not self.dropped:
+                    logger.warning(
+                        "Span spill is full, spans will be dropped."
+                    )
+                self.dropped += len(spans)
+                return False
+
+            if self._segment_sizes:
+                segment = max(self._segment_sizes)
+                if (
+                    self._segment_sizes[segment]
+                    and self._segment_sizes[segment] + len(record)
+                    > self._max_segment_bytes
+                ):
+                    segment += 1
+            else:
+                segment = self._read_position[0]
+            if segment not in self._segment_sizes:
+                if self._write_file is not None:
+                    self._write_file.close()
+                    self._write_file = None
+                self._segment_sizes[segment] = 0
+            if self._write_file is None:
+                self._write_file = open(
+                    self._segment_path(segment), "ab"
+                )
+            self._write_file.write(record)
+            self._write_file.flush()
+            self._segment_sizes[segment] += len(record)
+        return True
+
+    def read(
+        self,
+    ) -> typing.Optional[typing.Tuple[typing.List[ReadableSpan], Position]]:
+        """Returns the oldest batch that was not exported yet together with
+        the position to `commit` once it is exported, or None if every batch
+        was exported.
+
+        Must only be called by a single consumer thread.
+        """
+        with self._lock:
+            while True:
+                segment, offset = self._read_position
+                size = self._segment_sizes.get(segment)
+                if size is None or offset >= size:
+                    newer = [
+                        other
+                        for other in self._segment_sizes
+                        if other > segment
+                    ]
+                    if not newer:
+                        return None
+                    if size is not None:
+                        self._remove_segment(segment)
+                    self._read_position = (min(newer), 0)
+                    self._store_cursor()
+                    continue
+
+                with open(self._segment_path(segment), "rb") as segment_file:
+                    with mmap.mmap(
+                        segment_file.fileno(), size, access=mmap.ACCESS_READ
+                    ) as segment_map:
+                        payload = _read_record(segment_map, offset)
+                if payload is None:
+                    # should not happen as the segments were validated,
+                    # skip the rest of the segment
+                    logger.error(
+                        "Invalid record in span spill segment %s at %s.",
+                        segment,
+                        offset,
+                    )
+                    self._read_position = (segment, size)
+                    continue
+                position = (
+                    segment,
+                    offset + _RECORD_HEADER.size + len(payload),
+                )
+                break
+
+        try:
+            decoder = _SpanDecoder()
+            spans = [decoder.decode(span) for span in json.loads(payload)]
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Dropping span spill record that can't be read.")
+            spans = []
+        return spans, position
+
+    def commit(self, position: Position) -> None:
+        """Marks every batch up to ``position`` as exported."""
+        with self._lock:
+            self._read_position = position
+            self._store_cursor()
+
+    def fail(self, position: Position, num_spans: int) -> None:
+        """Records a failed export of the batch read with ``position``.
+
+        The batch is dropped and counted in `dropped` once it failed
+        ``max_attempts`` times.
+        """
+        with self._lock:
+            if position != self._failed_position:
+                self._failed_position = position
+                self._failed_attempts = 0
+            self._failed_attempts += 1
+            if self._failed_attempts < self._max_attempts:
+                return
+            logger.warning(
+                "Dropping %s spilled spans that failed to export %s times.",
+                num_spans,
+                self._failed_attempts,
+            )
+            self.dropped += num_spans
+            self._failed_position = None
+            self._read_position = position
+            self._store_cursor()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._write_file is not None:
+                self._write_file.close()
+                self._write_file = None
@@ -13,8 +13,11 @@
 # limitations under the License.
 
 import abc
+import functools
 import random
 
+from opentelemetry.sdk.util import _register_at_fork_reinit
+
 
 class IdGenerator(abc.ABC):
     @abc.abstractmethod
@@ -50,3 +53,33 @@ class RandomIdGenerator(IdGenerator):
 
     def generate_trace_id(self) -> int:
         return random.getrandbits(128)
+
+
+class FastRandomIdGenerator(IdGenerator):
+    """Randomly generates all bits of IDs like `RandomIdGenerator`, from its
+    own random number generator seeded with `os.urandom`.
+
+    The ID methods of an instance are bound to the generator, so that no
+    Python code runs for a new ID. The generator is reseeded in forked child
+    processes, which never repeat the IDs of their parent.
+    """
+
+    def __init__(self):
+        self._random = random.Random()
+        # pylint: disable=method-hidden
+        self.generate_span_id = functools.partial(  # type: ignore
+            self._random.getrandbits, 64
+        )
+        self.generate_trace_id = functools.partial(  # type: ignore
+            self._random.getrandbits, 128
+        )
+        _register_at_fork_reinit(self._at_fork_reinit)
+
+    def _at_fork_reinit(self):
+        self._random.seed()
+
+    def generate_span_id(self) -> int:  # pylint: disable=method-hidden
+        return self._random.getrandbits(64)
+
+    def generate_trace_id(self) -> int:  # pylint: disable=method-hidden
+        return self._random.getrandbits(128)
@@ -112,7 +112,7 @@ from opentelemetry.sdk.environment_variables import (
     OTEL_TRACES_SAMPLER_ARG,
 )
 from opentelemetry.trace import Link, SpanKind, get_current_span
-from opentelemetry.trace.span import TraceState
+from opentelemetry.trace.span import DEFAULT_TRACE_STATE, TraceState
 from opentelemetry.util.types import Attributes
 
 _logger = getLogger(__name__)
@@ -163,6 +163,53 @@ class SamplingResult:
         self.trace_state = trace_state
 
 
+class _SharedSamplingResult(SamplingResult):
+    """A `SamplingResult` without attributes that is returned for every span
+    with the same decision and trace state, so it can't be modified."""
+
+    def __init__(
+        self, decision: Decision, trace_state: Optional["TraceState"]
+    ) -> None:
+        super().__init__(decision, None, trace_state)
+        self._read_only = True
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if getattr(self, "_read_only", False):
+            raise AttributeError("Shared SamplingResult can't be modified.")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Shared SamplingResult can't be modified.")
+
+
+# results of decisions without attributes are shared, for root spans and
+# for parents with the default trace state
+_ROOT_RESULTS = {
+    decision: _SharedSamplingResult(decision, None) for decision in Decision
+}
+_DEFAULT_TRACE_STATE_RESULTS = {
+    decision: _SharedSamplingResult(decision, DEFAULT_TRACE_STATE)
+    for decision in Decision
+}
+
+
+def _get_sampling_result(
+    decision: Decision,
+    attributes: Attributes,
+    trace_state: Optional["TraceState"],
+) -> SamplingResult:
+    """Returns the result of a decision, dropped spans don't get any
+    attributes."""
+    if decision is Decision.DROP or not attributes:
+        if trace_state is None:
+            return _ROOT_RESULTS[decision]
+        if trace_state is DEFAULT_TRACE_STATE:
+            return _DEFAULT_TRACE_STATE_RESULTS[decision]
+        if decision is Decision.DROP:
+            attributes = None
+    return SamplingResult(decision, attributes, trace_state)
+
+
 class Sampler(abc.ABC):
     @abc.abstractmethod
     def should_sample(
@@ -198,9 +245,7 @@ class StaticSampler(Sampler):
         links: Sequence["Link"] = None,
         trace_state: "TraceState" = None,
     ) -> "SamplingResult":
-        if self._decision is Decision.DROP:
-            attributes = None
-        return SamplingResult(
+        return _get_sampling_result(
             self._decision,
             attributes,
             _get_parent_trace_state(parent_context),
@@ -263,9 +308,7 @@ class TraceIdRatioBased(Sampler):
         decision = Decision.DROP
         if trace_id & self.TRACE_ID_LIMIT < self.bound:
             decision = Decision.RECORD_AND_SAMPLE
-        if decision is Decision.DROP:
-            attributes = None
-        return SamplingResult(
+        return _get_sampling_result(
             decision,
             attributes,
             _get_parent_trace_state(parent_context),
@@ -13,13 +13,18 @@
 # limitations under the License.
 
 import datetime
+import logging
+import os
 import threading
-from collections import OrderedDict, deque
+import weakref
+from collections import OrderedDict
 from collections.abc import MutableMapping, Sequence
-from typing import Optional
+from typing import Callable, Optional
 
 from deprecated import deprecated
 
+logger = logging.getLogger(__name__)
+
 
 def ns_to_iso_str(nanoseconds):
     """Get an ISO 8601 string from time_ns value."""
@@ -41,49 +46,92 @@ def get_dict_as_key(labels):
     )
 
 
+# live instances mapped to the function reinitializing them after a fork
+_AT_FORK_REINIT_FUNCTIONS = (
+    weakref.WeakKeyDictionary()
+)  # type: weakref.WeakKeyDictionary
+
+
+def _at_fork_reinit() -> None:
+    for instance, reinit in list(_AT_FORK_REINIT_FUNCTIONS.items()):
+        try:
+            reinit(instance)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Failed to reinitialize %r after fork.", instance)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_at_fork_reinit)
+
+
+def _register_at_fork_reinit(reinit: Callable[[], None]) -> None:
+    """Registers a bound method to be called in the child process after a
+    `os.fork`.
+
+    A single fork hook calls the methods of every registered instance that
+    is alive. Only a weak reference to the instance is kept, so registering
+    it does not prevent it from being garbage collected. On platforms
+    without `os.register_at_fork` the methods are never called.
+    """
+    _AT_FORK_REINIT_FUNCTIONS[reinit.__self__] = reinit.__func__
+
+
 class BoundedList(Sequence):
     """An append only list with a fixed max size.
 
     Calls to `append` and `extend` will drop the oldest elements if there is
-    not enough room.
+    not enough room. Once frozen they raise `TypeError`.
     """
 
+    __slots__ = ("dropped", "_maxlen", "_list", "_lock", "_immutable")
+
     def __init__(self, maxlen: Optional[int]):
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be non-negative")
         self.dropped = 0
-        self._dq = deque(maxlen=maxlen)  # type: deque
+        self._maxlen = maxlen
+        # a list is much smaller than a deque, evicting from its head is
+        # cheap for the usual limits
+        self._list = []  # type: list
         self._lock = threading.Lock()
+        self._immutable = False
 
     def __repr__(self):
         return "{}({}, maxlen={})".format(
-            type(self).__name__, list(self._dq), self._dq.maxlen
+            type(self).__name__, list(self._list), self._maxlen
         )
 
     def __getitem__(self, index):
-        return self._dq[index]
+        return self._list[index]
 
     def __len__(self):
-        return len(self._dq)
+        return len(self._list)
 
     def __iter__(self):
         with self._lock:
-            return iter(deque(self._dq))
+            return iter(self._list.copy())
 
     def append(self, item):
+        if self._immutable:
+            raise TypeError("BoundedList is immutable")
         with self._lock:
-            if (
-                self._dq.maxlen is not None
-                and len(self._dq) == self._dq.maxlen
-            ):
+            if self._maxlen is not None and len(self._list) >= self._maxlen:
                 self.dropped += 1
-            self._dq.append(item)
+                if not self._list:
+                    return
+                del self._list[0]
+            self._list.append(item)
 
     def extend(self, seq):
+        if self._immutable:
+            raise TypeError("BoundedList is immutable")
         with self._lock:
-            if self._dq.maxlen is not None:
-                to_drop = len(seq) + len(self._dq) - self._dq.maxlen
+            self._list.extend(seq)
+            if self._maxlen is not None:
+                to_drop = len(self._list) - self._maxlen
                 if to_drop > 0:
                     self.dropped += to_drop
-            self._dq.extend(seq)
+                    del self._list[:to_drop]
 
     @classmethod
     def from_seq(cls, maxlen, seq):
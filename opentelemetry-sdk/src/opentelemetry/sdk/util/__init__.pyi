@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from typing import (
+    Callable,
     Iterable,
     Iterator,
     Mapping,
@@ -32,6 +33,7 @@ def ns_to_iso_str(nanoseconds: int) -> str: ...
 def get_dict_as_key(
     labels: Mapping[str, AttributeValue]
 ) -> AttributesAsKey: ...
+def _register_at_fork_reinit(reinit: Callable[[], None]) -> None: ...
 
 class BoundedList(Sequence[_T]):
     """An append only list with a fixed max size.
@@ -0,0 +1,61 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tracemalloc
+
+import pytest
+
+import opentelemetry.sdk.trace as trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import sampling
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
+
+
+def _bytes_per_ended_span(
+    start_span,
+    sampler=sampling.DEFAULT_ON,
+    resource=Resource.create({}),
+    num_spans=1000,
+):
+    """Returns the memory held per span in the queue of a span processor,
+    for spans started with ``start_span(tracer)`` and then ended.
+
+    The queue holds every span and the worker thread of the processor is
+    never woken up before the measurement ends.
+    """
+    tracer_provider = trace.TracerProvider(
+        sampler=sampler, resource=resource, shutdown_on_exit=False
+    )
+    span_processor = BatchSpanProcessor(
+        SpanExporter(),
+        max_queue_size=num_spans + 1,
+        max_export_batch_size=num_spans + 1,
+        schedule_delay_millis=3600 * 1e3,
+    )
+    tracer_provider.add_span_processor(span_processor)
+    tracer = tracer_provider.get_tracer("sdk_tracer_provider")
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(num_spans):
+        start_span(tracer).end()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    tracer_provider.shutdown()
+    return size / num_spans
+
+
+@pytest.fixture
+def bytes_per_ended_span():
+    return _bytes_per_ended_span
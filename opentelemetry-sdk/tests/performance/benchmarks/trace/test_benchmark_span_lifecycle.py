@@ -0,0 +1,225 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of the whole life of SDK spans, from starting them to handing
+them to the span processors, and of the memory ended spans hold."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import opentelemetry.sdk.trace as trace
+from opentelemetry import trace as trace_api
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import sampling
+
+_RESOURCE = Resource(
+    {
+        "service.name": "A123456789",
+        "service.version": "1.34567890",
+        "service.instance.id": "123ab456-a123-12ab-12ab-12340a1abc12",
+    }
+)
+
+_HTTP_ATTRIBUTES = {
+    "http.method": "GET",
+    "http.scheme": "https",
+    "http.host": "example.com",
+    "http.target": "/api/v1/users?page=2",
+    "http.route": "/api/v1/users",
+    "http.flavor": "1.1",
+    "http.user_agent": "Mozilla/5.0 (X11; Linux x86_64)",
+    "http.status_code": 200,
+    "net.peer.ip": "10.0.0.1",
+    "net.peer.port": 43210,
+}
+
+_SAMPLERS = {
+    "always_on": sampling.ALWAYS_ON,
+    "always_off": sampling.ALWAYS_OFF,
+    "parentbased_always_on": sampling.DEFAULT_ON,
+    "parentbased_always_off": sampling.DEFAULT_OFF,
+    "traceidratio": sampling.TraceIdRatioBased(0.5),
+    "parentbased_traceidratio": sampling.ParentBasedTraceIdRatio(0.5),
+}
+
+_MULTI_SPAN_PROCESSORS = {
+    "synchronous": trace.SynchronousMultiSpanProcessor,
+    "concurrent": trace.ConcurrentMultiSpanProcessor,
+}
+
+
+def _get_tracer(sampler=sampling.DEFAULT_ON, active_span_processor=None):
+    return trace.TracerProvider(
+        sampler=sampler,
+        resource=_RESOURCE,
+        active_span_processor=active_span_processor,
+        shutdown_on_exit=False,
+    ).get_tracer("sdk_tracer_provider")
+
+
+def _attributes(num_attributes):
+    return {
+        "attribute.{}".format(index): "value {}".format(index)
+        for index in range(num_attributes)
+    }
+
+
+@pytest.mark.parametrize("depth", [1, 4, 16])
+def test_nested_spans(benchmark, depth):
+    tracer = _get_tracer()
+
+    def start_nested_spans(remaining):
+        with tracer.start_as_current_span("nestedSpan"):
+            if remaining > 1:
+                start_nested_spans(remaining - 1)
+
+    benchmark(start_nested_spans, depth)
+
+
+@pytest.mark.parametrize("num_attributes", [0, 10, 50])
+def test_span_attributes(benchmark, num_attributes):
+    tracer = _get_tracer()
+    attributes = _attributes(num_attributes)
+
+    def start_span():
+        tracer.start_span("attributeSpan", attributes=attributes).end()
+
+    benchmark(start_span)
+
+
+def test_http_server_span(benchmark):
+    tracer = _get_tracer()
+
+    def start_span():
+        span = tracer.start_span("HTTP GET", kind=trace_api.SpanKind.SERVER)
+        span.set_attributes(_HTTP_ATTRIBUTES)
+        span.set_status(trace_api.Status(trace_api.StatusCode.OK))
+        span.end()
+
+    benchmark(start_span)
+
+
+def test_span_events_and_links(benchmark):
+    tracer = _get_tracer()
+    links = [
+        trace_api.Link(
+            trace_api.SpanContext(0xDEADBEEF, index + 1, is_remote=True),
+            {"link.index": index},
+        )
+        for index in range(4)
+    ]
+
+    def start_span():
+        span = tracer.start_span("eventSpan", links=links)
+        for index in range(8):
+            span.add_event("event", {"event.index": index})
+        span.end()
+
+    benchmark(start_span)
+
+
+def test_record_exception(benchmark):
+    tracer = _get_tracer()
+    exception = ValueError("benchmark")
+
+    def start_span():
+        span = tracer.start_span("exceptionSpan")
+        span.record_exception(exception)
+        span.end()
+
+    benchmark(start_span)
+
+
+@pytest.mark.parametrize("sampler", sorted(_SAMPLERS))
+def test_sampler(benchmark, sampler):
+    tracer = _get_tracer(sampler=_SAMPLERS[sampler])
+
+    def start_child_span():
+        with tracer.start_as_current_span("parentSpan"):
+            tracer.start_span("childSpan").end()
+
+    benchmark(start_child_span)
+
+
+@pytest.mark.parametrize("num_span_processors", [1, 2, 4])
+@pytest.mark.parametrize(
+    "multi_span_processor", sorted(_MULTI_SPAN_PROCESSORS)
+)
+def test_multi_span_processor(
+    benchmark, multi_span_processor, num_span_processors
+):
+    active_span_processor = _MULTI_SPAN_PROCESSORS[multi_span_processor]()
+    for _ in range(num_span_processors):
+        active_span_processor.add_span_processor(trace.SpanProcessor())
+    tracer = _get_tracer(active_span_processor=active_span_processor)
+
+    def start_span():
+        tracer.start_span("processedSpan").end()
+
+    benchmark(start_span)
+    active_span_processor.shutdown()
+
+
+@pytest.mark.parametrize("num_threads", [1, 2, 4])
+def test_threads(benchmark, num_threads):
+    """Starts 100 spans on every thread, all threads sharing the same tracer
+    and span processor."""
+    tracer = _get_tracer()
+
+    def start_spans():
+        for _ in range(100):
+            with tracer.start_as_current_span("threadSpan") as span:
+                span.set_attribute("http.method", "GET")
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+
+        def start_spans_on_threads():
+            for future in [
+                executor.submit(start_spans) for _ in range(num_threads)
+            ]:
+                future.result()
+
+        benchmark(start_spans_on_threads)
+
+
+@pytest.mark.parametrize(
+    "span_kind",
+    ["empty", "http_attributes", "events", "dropped"],
+)
+def test_ended_span_bytes(benchmark, bytes_per_ended_span, span_kind):
+    """Measures the bytes held per ended span in the queue of a span
+    processor, reported in extra_info."""
+    sampler = sampling.DEFAULT_ON
+    if span_kind == "dropped":
+        # spans that are not sampled never reach the queue
+        sampler = sampling.ALWAYS_OFF
+
+    def start_span(tracer):
+        if span_kind == "http_attributes":
+            return tracer.start_span("span", attributes=_HTTP_ATTRIBUTES)
+        span = tracer.start_span("span")
+        if span_kind == "events":
+            for index in range(8):
+                span.add_event("event", {"event.index": index})
+        return span
+
+    bytes_per_span = benchmark.pedantic(
+        bytes_per_ended_span,
+        args=(start_span,),
+        kwargs={"sampler": sampler, "resource": _RESOURCE},
+        rounds=1,
+        iterations=1,
+    )
+    benchmark.extra_info["bytes_per_span"] = bytes_per_span
@@ -16,15 +16,21 @@ import opentelemetry.sdk.trace as trace
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import sampling
 
+_RESOURCE = Resource(
+    {
+        "service.name": "A123456789",
+        "service.version": "1.34567890",
+        "service.instance.id": "123ab456-a123-12ab-12ab-12340a1abc12",
+    }
+)
+
 tracer = trace.TracerProvider(
     sampler=sampling.DEFAULT_ON,
-    resource=Resource(
-        {
-            "service.name": "A123456789",
-            "service.version": "1.34567890",
-            "service.instance.id": "123ab456-a123-12ab-12ab-12340a1abc12",
-        }
-    ),
+    resource=_RESOURCE,
+).get_tracer("sdk_tracer_provider")
+
+dropping_tracer = trace.TracerProvider(
+    sampler=sampling.ParentBasedTraceIdRatio(0.0),
 ).get_tracer("sdk_tracer_provider")
 
 
@@ -49,3 +55,44 @@ def test_simple_start_as_current_span(benchmark):
             span.add_event("benchmarkEvent")
 
     benchmark(benchmark_start_as_current_span)
+
+
+def test_sampled_span(benchmark):
+    def benchmark_sampled_span():
+        span = tracer.start_span(
+            "benchmarkedSpan", attributes={"http.method": "GET"}
+        )
+        span.end()
+
+    benchmark(benchmark_sampled_span)
+
+
+def test_dropped_span(benchmark):
+    def benchmark_dropped_span():
+        span = dropping_tracer.start_span(
+            "benchmarkedSpan", attributes={"http.method": "GET"}
+        )
+        span.end()
+
+    benchmark(benchmark_dropped_span)
+
+
+def test_ended_span_memory(benchmark, bytes_per_ended_span):
+    """Measures the bytes held per ended span, reported in extra_info."""
+
+    def start_span(tracer):
+        span = tracer.start_span(
+            "benchmarkedSpan",
+            attributes={"long.attribute": -10000000001000000000},
+        )
+        span.add_event("benchmarkEvent")
+        return span
+
+    bytes_per_span = benchmark.pedantic(
+        bytes_per_ended_span,
+        args=(start_span,),
+        kwargs={"resource": _RESOURCE},
+        rounds=1,
+        iterations=1,
+    )
+    benchmark.extra_info["bytes_per_span"] = bytes_per_span
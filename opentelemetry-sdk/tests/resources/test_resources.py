@@ -167,6 +167,66 @@ class TestResources(unittest.TestCase):
             resources.Resource({"service": "not-ui", "host": "service-host"}),
         )
 
+    def test_hash_and_equality(self):
+        resource = resources.Resource(
+            {"service": "ui", "hosts": ["a", "b"], "port": 1}
+        )
+        same_resource = resources.Resource(
+            {"port": 1, "hosts": ("a", "b"), "service": "ui"}
+        )
+        self.assertEqual(resource, same_resource)
+        self.assertEqual(hash(resource), hash(same_resource))
+
+        for other in (
+            resources.Resource({"service": "ui"}),
+            resources.Resource(
+                {"service": "ui", "hosts": ["a", "b"], "port": 2}
+            ),
+            resources.Resource(
+                {"service": "ui", "hosts": ["a", "b"], "port": 1},
+                "https://opentelemetry.io/schemas/1.3.0",
+            ),
+        ):
+            self.assertNotEqual(resource, other)
+        self.assertNotEqual(resource, {"service": "ui"})
+
+    def test_interning(self):
+        attributes = {"service": "ui", "id": str(uuid.uuid4())}
+        resource = resources.Resource.create(attributes)
+        self.assertIs(resources.Resource.create(attributes), resource)
+        self.assertIsNot(
+            resources.Resource.create(attributes, "https://schema"),
+            resource,
+        )
+
+        left = resources.Resource({"service": "ui"})
+        right = resources.Resource({"host": "service-host"})
+        merged = left.merge(right)
+        self.assertIs(left.merge(right), merged)
+        self.assertIs(
+            resources.Resource({"host": "service-host"}).merge(left).merge(
+                right
+            ),
+            merged,
+        )
+
+    def test_interning_value_types(self):
+        # 1, 1.0 and True are equal in Python, but not as attributes
+        created = []
+        for value in (True, 1.0, 1, (1, 0), (1.0, 0.0), (True, False)):
+            attributes = {"service": "ui", "value": value}
+            resource = resources.Resource.create(attributes)
+            created.append(resource)
+            self.assertIs(type(resource.attributes["value"]), type(value))
+            if isinstance(value, tuple):
+                self.assertEqual(
+                    list(map(type, resource.attributes["value"])),
+                    list(map(type, value)),
+                )
+        for index, resource in enumerate(created):
+            for other in created[index + 1 :]:
+                self.assertNotEqual(resource, other)
+
     def test_immutability(self):
         attributes = {
             "service": "ui",
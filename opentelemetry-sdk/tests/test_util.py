@@ -12,8 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+import os
+import threading
 import unittest
+import weakref
+from unittest import mock
 
+from opentelemetry.sdk import util
 from opentelemetry.sdk.util import BoundedList
 
 
@@ -141,3 +147,68 @@ class TestBoundedList(unittest.TestCase):
 
         for num in range(100):
             self.assertEqual(blist[num], num)
+
+    def test_concurrent_writes(self):
+        blist = BoundedList(maxlen=10)
+
+        def write():
+            for num in range(100):
+                blist.append(num)
+                blist.extend((num, num))
+
+        threads = [threading.Thread(target=write) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(blist), 10)
+        self.assertEqual(blist.dropped, 2390)
+
+
+class _Reinitialized:
+    def __init__(self):
+        self.reinit_count = 0
+        util._register_at_fork_reinit(  # pylint: disable=protected-access
+            self._at_fork_reinit
+        )
+
+    def _at_fork_reinit(self):
+        self.reinit_count += 1
+
+
+class TestRegisterAtForkReinit(unittest.TestCase):
+    # pylint: disable=protected-access
+    @mock.patch.object(
+        util, "_AT_FORK_REINIT_FUNCTIONS", weakref.WeakKeyDictionary()
+    )
+    def test_register(self):
+        first = _Reinitialized()
+        second = _Reinitialized()
+
+        util._at_fork_reinit()
+        self.assertEqual(first.reinit_count, 1)
+        self.assertEqual(second.reinit_count, 1)
+
+        # instances are released and unregistered once collected
+        del first
+        gc.collect()
+        self.assertEqual(len(util._AT_FORK_REINIT_FUNCTIONS), 1)
+        util._at_fork_reinit()
+        self.assertEqual(second.reinit_count, 2)
+
+    @unittest.skipUnless(hasattr(os, "register_at_fork"), "requires fork")
+    def test_fork(self):
+        instance = _Reinitialized()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, bytes([instance.reinit_count]))
+            os._exit(0)  # pylint: disable=protected-access
+        os.close(write_fd)
+        reinit_count = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        self.assertEqual(reinit_count, bytes([1]))
+        self.assertEqual(instance.reinit_count, 0)
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import multiprocessing
 import os
+import tempfile
 import threading
 import time
 import unittest
@@ -28,6 +30,9 @@ from opentelemetry.sdk.environment_variables import (
     OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
     OTEL_BSP_MAX_QUEUE_SIZE,
     OTEL_BSP_SCHEDULE_DELAY,
+    OTEL_PYTHON_BSP_ADAPTIVE_BATCHING,
+    OTEL_PYTHON_BSP_EXPORT_WORKERS,
+    OTEL_PYTHON_BSP_QUEUE_TYPE,
 )
 from opentelemetry.sdk.trace import export
 
@@ -141,6 +146,16 @@ class TestSimpleSpanProcessor(unittest.TestCase):
 
         self.assertListEqual([], spans_names_list)
 
+    def test_simple_span_processor_force_flush_exporter(self):
+        my_exporter = MySpanExporter(destination=[])
+        span_processor = export.SimpleSpanProcessor(my_exporter)
+        self.assertTrue(span_processor.force_flush())
+        with mock.patch.object(
+            my_exporter, "force_flush", return_value=False
+        ) as mock_force_flush:
+            self.assertFalse(span_processor.force_flush(100))
+        mock_force_flush.assert_called_once_with(100)
+
 
 def _create_start_and_end_span(name, span_processor):
     span = trace._Span(
@@ -178,6 +193,19 @@ class TestBatchSpanProcessor(unittest.TestCase):
         self.assertEqual(batch_span_processor.max_export_batch_size, 3)
         self.assertEqual(batch_span_processor.export_timeout_millis, 4)
 
+    @mock.patch.dict(
+        "os.environ", {OTEL_PYTHON_BSP_QUEUE_TYPE: "per_thread"}
+    )
+    def test_batch_span_processor_queue_type_environment_variable(self):
+        batch_span_processor = export.BatchSpanProcessor(
+            MySpanExporter(destination=[])
+        )
+
+        self.assertIsInstance(
+            batch_span_processor.queue, export._PerThreadSpanQueue
+        )
+        batch_span_processor.shutdown()
+
     def test_on_start_accepts_parent_context(self):
         # pylint: disable=no-self-use
         my_exporter = MySpanExporter(destination=[])
@@ -245,6 +273,27 @@ class TestBatchSpanProcessor(unittest.TestCase):
 
         self.assertTrue(span_processor.force_flush())
 
+    def test_flush_exporter(self):
+        """Test that force_flush flushes the exporter once the spans are
+        exported"""
+        spans_names_list = []
+
+        my_exporter = MySpanExporter(destination=spans_names_list)
+        span_processor = export.BatchSpanProcessor(my_exporter)
+        _create_start_and_end_span("foo", span_processor)
+
+        def force_flush(timeout_millis):
+            self.assertEqual(spans_names_list, ["foo"])
+            self.assertLessEqual(timeout_millis, 1000)
+            return False
+
+        with mock.patch.object(
+            my_exporter, "force_flush", side_effect=force_flush
+        ) as mock_force_flush:
+            self.assertFalse(span_processor.force_flush(1000))
+        mock_force_flush.assert_called_once()
+        span_processor.shutdown()
+
     def test_flush_from_multiple_threads(self):
         num_threads = 50
         num_spans = 10
@@ -331,6 +380,388 @@ class TestBatchSpanProcessor(unittest.TestCase):
         self.assertEqual(len(spans_names_list), 1024)
         span_processor.shutdown()
 
+    def test_batch_span_processor_per_thread_queue(self):
+        """Test that no spans are lost when many threads use a per thread
+        queue"""
+        num_threads = 16
+        num_spans = 64
+        spans_names_list = []
+
+        my_exporter = MySpanExporter(
+            destination=spans_names_list, max_export_batch_size=128
+        )
+        span_processor = export.BatchSpanProcessor(
+            my_exporter,
+            max_queue_size=num_threads * num_spans,
+            max_export_batch_size=128,
+            queue_type="per_thread",
+        )
+
+        def create_spans(tno: int):
+            for span_idx in range(num_spans):
+                _create_start_and_end_span(
+                    "Span {}-{}".format(tno, span_idx), span_processor
+                )
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            for thread_no in range(num_threads):
+                executor.submit(create_spans, thread_no)
+
+        self.assertTrue(span_processor.force_flush())
+        self.assertEqual(len(spans_names_list), num_threads * num_spans)
+        self.assertEqual(span_processor.dropped_spans, 0)
+        # spans ended by the same thread keep their order
+        spans_of_first_thread = [
+            name for name in spans_names_list if name.startswith("Span 0-")
+        ]
+        self.assertListEqual(
+            spans_of_first_thread,
+            ["Span 0-{}".format(idx) for idx in range(num_spans)],
+        )
+        span_processor.shutdown()
+
+    def test_per_thread_queue_notify(self):
+        """Test the consumer is notified once per batch, also when the batch
+        size shrinks below the occupancy of the queue"""
+        queue = export._PerThreadSpanQueue(
+            max_queue_size=64, max_export_batch_size=8
+        )
+        spans_list = [None] * 8
+        span = trace.ReadableSpan("foo")
+
+        notified = [queue.put(span) for _ in range(6)]
+        self.assertNotIn(True, notified)
+        queue.export_batch_size = 4
+        notified = [queue.put(span) for _ in range(3)]
+        self.assertListEqual(notified, [True, False, False])
+
+        self.assertEqual(queue.pop_into(spans_list, 4), 4)
+        self.assertTrue(queue.put(span))
+        self.assertFalse(queue.put(span))
+
+    def test_batch_span_processor_dropped_spans(self):
+        for queue_type in ("shared", "per_thread"):
+            with self.subTest(queue_type=queue_type):
+                spans_names_list = []
+                my_exporter = MySpanExporter(destination=spans_names_list)
+                span_processor = export.BatchSpanProcessor(
+                    my_exporter,
+                    max_queue_size=8,
+                    max_export_batch_size=8,
+                    schedule_delay_millis=30000,
+                    queue_type=queue_type,
+                )
+                # keep the worker thread asleep so the queue fills up
+                with mock.patch.object(span_processor.condition, "notify"):
+                    with self.assertLogs(level=WARNING):
+                        for _ in range(12):
+                            _create_start_and_end_span(
+                                "foo", span_processor
+                            )
+
+                self.assertEqual(span_processor.dropped_spans, 4)
+                self.assertTrue(span_processor.force_flush())
+                self.assertEqual(len(spans_names_list), 8)
+                span_processor.shutdown()
+
+    def test_batch_span_processor_spill(self):
+        """Test that failed batches and spans overflowing the queue are
+        exported from disk once the exporter recovers"""
+        spans_names_list = []
+        my_exporter = MySpanExporter(destination=spans_names_list)
+        with tempfile.TemporaryDirectory() as spill_directory:
+            span_processor = export.BatchSpanProcessor(
+                my_exporter,
+                max_queue_size=4,
+                max_export_batch_size=4,
+                schedule_delay_millis=30000,
+                spill_directory=spill_directory,
+            )
+            with mock.patch.object(
+                my_exporter,
+                "export",
+                return_value=export.SpanExportResult.FAILURE,
+            ):
+                # keep the worker thread asleep so the queue fills up
+                with mock.patch.object(span_processor.condition, "notify"):
+                    for _ in range(6):
+                        _create_start_and_end_span("foo", span_processor)
+                self.assertEqual(span_processor.dropped_spans, 0)
+                self.assertTrue(span_processor.force_flush())
+                self.assertEqual(spans_names_list, [])
+
+            _create_start_and_end_span("bar", span_processor)
+            self.assertTrue(span_processor.force_flush())
+            # the next iteration of the worker exports the spilled spans
+            self.assertTrue(span_processor.force_flush())
+            span_processor.shutdown()
+
+        self.assertEqual(sorted(spans_names_list), ["bar"] + ["foo"] * 6)
+
+    def test_batch_span_processor_spill_outage(self):
+        """Test that spilled spans survive an outage of the exporter longer
+        than max_attempts worker periods"""
+        spans_names_list = []
+        outage = threading.Event()
+        outage.set()
+
+        class UnavailableSpanExporter(MySpanExporter):
+            def export(self, spans):
+                if outage.is_set():
+                    return export.SpanExportResult.FAILURE
+                return super().export(spans)
+
+        my_exporter = UnavailableSpanExporter(destination=spans_names_list)
+        with tempfile.TemporaryDirectory() as spill_directory:
+            span_processor = export.BatchSpanProcessor(
+                my_exporter,
+                max_queue_size=8,
+                max_export_batch_size=4,
+                schedule_delay_millis=20,
+                spill_directory=spill_directory,
+            )
+            for index in range(3):
+                for _ in range(4):
+                    _create_start_and_end_span(str(index), span_processor)
+                self.assertTrue(span_processor.force_flush())
+
+            # the worker wakes up about 20 times during the outage
+            time.sleep(0.4)
+            outage.clear()
+
+            # without any new span the spilled batches are exported
+            for _ in range(50):
+                if len(spans_names_list) == 12:
+                    break
+                time.sleep(0.1)
+            self.assertEqual(span_processor.dropped_spans, 0)
+            span_processor.shutdown()
+
+        self.assertEqual(
+            sorted(spans_names_list), ["0"] * 4 + ["1"] * 4 + ["2"] * 4
+        )
+
+    def test_batch_span_processor_spill_overflow(self):
+        """Test that spans overflowing the queue are spilled in batches by the
+        worker thread instead of by the threads ending them"""
+        for queue_type in ("shared", "per_thread"):
+            with self.subTest(queue_type=queue_type):
+                spans_names_list = []
+                my_exporter = MySpanExporter(destination=spans_names_list)
+                with tempfile.TemporaryDirectory() as spill_directory:
+                    span_processor = export.BatchSpanProcessor(
+                        my_exporter,
+                        max_queue_size=4,
+                        max_export_batch_size=4,
+                        schedule_delay_millis=30000,
+                        queue_type=queue_type,
+                        spill_directory=spill_directory,
+                    )
+                    with mock.patch.object(
+                        span_processor._spill,
+                        "write",
+                        wraps=span_processor._spill.write,
+                    ) as write:
+                        with mock.patch.object(
+                            span_processor.condition, "notify"
+                        ):
+                            for _ in range(14):
+                                _create_start_and_end_span(
+                                    "foo", span_processor
+                                )
+                        write.assert_not_called()
+                        # the overflow buffer holds up to max_queue_size
+                        self.assertEqual(span_processor.dropped_spans, 6)
+                        self.assertTrue(span_processor.force_flush())
+                        self.assertTrue(span_processor.force_flush())
+                        self.assertEqual(
+                            [len(call[0][0]) for call in write.call_args_list],
+                            [4],
+                        )
+                    span_processor.shutdown()
+
+                self.assertEqual(spans_names_list, ["foo"] * 8)
+
+    def test_batch_span_processor_export_workers(self):
+        """Test that batches are exported in parallel and that force_flush
+        waits for all of them"""
+        spans_names_list = []
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+
+        class SlowSpanExporter(MySpanExporter):
+            def export(self, spans):
+                with lock:
+                    in_flight.append(None)
+                    max_in_flight.append(len(in_flight))
+                try:
+                    return super().export(spans)
+                finally:
+                    with lock:
+                        in_flight.pop()
+
+        my_exporter = SlowSpanExporter(
+            destination=spans_names_list,
+            max_export_batch_size=8,
+            export_timeout_millis=100,
+        )
+        span_processor = export.BatchSpanProcessor(
+            my_exporter,
+            max_queue_size=64,
+            max_export_batch_size=8,
+            max_export_workers=4,
+        )
+
+        for _ in range(64):
+            _create_start_and_end_span("foo", span_processor)
+
+        self.assertTrue(span_processor.force_flush())
+        self.assertEqual(len(spans_names_list), 64)
+        self.assertGreater(max(max_in_flight), 1)
+        self.assertLessEqual(max(max_in_flight), 4)
+        span_processor.shutdown()
+
+    @mock.patch.dict("os.environ", {OTEL_PYTHON_BSP_EXPORT_WORKERS: "3"})
+    def test_batch_span_processor_export_workers_shutdown(self):
+        spans_names_list = []
+
+        my_exporter = MySpanExporter(
+            destination=spans_names_list, export_timeout_millis=50
+        )
+        span_processor = export.BatchSpanProcessor(
+            my_exporter, max_export_batch_size=2
+        )
+        self.assertEqual(span_processor.max_export_workers, 3)
+
+        for _ in range(10):
+            _create_start_and_end_span("foo", span_processor)
+
+        span_processor.shutdown()
+        self.assertTrue(my_exporter.is_shutdown)
+        self.assertEqual(len(spans_names_list), 10)
+
+    @mock.patch.dict(
+        "os.environ", {OTEL_PYTHON_BSP_ADAPTIVE_BATCHING: "true"}
+    )
+    def test_batch_span_processor_adaptive_batching(self):
+        spans_names_list = []
+
+        my_exporter = MySpanExporter(
+            destination=spans_names_list, max_export_batch_size=64
+        )
+        span_processor = export.BatchSpanProcessor(
+            my_exporter,
+            max_queue_size=512,
+            max_export_batch_size=64,
+            schedule_delay_millis=50,
+        )
+        # pylint: disable=protected-access
+        self.assertIsNotNone(span_processor._batch_tuner)
+
+        for _ in range(512):
+            _create_start_and_end_span("foo", span_processor)
+
+        self.assertTrue(span_processor.force_flush())
+        self.assertEqual(len(spans_names_list), 512)
+        self.assertLessEqual(span_processor._export_batch_size, 64)
+        self.assertGreaterEqual(span_processor._export_batch_size, 8)
+        self.assertLessEqual(span_processor._schedule_delay_millis, 50)
+        self.assertGreaterEqual(span_processor._schedule_delay_millis, 5)
+        span_processor.shutdown()
+
+    def test_batch_span_processor_export_workers_adaptive_batching(self):
+        """Test that the tuner gets the duration of the exports run by the
+        export threads, not the time taken to hand the batches over"""
+        spans_names_list = []
+
+        class SlowSpanExporter(MySpanExporter):
+            def export(self, spans):
+                time.sleep(0.05)
+                return super().export(spans)
+
+        span_processor = export.BatchSpanProcessor(
+            SlowSpanExporter(destination=spans_names_list),
+            max_queue_size=64,
+            max_export_batch_size=8,
+            schedule_delay_millis=10,
+            max_export_workers=2,
+            adaptive_batching=True,
+        )
+        # pylint: disable=protected-access
+        with mock.patch.object(
+            span_processor._batch_tuner, "update"
+        ) as mock_update:
+            for _ in range(8):
+                _create_start_and_end_span("foo", span_processor)
+            for _ in range(100):
+                if mock_update.called:
+                    break
+                time.sleep(0.01)
+            mock_update.assert_called_once()
+            exported, duration, _ = mock_update.call_args[0]
+            self.assertEqual(exported, 8)
+            self.assertGreaterEqual(duration, 0.05)
+        span_processor.shutdown()
+        self.assertEqual(len(spans_names_list), 8)
+
+    @unittest.skipUnless(hasattr(os, "register_at_fork"), "requires fork")
+    def test_batch_span_processor_fork(self):
+        spans_names_list = []
+
+        my_exporter = MySpanExporter(destination=spans_names_list)
+        span_processor = export.BatchSpanProcessor(
+            my_exporter, schedule_delay_millis=30000
+        )
+        # queued in the parent, must not be exported by the child
+        _create_start_and_end_span("parent", span_processor)
+
+        def child(conn):
+            _create_start_and_end_span("child", span_processor)
+            flushed = span_processor.force_flush()
+            conn.send((flushed, spans_names_list))
+            conn.close()
+
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.get_context("fork").Process(
+            target=child, args=(child_conn,)
+        )
+        process.start()
+        self.assertEqual(parent_conn.recv(), (True, ["child"]))
+        process.join()
+
+        self.assertTrue(span_processor.force_flush())
+        self.assertListEqual(spans_names_list, ["parent"])
+        span_processor.shutdown()
+
+    def test_batch_span_processor_at_fork_reinit(self):
+        spans_names_list = []
+
+        my_exporter = MySpanExporter(destination=spans_names_list)
+        span_processor = export.BatchSpanProcessor(
+            my_exporter, schedule_delay_millis=30000
+        )
+        _create_start_and_end_span("foo", span_processor)
+        worker_thread = span_processor.worker_thread
+        condition = span_processor.condition
+
+        # pylint: disable=protected-access
+        span_processor._at_fork_reinit()
+        self.assertIsNone(span_processor.worker_thread)
+        self.assertEqual(len(span_processor.queue), 0)
+
+        _create_start_and_end_span("bar", span_processor)
+        self.assertIsNotNone(span_processor.worker_thread)
+        self.assertIsNot(span_processor.worker_thread, worker_thread)
+        self.assertTrue(span_processor.force_flush())
+        self.assertListEqual(spans_names_list, ["bar"])
+
+        span_processor.shutdown()
+        # the replaced worker thread stops once it sees the done flag
+        with condition:
+            condition.notify_all()
+        worker_thread.join()
+
     def test_batch_span_processor_not_sampled(self):
         tracer_provider = trace.TracerProvider(
             sampler=trace.sampling.ALWAYS_OFF
@@ -473,6 +904,91 @@ class TestBatchSpanProcessor(unittest.TestCase):
             max_export_batch_size=512,
         )
 
+        # unknown queue_type
+        self.assertRaises(
+            ValueError,
+            export.BatchSpanProcessor,
+            None,
+            queue_type="unknown",
+        )
+
+        # min_export_batch_size > max_export_batch_size
+        self.assertRaises(
+            ValueError,
+            export.BatchSpanProcessor,
+            None,
+            max_export_batch_size=64,
+            min_export_batch_size=128,
+        )
+
+        # zero min_schedule_delay_millis
+        self.assertRaises(
+            ValueError,
+            export.BatchSpanProcessor,
+            None,
+            min_schedule_delay_millis=0,
+        )
+
+        # zero max_export_workers
+        self.assertRaises(
+            ValueError,
+            export.BatchSpanProcessor,
+            None,
+            max_export_workers=0,
+        )
+        self.assertRaises(
+            ValueError,
+            export.BatchSpanProcessor,
+            None,
+            max_spill_bytes=0,
+        )
+
+
+class TestAdaptiveBatchTuner(unittest.TestCase):
+    def setUp(self):
+        # pylint: disable=protected-access
+        self.tuner = export._AdaptiveBatchTuner(
+            min_batch_size=16,
+            max_batch_size=128,
+            min_schedule_delay_millis=100,
+            max_schedule_delay_millis=1000,
+            max_queue_size=1024,
+        )
+
+    def test_starts_at_upper_bounds(self):
+        self.assertEqual(self.tuner.batch_size, 128)
+        self.assertEqual(self.tuner.schedule_delay_millis, 1000)
+
+    def test_backlog(self):
+        self.tuner.batch_size = 32
+        self.tuner.update(exported=32, duration=0.01, queued=64)
+        self.assertEqual(self.tuner.batch_size, 64)
+        self.assertEqual(self.tuner.schedule_delay_millis, 500)
+
+        for _ in range(10):
+            self.tuner.update(exported=128, duration=0.01, queued=600)
+        self.assertEqual(self.tuner.batch_size, 128)
+        self.assertEqual(self.tuner.schedule_delay_millis, 100)
+
+    def test_small_exports(self):
+        self.tuner.schedule_delay_millis = 100
+        self.tuner.update(exported=10, duration=0.01, queued=0)
+        self.assertEqual(self.tuner.batch_size, 128)
+        self.assertEqual(self.tuner.schedule_delay_millis, 150)
+
+        for _ in range(10):
+            self.tuner.update(exported=10, duration=0.01, queued=0)
+        self.assertEqual(self.tuner.schedule_delay_millis, 1000)
+
+    def test_slow_exports(self):
+        self.tuner.update(exported=128, duration=2, queued=0)
+        self.assertEqual(self.tuner.batch_size, 96)
+        self.assertEqual(self.tuner.schedule_delay_millis, 1000)
+
+        for _ in range(20):
+            self.tuner.update(exported=128, duration=2, queued=0)
+        self.assertEqual(self.tuner.batch_size, 16)
+
 
 class TestConsoleSpanExporter(unittest.TestCase):
     def test_export(self):  # pylint: disable=no-self-use
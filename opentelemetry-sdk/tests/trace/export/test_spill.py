@@ -0,0 +1,200 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from logging import WARNING
+
+from opentelemetry import trace as trace_api
+from opentelemetry.sdk import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace.export._spill import SpanSpill
+
+
+def _create_spans(names):
+    tracer_provider = trace.TracerProvider(
+        resource=Resource.create({"service.name": "spill", "hosts": ("a",)})
+    )
+    tracer = tracer_provider.get_tracer(__name__, "1.0")
+    link_context = trace_api.SpanContext(
+        trace_id=0x000000000000000000000000DEADBEEF,
+        span_id=0x00000000DEADBEF0,
+        is_remote=True,
+        trace_state=trace_api.TraceState([("k", "v")]),
+    )
+    spans = []
+    for name in names:
+        with tracer.start_as_current_span(
+            name,
+            kind=trace_api.SpanKind.CLIENT,
+            attributes={"int": 1, "float": 1.5, "list": ["a", "b"]},
+            links=[trace_api.Link(link_context, {"bool": True})],
+        ) as span:
+            span.add_event("event", {"str": "value"})
+            span.set_status(
+                trace_api.Status(trace_api.StatusCode.ERROR, "failed")
+            )
+        spans.append(span)
+    return spans
+
+
+class TestSpanSpill(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_write_read(self):
+        spans = _create_spans(["foo", "bar"])
+        spill = SpanSpill(self.directory, 1024 * 1024)
+        self.assertTrue(spill.is_empty())
+        self.assertTrue(spill.write(spans))
+        self.assertFalse(spill.is_empty())
+
+        read_spans, position = spill.read()
+        self.assertEqual(
+            [span.to_json() for span in read_spans],
+            [span.to_json() for span in spans],
+        )
+        self.assertIs(read_spans[0].resource, read_spans[1].resource)
+        self.assertEqual(read_spans[0].attributes["list"], ("a", "b"))
+
+        # not committed, the batch is read again
+        self.assertEqual(spill.read()[1], position)
+        spill.commit(position)
+        self.assertTrue(spill.is_empty())
+        self.assertIsNone(spill.read())
+        spill.close()
+
+    def test_recovery(self):
+        spill = SpanSpill(self.directory, 1024 * 1024)
+        spill.write(_create_spans(["foo"]))
+        spill.write(_create_spans(["bar"]))
+        spill.commit(spill.read()[1])
+        spill.close()
+
+        # a record cut short by a crash
+        (segment,) = [
+            name for name in os.listdir(self.directory) if "segment" in name
+        ]
+        with open(os.path.join(self.directory, segment), "ab") as file:
+            file.write(b"\x00\x00\x01\x00garbage")
+
+        with self.assertLogs(level=WARNING):
+            spill = SpanSpill(self.directory, 1024 * 1024)
+        spans, position = spill.read()
+        self.assertEqual([span.name for span in spans], ["bar"])
+        spill.commit(position)
+        self.assertIsNone(spill.read())
+
+        spill.write(_create_spans(["baz"]))
+        spans, _ = spill.read()
+        self.assertEqual([span.name for span in spans], ["baz"])
+        spill.close()
+
+    def test_max_bytes(self):
+        spans = _create_spans(["foo"])
+        spill = SpanSpill(self.directory, 1024 * 1024)
+        spill.write(spans)
+        record_size = spill.size
+        spill.close()
+
+        spill = SpanSpill(self.directory, record_size * 2)
+        self.assertTrue(spill.write(spans))
+        with self.assertLogs(level=WARNING):
+            self.assertFalse(spill.write(spans))
+        self.assertEqual(spill.dropped, 1)
+        self.assertEqual(spill.size, record_size * 2)
+        spill.close()
+
+    def test_write_flushed(self):
+        spill = SpanSpill(self.directory, 1024 * 1024)
+        spill.write(_create_spans(["foo"]))
+        (segment,) = [
+            name for name in os.listdir(self.directory) if "segment" in name
+        ]
+        self.assertEqual(
+            os.path.getsize(os.path.join(self.directory, segment)),
+            spill.size,
+        )
+        spill.close()
+
+    def test_max_attempts(self):
+        spill = SpanSpill(self.directory, 1024 * 1024, max_attempts=2)
+        spill.write(_create_spans(["foo", "bar"]))
+        spill.write(_create_spans(["baz"]))
+
+        spans, position = spill.read()
+        spill.fail(position, len(spans))
+        self.assertEqual(spill.read()[1], position)
+        with self.assertLogs(level=WARNING):
+            spill.fail(position, len(spans))
+        self.assertEqual(spill.dropped, 2)
+
+        # the failed batch no longer blocks the following one
+        spans, position = spill.read()
+        self.assertEqual([span.name for span in spans], ["baz"])
+        spill.fail(position, len(spans))
+        spill.commit(position)
+        self.assertIsNone(spill.read())
+        self.assertEqual(spill.dropped, 2)
+        spill.close()
+
+    def test_segments_removed(self):
+        spill = SpanSpill(self.directory, 1024 * 1024, max_segment_bytes=1)
+        for name in ("foo", "bar", "baz"):
+            spill.write(_create_spans([name]))
+        self.assertEqual(len(os.listdir(self.directory)), 3)
+
+        names = []
+        batch = spill.read()
+        while batch is not None:
+            spans, position = batch
+            names.extend(span.name for span in spans)
+            spill.commit(position)
+            batch = spill.read()
+        self.assertEqual(names, ["foo", "bar", "baz"])
+        # the cursor and the segment still being written
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+        spill.close()
+
+    def test_unexpected_files(self):
+        spill = SpanSpill(self.directory, 1024 * 1024)
+        spill.write(_create_spans(["foo"]))
+        spill.close()
+        (segment,) = [
+            name for name in os.listdir(self.directory) if "segment" in name
+        ]
+        for name in ("segment-foo.spill", "segment-1.spill"):
+            with open(os.path.join(self.directory, name), "wb") as file:
+                file.write(b"garbage")
+
+        with self.assertLogs(level=WARNING):
+            spill = SpanSpill(self.directory, 1024 * 1024)
+        spans, _ = spill.read()
+        self.assertEqual([span.name for span in spans], ["foo"])
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            sorted([segment, "segment-foo.spill", "segment-1.spill"]),
+        )
+        spill.close()
+
+    def test_invalid_max_bytes(self):
+        with self.assertRaises(ValueError):
+            SpanSpill(self.directory, 0)
+        with self.assertRaises(ValueError):
+            SpanSpill(self.directory, 1024, max_attempts=0)
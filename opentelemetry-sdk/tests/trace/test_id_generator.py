@@ -0,0 +1,69 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import multiprocessing
+import os
+import unittest
+
+from opentelemetry.sdk.trace.id_generator import (
+    FastRandomIdGenerator,
+    IdGenerator,
+)
+
+
+class TestFastRandomIdGenerator(unittest.TestCase):
+    def test_ids(self):
+        id_generator = FastRandomIdGenerator()
+        self.assertIsInstance(id_generator, IdGenerator)
+
+        span_ids = {id_generator.generate_span_id() for _ in range(1000)}
+        trace_ids = {id_generator.generate_trace_id() for _ in range(1000)}
+        self.assertEqual(len(span_ids), 1000)
+        self.assertEqual(len(trace_ids), 1000)
+        self.assertLess(max(span_ids), 1 << 64)
+        self.assertLess(max(trace_ids), 1 << 128)
+        # the upper 64 bits of trace ids are random as well
+        self.assertGreaterEqual(max(trace_ids), 1 << 64)
+
+    def test_independent_generators(self):
+        first = FastRandomIdGenerator()
+        second = FastRandomIdGenerator()
+        self.assertNotEqual(
+            [first.generate_span_id() for _ in range(10)],
+            [second.generate_span_id() for _ in range(10)],
+        )
+
+    @unittest.skipUnless(hasattr(os, "register_at_fork"), "requires fork")
+    def test_fork(self):
+        id_generator = FastRandomIdGenerator()
+
+        def generate_ids():
+            return (
+                id_generator.generate_span_id(),
+                id_generator.generate_trace_id(),
+            )
+
+        def child(conn):
+            conn.send(generate_ids())
+            conn.close()
+
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.get_context("fork").Process(
+            target=child, args=(child_conn,)
+        )
+        process.start()
+        child_ids = parent_conn.recv()
+        process.join()
+
+        self.assertNotEqual(child_ids, generate_ids())
@@ -132,6 +132,51 @@ class TestSampler(unittest.TestCase):
                 else:
                     self.assertIsNone(sample_result.trace_state)
 
+    def test_shared_results(self):
+        root_result = sampling.ALWAYS_OFF.should_sample(
+            None, 0xDEADBEF1, "sampling off", attributes={"key": "value"}
+        )
+        self.assertIs(
+            sampling.ALWAYS_OFF.should_sample(None, 0xDEADBEF2, "other"),
+            root_result,
+        )
+        self.assertIs(
+            sampling.TraceIdRatioBased(0.0).should_sample(
+                None, 0xDEADBEF1, "sampling off"
+            ),
+            root_result,
+        )
+        self.assertEqual(root_result.attributes, {})
+        self.assertIsNone(root_result.trace_state)
+
+        context = self._create_parent(TO_SAMPLED, False)
+        self.assertIs(
+            sampling.ALWAYS_ON.should_sample(context, 0xDEADBEF1, "on"),
+            sampling.ALWAYS_ON.should_sample(context, 0xDEADBEF1, "on"),
+        )
+        sampled_result = sampling.ALWAYS_ON.should_sample(
+            context, 0xDEADBEF1, "on", attributes={"key": "value"}
+        )
+        self.assertEqual(sampled_result.attributes, {"key": "value"})
+
+    def test_shared_results_read_only(self):
+        result = sampling.ALWAYS_ON.should_sample(None, 0xDEADBEF1, "on")
+        with self.assertRaises(AttributeError):
+            result.decision = sampling.Decision.DROP
+        with self.assertRaises(AttributeError):
+            result.trace_state = trace.TraceState([("key", "value")])
+        with self.assertRaises(AttributeError):
+            del result.attributes
+        with self.assertRaises(TypeError):
+            result.attributes["key"] = "value"
+
+        next_result = sampling.ALWAYS_ON.should_sample(None, 0xDEADBEF2, "on")
+        self.assertIs(
+            next_result.decision, sampling.Decision.RECORD_AND_SAMPLE
+        )
+        self.assertEqual(next_result.attributes, {})
+        self.assertIsNone(next_result.trace_state)
+
     def test_default_on(self):
         trace_state = trace.TraceState([("key", "value")])
         context = self._create_parent(TO_DEFAULT, False, trace_state)
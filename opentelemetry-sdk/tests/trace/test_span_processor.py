@@ -266,6 +266,22 @@ class TestConcurrentMultiSpanProcessor(
     ) -> trace.ConcurrentMultiSpanProcessor:
         return trace.ConcurrentMultiSpanProcessor(3)
 
+    def test_at_fork_reinit(self):
+        multi_processor = trace.ConcurrentMultiSpanProcessor(3)
+        mock_processor = mock.Mock(spec=trace.SpanProcessor)
+        multi_processor.add_span_processor(mock_processor)
+        # pylint: disable=protected-access
+        executor = multi_processor._executor
+
+        multi_processor._at_fork_reinit()
+
+        self.assertIsNot(multi_processor._executor, executor)
+        span = self.create_default_span()
+        multi_processor.on_end(span)
+        mock_processor.on_end.assert_called_once_with(span)
+        executor.shutdown()
+        multi_processor.shutdown()
+
     def test_force_flush_late_by_timeout(self):
         multi_processor = trace.ConcurrentMultiSpanProcessor(5)
         wait_event = Event()
@@ -15,6 +15,7 @@
 # pylint: disable=too-many-lines
 import shutil
 import subprocess
+import threading
 import unittest
 from importlib import reload
 from logging import ERROR, WARNING
@@ -124,6 +125,32 @@ tracer_provider.add_span_processor(mock_processor)
         out = run_general_code(False, False)
         self.assertTrue(out.startswith(b"0"))
 
+    def test_get_tracer_cached(self):
+        tracer_provider = trace.TracerProvider()
+        tracer = tracer_provider.get_tracer("module", "1.0")
+        self.assertIs(tracer_provider.get_tracer("module", "1.0"), tracer)
+        self.assertIsNot(tracer_provider.get_tracer("module", "2.0"), tracer)
+        self.assertIsNot(tracer_provider.get_tracer("other", "1.0"), tracer)
+        self.assertIsNot(
+            trace.TracerProvider().get_tracer("module", "1.0"), tracer
+        )
+
+    def test_get_tracer_cached_provider_changes(self):
+        tracer_provider = trace.TracerProvider()
+        tracer = tracer_provider.get_tracer("module", "1.0")
+
+        tracer_provider.sampler = sampling.ALWAYS_OFF
+        sampler_tracer = tracer_provider.get_tracer("module", "1.0")
+        self.assertIsNot(sampler_tracer, tracer)
+        self.assertIs(sampler_tracer.sampler, sampling.ALWAYS_OFF)
+
+        id_generator = RandomIdGenerator()
+        tracer_provider.id_generator = id_generator
+        id_generator_tracer = tracer_provider.get_tracer("module", "1.0")
+        self.assertIsNot(id_generator_tracer, sampler_tracer)
+        self.assertIs(id_generator_tracer.id_generator, id_generator)
+        self.assertIs(id_generator_tracer.sampler, sampling.ALWAYS_OFF)
+
     def test_tracer_provider_accepts_concurrent_multi_span_processor(self):
         span_processor = trace.ConcurrentMultiSpanProcessor(2)
         tracer_provider = trace.TracerProvider(
@@ -914,6 +941,81 @@ class TestSpan(unittest.TestCase):
             root.set_status(new_status)
         self.assertEqual(root.status.status_code, trace_api.StatusCode.UNSET)
 
+    def test_containers_created_on_first_write(self):
+        # pylint: disable=protected-access
+        first = self.tracer.start_span("first")
+        second = self.tracer.start_span("second")
+        self.assertIs(first._attributes, second._attributes)
+        self.assertIs(first._events, second._events)
+        self.assertIs(first._links, second._links)
+
+        first.set_attribute("key", "value")
+        first.add_event("event")
+        self.assertEqual(first.attributes, {"key": "value"})
+        self.assertEqual(len(first.events), 1)
+        self.assertEqual(len(second.attributes), 0)
+        self.assertEqual(len(second.events), 0)
+        self.assertIsNot(first._attributes, second._attributes)
+
+        tracer = new_tracer(
+            span_limits=trace.SpanLimits(max_attributes=0, max_events=0)
+        )
+        span = tracer.start_span("limited")
+        span.set_attribute("key", "value")
+        span.add_event("event")
+        self.assertEqual(span._attributes.dropped, 1)
+        self.assertEqual(span._events.dropped, 1)
+
+    def test_concurrent_writes(self):
+        tracer = new_tracer(
+            span_limits=trace.SpanLimits(max_attributes=10, max_events=10)
+        )
+        span = tracer.start_span("root")
+
+        def write(thread_index):
+            for index in range(100):
+                span.set_attribute("key{}.{}".format(thread_index, index), 1)
+                span.add_event("event{}.{}".format(thread_index, index))
+
+        threads = [
+            threading.Thread(target=write, args=(index,)) for index in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(span.attributes), 10)
+        self.assertEqual(span.dropped_attributes, 790)
+        self.assertEqual(len(span.events), 10)
+        self.assertEqual(span.dropped_events, 790)
+        # the containers of the span are guarded by the span lock only
+        self.assertIsInstance(span._attributes, trace._SpanAttributes)
+        self.assertIsInstance(span._events, trace._SpanList)
+
+    def test_ended_span_is_frozen(self):
+        """The ended span is passed to the span processors as is"""
+        tracer_provider = trace.TracerProvider()
+        span_processor = mock.Mock(spec=trace.SpanProcessor)
+        tracer_provider.add_span_processor(span_processor)
+        tracer = tracer_provider.get_tracer(__name__)
+
+        root = tracer.start_span("root", attributes={"key": "value"})
+        root.add_event("event")
+        root.end()
+
+        span_processor.on_end.assert_called_once_with(root)
+        self.assertIs(root.attributes, root.attributes)
+        self.assertEqual(root.attributes, {"key": "value"})
+        self.assertEqual(len(root.events), 1)
+
+        with self.assertRaisesRegex(TypeError, "immutable"):
+            root.attributes["key"] = "other value"
+        with self.assertRaisesRegex(TypeError, "immutable"):
+            root.events.append(trace.Event("other event"))
+        with self.assertRaisesRegex(TypeError, "immutable"):
+            root.links.append(trace_api.Link(root.context))
+
     def test_error_status(self):
         def error_status_test(context):
             with self.assertRaises(AssertionError):
@@ -1159,6 +1261,94 @@ class MySpanProcessor(trace.SpanProcessor):
         self.span_list.append(span_event_end_fmt(self.name, span.name))
 
 
+class TestAttributeSchema(unittest.TestCase):
+    def setUp(self):
+        self.tracer = new_tracer()
+        self.schema = self.tracer.compile_attributes(
+            {
+                "http.method": str,
+                "http.status_code": int,
+                "ratio": (int, float),
+            }
+        )
+
+    def test_schema(self):
+        self.assertIsInstance(self.schema, trace_api.AttributeSchema)
+        self.assertEqual(
+            self.schema.keys, ("http.method", "http.status_code", "ratio")
+        )
+
+    def test_invalid_schema(self):
+        with self.assertRaises(ValueError):
+            self.tracer.compile_attributes({"": str})
+        with self.assertRaises(TypeError):
+            self.tracer.compile_attributes({"key": dict})
+
+    def test_start_span(self):
+        span = self.schema.start_span(
+            "root", ("GET", 200, 0.5), kind=trace_api.SpanKind.SERVER
+        )
+        self.assertIsInstance(span, trace.Span)
+        self.assertEqual(span.kind, trace_api.SpanKind.SERVER)
+        self.assertEqual(
+            span.attributes,
+            {"http.method": "GET", "http.status_code": 200, "ratio": 0.5},
+        )
+        self.assertEqual(
+            self.schema.keys, ("http.method", "http.status_code", "ratio")
+        )
+
+        with self.assertRaises(ValueError):
+            self.schema.start_span("root", ("GET", 200))
+
+    def test_undeclared_types(self):
+        span = self.schema.start_span("root", (None, [1, 2], 1))
+        self.assertEqual(
+            span.attributes, {"http.status_code": (1, 2), "ratio": 1}
+        )
+
+        with self.assertLogs(level=WARNING):
+            span = self.schema.start_span("root", ("GET", {}, 1))
+        self.assertEqual(span.attributes, {"http.method": "GET", "ratio": 1})
+
+    def test_limits(self):
+        tracer = new_tracer(span_limits=trace.SpanLimits(max_attributes=2))
+        schema = tracer.compile_attributes({"a": int, "b": int, "c": int})
+        span = schema.start_span("root", (1, 2, 3))
+        self.assertEqual(span.attributes, {"b": 2, "c": 3})
+        self.assertEqual(span.dropped_attributes, 1)
+
+    def test_sampler_attributes(self):
+        sampler = mock.Mock(spec=sampling.Sampler)
+        sampler.should_sample.return_value = sampling.SamplingResult(
+            sampling.Decision.RECORD_AND_SAMPLE,
+            {"sampler": "on", "bad": {}},
+        )
+        tracer = trace.TracerProvider(sampler=sampler).get_tracer(__name__)
+        schema = tracer.compile_attributes({"key": str})
+        with self.assertLogs(level=WARNING):
+            span = schema.start_span("root", ("value",))
+        # attributes changed by the sampler are validated
+        self.assertEqual(span.attributes, {"sampler": "on"})
+
+    def test_set_attributes(self):
+        span = self.tracer.start_span("root")
+        self.schema.set_attributes(span, ("GET", 200, 1))
+        self.schema.set_attributes(span, ("POST", None, 2))
+        self.assertEqual(
+            span.attributes,
+            {"http.method": "POST", "http.status_code": 200, "ratio": 2},
+        )
+
+        span.end()
+        with self.assertLogs(level=WARNING):
+            self.schema.set_attributes(span, ("PUT", 200, 1))
+        self.assertEqual(span.attributes["http.method"], "POST")
+
+        non_recording_span = trace_api.NonRecordingSpan(span.context)
+        self.schema.set_attributes(non_recording_span, ("GET", 200, 1))
+
+
 class TestSpanProcessor(unittest.TestCase):
     def test_span_processor(self):
         tracer_provider = trace.TracerProvider()
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import typing
+from functools import lru_cache
 from re import compile as re_compile
 
 from deprecated import deprecated
@@ -35,6 +36,12 @@ class B3MultiFormat(TextMapPropagator):
 
     See: https://github.com/openzipkin/b3-propagation
          https://github.com/openzipkin/b3-propagation#multiple-headers
+
+    Args:
+        cache_size: The number of distinct headers whose extracted
+            `opentelemetry.trace.SpanContext` is kept in a least recently
+            used cache, to skip parsing headers that are seen repeatedly.
+            Disabled by default.
     """
 
     SINGLE_HEADER_KEY = "b3"
@@ -47,6 +54,13 @@ class B3MultiFormat(TextMapPropagator):
     _trace_id_regex = re_compile(r"[\da-fA-F]{16}|[\da-fA-F]{32}")
     _span_id_regex = re_compile(r"[\da-fA-F]{16}")
 
+    def __init__(self, cache_size: int = 0) -> None:
+        if cache_size > 0:
+            # span contexts are immutable, so they can be shared
+            self._get_span_context = lru_cache(maxsize=cache_size)(
+                self._get_span_context
+            )
+
     def extract(
         self,
         carrier: CarrierT,
@@ -55,14 +69,35 @@ class B3MultiFormat(TextMapPropagator):
     ) -> Context:
         if context is None:
             context = Context()
-        trace_id = trace.INVALID_TRACE_ID
-        span_id = trace.INVALID_SPAN_ID
-        sampled = "0"
-        flags = None
 
         single_header = _extract_first_element(
             getter.get(carrier, self.SINGLE_HEADER_KEY)
         )
+        if single_header:
+            span_context = self._get_span_context(single_header)
+        else:
+            span_context = self._get_span_context(
+                None,
+                _extract_first_element(getter.get(carrier, self.TRACE_ID_KEY)),
+                _extract_first_element(getter.get(carrier, self.SPAN_ID_KEY)),
+                _extract_first_element(getter.get(carrier, self.SAMPLED_KEY)),
+                _extract_first_element(getter.get(carrier, self.FLAGS_KEY)),
+            )
+        if span_context is None:
+            return context
+
+        return trace.set_span_in_context(
+            trace.NonRecordingSpan(span_context), context
+        )
+
+    def _get_span_context(
+        self,
+        single_header: typing.Optional[str],
+        trace_id: typing.Optional[str] = None,
+        span_id: typing.Optional[str] = None,
+        sampled: typing.Optional[str] = None,
+        flags: typing.Optional[str] = None,
+    ) -> typing.Optional[trace.SpanContext]:
         if single_header:
             # The b3 spec calls for the sampling state to be
             # "deferred", which is unspecified. This concept does not
@@ -79,33 +114,16 @@ class B3MultiFormat(TextMapPropagator):
             elif len(fields) == 4:
                 trace_id, span_id, sampled, _ = fields
         else:
-            trace_id = (
-                _extract_first_element(getter.get(carrier, self.TRACE_ID_KEY))
-                or trace_id
-            )
-            span_id = (
-                _extract_first_element(getter.get(carrier, self.SPAN_ID_KEY))
-                or span_id
-            )
-            sampled = (
-                _extract_first_element(getter.get(carrier, self.SAMPLED_KEY))
-                or sampled
-            )
-            flags = (
-                _extract_first_element(getter.get(carrier, self.FLAGS_KEY))
-                or flags
-            )
+            sampled = sampled or "0"
 
         if (
-            trace_id == trace.INVALID_TRACE_ID
-            or span_id == trace.INVALID_SPAN_ID
+            not trace_id
+            or not span_id
             or self._trace_id_regex.fullmatch(trace_id) is None
             or self._span_id_regex.fullmatch(span_id) is None
         ):
-            return context
+            return None
 
-        trace_id = int(trace_id, 16)
-        span_id = int(span_id, 16)
         options = 0
         # The b3 spec provides no defined behavior for both sample and
         # flag values set. Since the setting of at least one implies
@@ -114,18 +132,13 @@ class B3MultiFormat(TextMapPropagator):
         if sampled in self._SAMPLE_PROPAGATE_VALUES or flags == "1":
             options |= trace.TraceFlags.SAMPLED
 
-        return trace.set_span_in_context(
-            trace.NonRecordingSpan(
-                trace.SpanContext(
-                    # trace an span ids are encoded in hex, so must be converted
-                    trace_id=trace_id,
-                    span_id=span_id,
-                    is_remote=True,
-                    trace_flags=trace.TraceFlags(options),
-                    trace_state=trace.TraceState(),
-                )
-            ),
-            context,
+        return trace.SpanContext(
+            # trace an span ids are encoded in hex, so must be converted
+            trace_id=int(trace_id, 16),
+            span_id=int(span_id, 16),
+            is_remote=True,
+            trace_flags=trace.TraceFlags(options),
+            trace_state=trace.TraceState(),
         )
 
     def inject(
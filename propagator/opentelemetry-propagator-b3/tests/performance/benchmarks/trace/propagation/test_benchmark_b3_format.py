@@ -27,6 +27,18 @@ def test_extract_single_header(benchmark):
     )
 
 
+def test_extract_multi_header_cached(benchmark):
+    propagator = b3_format.B3MultiFormat(cache_size=128)
+    benchmark(
+        propagator.extract,
+        {
+            propagator.TRACE_ID_KEY: "bdb5b63237ed38aea578af665aa5aa60",
+            propagator.SPAN_ID_KEY: "c32d953d73ad2251",
+            propagator.SAMPLED_KEY: "1",
+        },
+    )
+
+
 def test_inject_empty_context(benchmark):
     tracer = trace.TracerProvider().get_tracer("sdk_tracer_provider")
     with tracer.start_as_current_span("Root Span"):
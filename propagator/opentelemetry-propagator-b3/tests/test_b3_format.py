@@ -443,6 +443,43 @@ class AbstractB3FormatTestCase:
 
         self.assertEqual(propagator.fields, inject_fields)
 
+    def test_extract_cached(self):
+        """Test repeated headers are parsed once when the cache is enabled."""
+        propagator = type(self.get_propagator())(cache_size=2)
+
+        def get_span_context(carrier):
+            return trace_api.get_current_span(
+                propagator.extract(carrier)
+            ).get_span_context()
+
+        for carrier in (
+            {
+                propagator.TRACE_ID_KEY: self.serialized_trace_id,
+                propagator.SPAN_ID_KEY: self.serialized_span_id,
+                propagator.SAMPLED_KEY: "1",
+            },
+            {
+                propagator.SINGLE_HEADER_KEY: "{}-{}-1".format(
+                    self.serialized_trace_id, self.serialized_span_id
+                )
+            },
+        ):
+            with self.subTest(carrier=carrier):
+                span_context = get_span_context(carrier)
+                self.assertTrue(span_context.trace_flags.sampled)
+                self.assertIs(get_span_context(dict(carrier)), span_context)
+
+        self.assertEqual(
+            get_span_context(
+                {
+                    propagator.TRACE_ID_KEY: self.serialized_trace_id,
+                    propagator.SPAN_ID_KEY: self.serialized_span_id,
+                    propagator.SAMPLED_KEY: "0",
+                }
+            ).trace_flags,
+            trace_api.TraceFlags.DEFAULT,
+        )
+
     def test_extract_none_context(self):
         """Given no trace ID, do not modify context"""
         old_ctx = None
@@ -14,6 +14,7 @@
 
 import typing
 import urllib.parse
+from functools import lru_cache
 
 import opentelemetry.trace as trace
 from opentelemetry import baggage
@@ -33,12 +34,25 @@ class JaegerPropagator(TextMapPropagator):
     """Propagator for the Jaeger format.
 
     See: https://www.jaegertracing.io/docs/1.19/client-libraries/#propagation-format
+
+    Args:
+        cache_size: The number of distinct headers whose extracted
+            `opentelemetry.trace.SpanContext` is kept in a least recently
+            used cache, to skip parsing headers that are seen repeatedly.
+            Disabled by default.
     """
 
     TRACE_ID_KEY = "uber-trace-id"
     BAGGAGE_PREFIX = "uberctx-"
     DEBUG_FLAG = 0x02
 
+    def __init__(self, cache_size: int = 0) -> None:
+        if cache_size > 0:
+            # span contexts are immutable, so they can be shared
+            self._get_span_context = lru_cache(maxsize=cache_size)(
+                self._get_span_context
+            )
+
     def extract(
         self,
         carrier: CarrierT,
@@ -54,22 +68,30 @@ class JaegerPropagator(TextMapPropagator):
 
         context = self._extract_baggage(getter, carrier, context)
 
+        span_context = self._get_span_context(_extract_first_element(header))
+        if span_context is None:
+            return context
+
+        return trace.set_span_in_context(
+            trace.NonRecordingSpan(span_context), context
+        )
+
+    def _get_span_context(
+        self, header: typing.Optional[str]
+    ) -> typing.Optional[trace.SpanContext]:
         trace_id, span_id, flags = _parse_trace_id_header(header)
         if (
             trace_id == trace.INVALID_TRACE_ID
             or span_id == trace.INVALID_SPAN_ID
         ):
-            return context
+            return None
 
-        span = trace.NonRecordingSpan(
-            trace.SpanContext(
-                trace_id=trace_id,
-                span_id=span_id,
-                is_remote=True,
-                trace_flags=trace.TraceFlags(flags & trace.TraceFlags.SAMPLED),
-            )
+        return trace.SpanContext(
+            trace_id=trace_id,
+            span_id=span_id,
+            is_remote=True,
+            trace_flags=trace.TraceFlags(flags & trace.TraceFlags.SAMPLED),
         )
-        return trace.set_span_in_context(span, context)
 
     def inject(
         self,
@@ -145,11 +167,10 @@ def _extract_first_element(
 
 
 def _parse_trace_id_header(
-    items: typing.Iterable[CarrierT],
+    header: typing.Optional[str],
 ) -> typing.Tuple[int]:
     invalid_header_result = (trace.INVALID_TRACE_ID, trace.INVALID_SPAN_ID, 0)
 
-    header = _extract_first_element(items)
     if header is None:
         return invalid_header_result
 
@@ -77,6 +77,30 @@ class TestJaegerPropagator(unittest.TestCase):
         self.assertEqual(span_context.trace_id, self.trace_id)
         self.assertEqual(span_context.span_id, self.span_id)
 
+    def test_extract_cached(self):
+        propagator = jaeger.JaegerPropagator(cache_size=2)
+
+        def get_span_context(carrier):
+            return trace_api.get_current_span(
+                propagator.extract(carrier)
+            ).get_span_context()
+
+        carrier = {FORMAT.TRACE_ID_KEY: self.serialized_uber_trace_id}
+        span_context = get_span_context(carrier)
+        self.assertEqual(span_context.trace_id, self.trace_id)
+        self.assertIs(get_span_context(dict(carrier)), span_context)
+        # baggage is not cached
+        ctx = propagator.extract(
+            {
+                FORMAT.TRACE_ID_KEY: self.serialized_uber_trace_id,
+                FORMAT.BAGGAGE_PREFIX + "key": "value",
+            }
+        )
+        self.assertEqual(baggage.get_baggage("key", ctx), "value")
+        self.assertIs(
+            trace_api.get_current_span(ctx).get_span_context(), span_context
+        )
+
     def test_missing_carrier(self):
         old_carrier = {}
         ctx = FORMAT.extract(old_carrier)
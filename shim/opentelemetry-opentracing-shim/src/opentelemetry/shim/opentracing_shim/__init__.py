@@ -117,10 +117,11 @@ from opentelemetry.trace import SpanContext as OtelSpanContext
 from opentelemetry.trace import Tracer as OtelTracer
 from opentelemetry.trace import (
     TracerProvider,
+    activate_span,
     get_current_span,
     set_span_in_context,
-    use_span,
 )
+from opentelemetry.trace.status import Status, StatusCode
 from opentelemetry.util.types import Attributes
 
 ValueT = TypeVar("ValueT", int, float, bool, str)
@@ -350,14 +351,29 @@ class ScopeShim(Scope):
             by :meth:`from_context_manager` to store the context manager as
             an attribute so that it can later be closed by calling its
             ``__exit__()`` method. Defaults to `None`.
+        finish_on_close: Whether closing this :class:`ScopeShim` ends its
+            span, when it is not created from a context manager. Defaults to
+            `True`.
     """
 
     def __init__(
-        self, manager: "ScopeManagerShim", span: SpanShim, span_cm=None
+        self,
+        manager: "ScopeManagerShim",
+        span: SpanShim,
+        span_cm=None,
+        finish_on_close: bool = True,
     ):
         super().__init__(manager, span)
         self._span_cm = span_cm
-        self._token = attach(set_value(_SHIM_KEY, self))
+        self._finish_on_close = finish_on_close
+        if span_cm is not None:
+            # the context manager made the span current already
+            self._token = attach(set_value(_SHIM_KEY, self))
+        else:
+            # the span and this scope are made current with a single token
+            self._token = activate_span(
+                span.unwrap(), set_value(_SHIM_KEY, self)
+            )
 
     # TODO: Change type of `manager` argument to `opentracing.ScopeManager`? We
     # need to get rid of `manager.tracer` for this.
@@ -428,8 +444,21 @@ class ScopeShim(Scope):
         detach(self._token)
         if self._span_cm is not None:
             self._span_cm.__exit__(exc_type, exc_val, exc_tb)
-        else:
-            self._span.unwrap().end()
+            return
+        otel_span = self._span.unwrap()
+        if isinstance(exc_val, Exception) and otel_span.is_recording():
+            # reported like `opentelemetry.trace.use_span` does
+            otel_span.record_exception(exc_val)
+            otel_span.set_status(
+                Status(
+                    status_code=StatusCode.ERROR,
+                    description="{}: {}".format(
+                        type(exc_val).__name__, exc_val
+                    ),
+                )
+            )
+        if self._finish_on_close:
+            otel_span.end()
 
 
 class ScopeManagerShim(ScopeManager):
@@ -469,8 +498,7 @@ class ScopeManagerShim(ScopeManager):
             A :class:`ScopeShim` representing the activated span.
         """
 
-        span_cm = use_span(span.unwrap(), end_on_exit=finish_on_close)
-        return ScopeShim.from_context_manager(self, span_cm=span_cm)
+        return ScopeShim(self, span, finish_on_close=finish_on_close)
 
     @property
     def active(self) -> "ScopeShim":
@@ -18,7 +18,7 @@
 import time
 import traceback
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import opentracing
 
@@ -26,6 +26,7 @@ from opentelemetry import trace
 from opentelemetry.propagate import get_global_textmap, set_global_textmap
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.shim.opentracing_shim import (
+    ScopeShim,
     SpanContextShim,
     SpanShim,
     create_tracer,
@@ -178,6 +179,60 @@ class TestShim(TestCase):
         # Verify no span is active.
         self.assertIsNone(self.shim.active_span)
 
+    def test_activate_single_token(self):
+        """Test the span and the scope are activated with a single token."""
+
+        span = self.shim.start_span("TestSpan6")
+        with patch(
+            "opentelemetry.shim.opentracing_shim.activate_span",
+            wraps=trace.activate_span,
+        ) as mock_activate_span:
+            with self.shim.scope_manager.activate(
+                span, finish_on_close=True
+            ) as scope:
+                self.assertIs(trace.get_current_span(), span.unwrap())
+                self.assertIs(self.shim.scope_manager.active, scope)
+
+        mock_activate_span.assert_called_once()
+        self.assertIsNone(self.shim.active_span)
+
+    def test_from_context_manager_single_activation(self):
+        """Test a scope created from a context manager doesn't activate its
+        span again."""
+
+        otel_span = self.shim.unwrap().start_span("TestSpan6")
+        with patch(
+            "opentelemetry.shim.opentracing_shim.activate_span",
+            wraps=trace.activate_span,
+        ) as mock_activate_span:
+            scope = ScopeShim.from_context_manager(
+                self.shim.scope_manager,
+                span_cm=trace.use_span(otel_span, end_on_exit=True),
+            )
+            self.assertIs(trace.get_current_span(), otel_span)
+            self.assertIs(self.shim.scope_manager.active, scope)
+            scope.close()
+
+        mock_activate_span.assert_not_called()
+        self.assertIsNotNone(otel_span.end_time)
+        self.assertIsNone(self.shim.active_span)
+
+    def test_activate_exception(self):
+        """Test exceptions are recorded on spans activated by
+        `activate()`."""
+
+        span = self.shim.start_span("TestSpan6")
+        with self.assertRaises(ValueError):
+            with self.shim.scope_manager.activate(span, finish_on_close=False):
+                raise ValueError("error")
+
+        self.assertIsNone(span.unwrap().end_time)
+        self.assertEqual(
+            span.unwrap().status.status_code, trace.StatusCode.ERROR
+        )
+        self.assertEqual(span.unwrap().events[0].name, "exception")
+        span.finish()
+
     def test_start_active_span_finish_on_close(self):
         """Test `finish_on_close` argument of `start_active_span()`."""
 